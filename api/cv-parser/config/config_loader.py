@@ -27,21 +27,30 @@ class ConfigLoader:
         Returns:
             Dictionary containing configuration data
         """
-        if config_name in self._cache:
-            return self._cache[config_name]
-            
         config_file = self.config_dir / f"{config_name}.json"
         
         try:
+            mtime = self.config_mtime(config_name)
+            cached = self._cache.get(config_name)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+            
             with open(config_file, 'r', encoding='utf-8') as f:
                 config_data = json.load(f)
-                self._cache[config_name] = config_data
+                self._cache[config_name] = (mtime, config_data)
                 return config_data
         except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file not found: {config_file}")
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in config file {config_file}: {e}")
     
+    def config_mtime(self, config_name: str) -> int:
+        """
+        Get the modification time of a config file, used as a cache key so
+        data derived from a config is rebuilt only when the file changes
+        """
+        return os.stat(self.config_dir / f"{config_name}.json").st_mtime_ns
+    
     def get_industry_keywords(self) -> Dict[str, Dict[str, List[str]]]:
         """Get industry-specific keywords"""
         return self.load_config('industry_keywords')
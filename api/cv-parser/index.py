@@ -5,88 +5,41 @@ Hosted on Vercel as serverless function
 Updated: Fix FITZ_AVAILABLE build error - Aug 14, 2025
 """
 
-import json
 import os
 import requests
 import re
 import io
 from typing import Dict, Any, List, Tuple, Optional
 import logging
-from collections import Counter
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
 from urllib.parse import urlparse
 import math
+import heapq
+import hashlib
+import copy
 import uuid
-import gc
+import unicodedata
+import random
+import time
 import sys
-from datetime import datetime
+import threading
+import atexit
+from datetime import datetime, timezone
 
 # Configure logging first
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Memory management utilities
-def cleanup_memory():
-    """Force garbage collection to free memory"""
-    try:
-        # Force multiple garbage collection passes
-        for _ in range(3):
-            collected = gc.collect()
-            if collected == 0:
-                break
-        logger.debug(f"🧹 CV parser memory cleanup - collected {collected} objects")
-    except Exception as e:
-        logger.warning(f"Memory cleanup failed: {e}")
-
-def get_memory_usage():
-    """Get current memory usage info if available"""
-    try:
-        import psutil
-        process = psutil.Process(os.getpid())
-        memory_mb = round(process.memory_info().rss / 1024 / 1024, 2)
-        return memory_mb
-    except ImportError:
-        return None
-
-def extract_tables_with_pdfplumber(file_content: bytes) -> str:
-    """Extract complex tables using pdfplumber when needed"""
-    try:
-        import pdfplumber
-        import io
-        
-        pdf_file = io.BytesIO(file_content)
-        table_texts = []
-        
-        with pdfplumber.open(pdf_file) as pdf:
-            for page_num, page in enumerate(pdf.pages):
-                tables = page.extract_tables()
-                
-                if tables:
-                    logger.info(f"📊 Page {page_num + 1}: Found {len(tables)} tables")
-                    
-                    for table_num, table in enumerate(tables):
-                        # Convert table to text format
-                        table_text = f"\n--- Table {table_num + 1} from Page {page_num + 1} ---\n"
-                        
-                        for row in table:
-                            if row and any(cell for cell in row if cell):
-                                # Clean and join cells
-                                clean_row = [str(cell).strip() if cell else '' for cell in row]
-                                table_text += ' | '.join(clean_row) + '\n'
-                        
-                        table_texts.append(table_text)
-        
-        result = '\n'.join(table_texts)
-        if result:
-            logger.info(f"✅ Table extraction complete: {len(result)} characters")
-        
-        return result
-        
-    except ImportError:
-        logger.warning("⚠️ pdfplumber not available - skipping table extraction")
-        return ""
-    except Exception as e:
-        logger.warning(f"⚠️ Table extraction failed: {e}")
-        return ""
+# Fewer characters than this on the first page means a scanned/image-only PDF
+SCANNED_PDF_MIN_CHARS = 50
+# Resumes run 1-3 pages - stop reading oversized or malformed PDFs at these limits
+MAX_PDF_PAGES = 10
+MAX_PDF_CHARS = 200_000
 
 def extract_pdf_text_clean(file_content: bytes) -> str:
     """Clean PDF extraction using only PyMuPDF (table extraction disabled)"""
@@ -105,26 +58,39 @@ def extract_pdf_text_clean(file_content: bytes) -> str:
             pdf_document.close()
             raise TextExtractionError("PDF has no pages")
         
-        # Check first page for text
-        first_page_text = pdf_document[0].get_text().strip()
-        if not first_page_text or len(first_page_text) < 50:
+        # Check first page for text - the top half usually carries the name and contact
+        # block, so probe that first and only fall back to the whole page if it looks empty
+        first_page = pdf_document[0]
+        page_rect = first_page.rect
+        probe_rect = fitz.Rect(page_rect.x0, page_rect.y0, page_rect.x1, page_rect.y0 + page_rect.height / 2)
+        first_page_text = first_page.get_text("text", clip=probe_rect, flags=PDF_TEXT_FLAGS).strip()
+        if len(first_page_text) < SCANNED_PDF_MIN_CHARS:
+            first_page_text = first_page.get_text("text", flags=PDF_TEXT_FLAGS).strip()
+        if len(first_page_text) < SCANNED_PDF_MIN_CHARS:
             pdf_document.close()
             raise TextExtractionError("Scanned or image-based resumes are not supported. Please upload a text-based PDF.")
         
-        # Extract text from all pages using PyMuPDF only
-        text_parts = []
+        # Extract text from up to MAX_PDF_PAGES pages using PyMuPDF only - lazily, so the
+        # character cap stops the page reads too
+        page_count = min(pdf_document.page_count, MAX_PDF_PAGES)
+        truncated = page_count < pdf_document.page_count
+        page_texts = (pdf_document[page_num].get_text("text", flags=PDF_TEXT_FLAGS)
+                      for page_num in range(page_count))
         
-        for page_num in range(pdf_document.page_count):
-            page = pdf_document[page_num]
-            page_text = page.get_text()
-            
+        text_parts = []
+        total_chars = 0
+        for page_num, page_text in enumerate(page_texts):
             if page_text and page_text.strip():
                 text_parts.append(page_text)
+                total_chars += len(page_text)
+            if total_chars > MAX_PDF_CHARS:
+                truncated = truncated or page_num + 1 < page_count
+                break
         
         pdf_document.close()
         
         result = '\n\n'.join(text_parts)
-        logger.info(f"✅ PDF extraction complete: {len(result)} characters")
+        logger.info(f"✅ PDF extraction complete: {len(result)} characters, truncated={truncated}")
         
         return result
         
@@ -132,45 +98,6 @@ def extract_pdf_text_clean(file_content: bytes) -> str:
         logger.error(f"❌ PDF extraction failed: {e}")
         raise TextExtractionError(f"PDF extraction failed: {str(e)}")
 
-# Legacy function - now uses PyMuPDF instead of PyPDF2
-def extract_with_pymupdf_simple_legacy(file_content: bytes) -> str:
-    """Simple PyMuPDF extraction for large files - memory efficient"""
-    try:
-        doc = fitz.open(stream=file_content, filetype="pdf")
-        
-        text_parts = []
-        max_pages = min(len(doc), 5)  # Limit to 5 pages for memory
-        
-        for i in range(max_pages):
-            try:
-                page = doc.load_page(i)
-                page_text = page.get_text()
-                if page_text and len(page_text.strip()) > 20:
-                    text_parts.append(page_text)
-                    
-                # Clean up is automatic with PyMuPDF
-                
-                # Force cleanup every 2 pages
-                if i % 2 == 0:
-                    cleanup_memory()
-                    
-            except Exception as e:
-                logger.warning(f"Error extracting page {i+1}: {e}")
-                continue
-        
-        # Clean up document
-        doc.close()
-        cleanup_memory()
-        
-        result = '\n'.join(text_parts)
-        logger.info(f"Simple extraction completed: {len(result)} characters")
-        return result
-        
-    except Exception as e:
-        logger.error(f"Simple PDF extraction failed: {e}")
-        cleanup_memory()
-        raise TextExtractionError(f"Simple PDF extraction failed: {str(e)}")
-
 # Import configuration system
 from config.config_loader import (
     get_industry_keywords, get_grammar_patterns, get_spelling_corrections,
@@ -179,14 +106,8 @@ from config.config_loader import (
 )
 
 # Text extraction libraries - Critical dependency checking
-PYPDF2_AVAILABLE = False
 DOCX_AVAILABLE = False
-PDFPLUMBER_AVAILABLE = False
 PYMUPDF_AVAILABLE = False
-PDFMINER_AVAILABLE = False
-
-# PyPDF2 not used - removed dependency
-PYPDF2_AVAILABLE = False
 
 # Check python-docx (for DOCX files) - Optional for minimal deployment
 try:
@@ -197,56 +118,87 @@ except ImportError as e:
     logger.info(f"ℹ️  python-docx not available (minimal deployment): {e}")
     DOCX_AVAILABLE = False
 
-# Check pdfplumber (better PDF extraction)
-try:
-    import pdfplumber
-    PDFPLUMBER_AVAILABLE = True
-    logger.info("✅ pdfplumber available (enhanced PDF extraction)")
-except ImportError as e:
-    logger.warning(f"⚠️  pdfplumber not available: {e}")
-    PDFPLUMBER_AVAILABLE = False
-
 # Check PyMuPDF/fitz (primary PDF extraction)
 try:
     import fitz  # PyMuPDF
     PYMUPDF_AVAILABLE = True
+    # Plain text extraction flags: keep whitespace, clip to the page, and leave out ligature
+    # preservation so "ﬁ"/"ﬂ" come back as plain letters that keyword matching can find
+    PDF_TEXT_FLAGS = fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_MEDIABOX_CLIP
     logger.info("✅ PyMuPDF available for PDF extraction")
 except ImportError as e:
     logger.error(f"❌ CRITICAL: PyMuPDF not available: {e}")
     PYMUPDF_AVAILABLE = False
+    PDF_TEXT_FLAGS = 0
 
-# Check pdfminer (comprehensive extraction)
+# Check Supabase client (database persistence)
 try:
-    from pdfminer.high_level import extract_text as pdfminer_extract_text
-    PDFMINER_AVAILABLE = True
-    logger.info("✅ pdfminer.six available (comprehensive PDF extraction)")
+    from supabase import create_client
+    from postgrest.exceptions import APIError as SupabaseAPIError
+    from httpx import TransportError as SupabaseTransportError
+    SUPABASE_AVAILABLE = True
 except ImportError as e:
-    logger.warning(f"⚠️  pdfminer not available: {e}")
-    PDFMINER_AVAILABLE = False
+    logger.warning(f"⚠️  Supabase client not available: {e}")
+    SUPABASE_AVAILABLE = False
+
+# Check orjson (fast JSON cleaning for database writes)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Check pyahocorasick (single-pass industry keyword matching)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Check google-re2 (linear-time matching for patterns with unbounded wildcards)
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+# re flags RE2 understands, as the inline flags it expects
+RE2_INLINE_FLAGS = ((re.IGNORECASE, 'i'), (re.DOTALL, 's'), (re.MULTILINE, 'm'))
+
+def compile_linear(pattern: str, flags: int = 0):
+    """
+    Compile with RE2 when available so `.*`-style patterns can't backtrack; falls back to re
+    for patterns RE2 rejects (lookarounds, backreferences). Only for ASCII-oriented patterns:
+    RE2's \\w, \\d and \\b don't match non-ASCII letters and digits
+    """
+    if RE2_AVAILABLE:
+        inline = ''.join(letter for flag, letter in RE2_INLINE_FLAGS if flags & flag)
+        try:
+            return re2.compile(f'(?{inline}){pattern}' if inline else pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern, flags)
+
+# Dependency flags never change after import - summarize them once for logging and diagnostics
+PDF_DIAGNOSTICS = {
+    'dependencies': {
+        'pymupdf': PYMUPDF_AVAILABLE,
+        'python_docx': DOCX_AVAILABLE
+    },
+    'pdf_extraction_ready': PYMUPDF_AVAILABLE
+}
 
 # Log dependency summary
 def log_dependency_status():
-    """Log the status of all PDF extraction dependencies"""
-    total_available = sum([PYPDF2_AVAILABLE, PDFPLUMBER_AVAILABLE, PYMUPDF_AVAILABLE, PDFMINER_AVAILABLE])
-    
-    logger.info("📊 PDF Extraction Dependencies Status:")
-    logger.info(f"   PyPDF2: {'✅ Available' if PYPDF2_AVAILABLE else '❌ Missing'}")
-    logger.info(f"   pdfplumber: {'✅ Available' if PDFPLUMBER_AVAILABLE else '❌ Missing'}")
+    """Log the status of the text extraction dependencies"""
+    logger.info("📊 Text Extraction Dependencies Status:")
     logger.info(f"   PyMuPDF: {'✅ Available' if PYMUPDF_AVAILABLE else '❌ Missing'}")
-    logger.info(f"   pdfminer: {'✅ Available' if PDFMINER_AVAILABLE else '❌ Missing'}")
     logger.info(f"   python-docx: {'✅ Available' if DOCX_AVAILABLE else '❌ Missing'}")
-    logger.info(f"Total PDF extraction methods available: {total_available}/4")
-    
-    if total_available == 1 and PYPDF2_AVAILABLE:
-        logger.info("✅ PyPDF2 available - optimized for serverless deployment")
-    elif total_available >= 3:
-        logger.info("✅ Excellent: Multiple PDF extraction methods available for high quality")
-    elif total_available >= 2:
-        logger.info("✅ Good: Multiple PDF extraction methods available")
-    elif total_available == 0:
+    
+    if not PYMUPDF_AVAILABLE:
         logger.error("❌ CRITICAL: No PDF extraction methods available!")
         
-    return total_available
+    return int(PYMUPDF_AVAILABLE)
 
 # Check dependencies at startup
 available_methods = log_dependency_status()
@@ -258,60 +210,87 @@ ALLOWED_ORIGINS = [
     "https://bestcvbuilder-frontend.onrender.com"
 ]
 
+# Domain used for temporary emails generated for CVs without an email address
+TEMP_EMAIL_DOMAIN = '@bestcvbuilder.com'
+
 # Configuration-driven data - loaded from config files
 # Industry keywords, action verbs, and other data points are now externalized
 
 # Contact information patterns
 CONTACT_PATTERNS = {
-    'email': r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-    'phone': r'(\+\d{1,2}\s?)?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}',
-    'linkedin': r'linkedin\.com/in/[\w-]+|linkedin\.com/in/[\w\.-]+|www\.linkedin\.com/in/[\w-]+',
-    'website': r'https?://[\w.-]+\.[\w]{2,}',
-    'github': r'github\.com/[\w-]+'
+    'email': re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
+    'phone': re.compile(r'(\+\d{1,2}\s?)?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}'),
+    'linkedin': re.compile(r'linkedin\.com/in/[\w-]+|linkedin\.com/in/[\w\.-]+|www\.linkedin\.com/in/[\w-]+'),
+    'website': re.compile(r'https?://[\w.-]+\.[\w]{2,}'),
+    'github': re.compile(r'github\.com/[\w-]+')
 }
 
 # Additional patterns for comprehensive data extraction
 NAME_PATTERNS = [
-    r'^([A-Z][a-z]+ [A-Z][a-z]+)',  # First line name pattern
-    r'([A-Z][a-z]+ [A-Z][a-z]+)\s*\n',  # Name followed by newline
-    r'Name:\s*([A-Z][a-z]+ [A-Z][a-z]+)',  # Explicit name field
+    re.compile(r'^([A-Z][a-z]+ [A-Z][a-z]+)', re.MULTILINE),  # First line name pattern
+    re.compile(r'([A-Z][a-z]+ [A-Z][a-z]+)\s*\n', re.MULTILINE),  # Name followed by newline
+    re.compile(r'Name:\s*([A-Z][a-z]+ [A-Z][a-z]+)', re.MULTILINE),  # Explicit name field
     # Enhanced patterns for merged PDF lines and Unicode
-    r'^([A-Z][a-zA-Z\u00C0-\u017F]+ [A-Z][a-zA-Z\u00C0-\u017F]+(?:\s+[A-Z][a-zA-Z\u00C0-\u017F]+)?)',  # Unicode support
-    r'([A-Z][a-zA-Z\u00C0-\u017F]{2,}\s+[A-Z][a-zA-Z\u00C0-\u017F]{2,}(?:\s+[A-Z][a-zA-Z\u00C0-\u017F]{2,})?)',  # General name pattern with Unicode
+    re.compile(r'^([A-Z][a-zA-Z\u00C0-\u017F]+ [A-Z][a-zA-Z\u00C0-\u017F]+(?:\s+[A-Z][a-zA-Z\u00C0-\u017F]+)?)', re.MULTILINE),  # Unicode support
+    re.compile(r'([A-Z][a-zA-Z\u00C0-\u017F]{2,}\s+[A-Z][a-zA-Z\u00C0-\u017F]{2,}(?:\s+[A-Z][a-zA-Z\u00C0-\u017F]{2,})?)', re.MULTILINE),  # General name pattern with Unicode
 ]
 
+# Name at the start of an over-long (merged PDF) first line
+MERGED_NAME_PATTERNS = [
+    re.compile(r'^([A-Z][a-zA-Z\u00C0-\u017F]+\s+[A-Z][a-zA-Z\u00C0-\u017F]+(?:\s+[A-Z][a-zA-Z\u00C0-\u017F]+)?)'),  # Unicode names
+    re.compile(r'^([A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)(?:[\s\|\-•])'),  # Name followed by separator
+    re.compile(r'^([A-Z][a-z]+\s[A-Z][a-z]+)(?:\s*[A-Z][a-z]+@)'),  # Name before email
+    re.compile(r'^([A-Z][a-z]+\s[A-Z][a-z]+)(?:\s*\+?\d)'),  # Name before phone
+]
+
+# Header words that mean a title-case line is not a name
+NAME_HEADER_KEYWORDS = ('CURRICULUM', 'RESUME', 'CV', 'PROFILE', 'CONTACT')
+
 ADDRESS_PATTERNS = [
-    r'(\d+\s+[A-Za-z\s,]+(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Lane|Ln|Boulevard|Blvd|Way|Place|Pl)[\s,]*[A-Za-z\s,]*\d{5}(?:-\d{4})?)',  # US address
-    r'Address:\s*(.+?)(?:\n|Email|Phone)',  # Explicit address field
-    r'(\d+\s+[A-Za-z\s,]+(?:,\s*[A-Z]{2}\s*\d{5}))',  # City, State ZIP
+    re.compile(r'(\d+\s+[A-Za-z\s,]+(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Lane|Ln|Boulevard|Blvd|Way|Place|Pl)[\s,]*[A-Za-z\s,]*\d{5}(?:-\d{4})?)'),  # US address
+    re.compile(r'Address:\s*(.+?)(?:\n|Email|Phone)'),  # Explicit address field
+    re.compile(r'(\d+\s+[A-Za-z\s,]+(?:,\s*[A-Z]{2}\s*\d{5}))'),  # City, State ZIP
 ]
 
 CITY_STATE_PATTERNS = [
-    r'([A-Za-z\s]+),\s*([A-Z]{2})\s*(\d{5}(?:-\d{4})?)',  # City, State ZIP
-    r'([A-Za-z\s]+),\s*([A-Za-z\s]+)(?:\s*,\s*[A-Z]{2,3})?',  # City, State/Country
+    re.compile(r'([A-Za-z\s]+),\s*([A-Z]{2})\s*(\d{5}(?:-\d{4})?)', re.MULTILINE),  # City, State ZIP
+    re.compile(r'([A-Za-z\s]+),\s*([A-Za-z\s]+)(?:\s*,\s*[A-Z]{2,3})?', re.MULTILINE),  # City, State/Country
 ]
 
 SKILLS_PATTERNS = [
-    r'(?:SKILLS?|TECHNICAL SKILLS?|TECHNOLOGIES?|COMPETENCIES)[\s:]*\n?(.*?)(?:\n\n|\n[A-Z]{2,}|\Z)',
-    r'(?:Programming|Languages?|Tools?|Frameworks?)[\s:]*[:\-]?\s*(.*?)(?:\n|$)',
+    re.compile(r'(?:SKILLS?|TECHNICAL SKILLS?|TECHNOLOGIES?|COMPETENCIES)[\s:]*\n?(.*?)(?:\n\n|\n[A-Z]{2,}|\Z)', re.IGNORECASE | re.DOTALL),
+    re.compile(r'(?:Programming|Languages?|Tools?|Frameworks?)[\s:]*[:\-]?\s*(.*?)(?:\n|$)', re.IGNORECASE | re.DOTALL),
 ]
 
+# Skill separators in priority order - skills text splits on the first one present only, so
+# 'C/C++' and 'CI/CD' survive a comma-separated list
+SKILL_SEPARATORS = (',', '•', '|', ';', '\n', '/', '\\')
+
+# Compiled so extractors can resume scanning from a position and stop early
 EDUCATION_PATTERNS = [
-    r'(?:EDUCATION|ACADEMIC|QUALIFICATIONS?)[\s:]*\n?(.*?)(?:\n\n|\n[A-Z]{2,}|\Z)',
-    r'([A-Za-z\s]+(?:University|College|Institute|School).*?)(?:\n(?:[A-Z]{2,}|$))',
-    r'((?:Bachelor|Master|PhD|MBA|B\.S\.|M\.S\.|B\.A\.|M\.A\.).*?)(?:\n|$)',
+    re.compile(r'(?:EDUCATION|ACADEMIC|QUALIFICATIONS?)[\s:]*\n?(.*?)(?:\n\n|\n[A-Z]{2,}|\Z)', re.IGNORECASE | re.DOTALL),
+    re.compile(r'([A-Za-z\s]+(?:University|College|Institute|School).*?)(?:\n(?:[A-Z]{2,}|$))', re.IGNORECASE | re.DOTALL),
+    re.compile(r'((?:Bachelor|Master|PhD|MBA|B\.S\.|M\.S\.|B\.A\.|M\.A\.).*?)(?:\n|$)', re.IGNORECASE | re.DOTALL),
 ]
 
 EXPERIENCE_PATTERNS = [
-    r'(?:EXPERIENCE|EMPLOYMENT|WORK HISTORY|PROFESSIONAL EXPERIENCE)[\s:]*\n?(.*?)(?:\n\n|\n[A-Z]{2,}|\Z)',
-    r'([A-Za-z\s]+\|[A-Za-z\s,]+\|\s*\d{4}.*?)(?:\n(?:[A-Z]{2,}|$))',
+    re.compile(r'(?:EXPERIENCE|EMPLOYMENT|WORK HISTORY|PROFESSIONAL EXPERIENCE)[\s:]*\n?(.*?)(?:\n\n|\n[A-Z]{2,}|\Z)', re.IGNORECASE | re.DOTALL),
+    re.compile(r'([A-Za-z\s]+\|[A-Za-z\s,]+\|\s*\d{4}.*?)(?:\n(?:[A-Z]{2,}|$))', re.IGNORECASE | re.DOTALL),
 ]
 
+# Degree, institution and year patterns for individual education entries
+DEGREE_PATTERNS = [
+    re.compile(r'(Bachelor[^,\n]*|Master[^,\n]*|PhD[^,\n]*|MBA[^,\n]*|B\.S\.[^,\n]*|M\.S\.[^,\n]*|B\.A\.[^,\n]*|M\.A\.[^,\n]*)', re.IGNORECASE),
+    re.compile(r'(Associate[^,\n]*|Diploma[^,\n]*|Certificate[^,\n]*)', re.IGNORECASE),
+]
+
+INSTITUTION_PATTERN = re.compile(r'([A-Za-z\s]+(?:University|College|Institute|School))', re.IGNORECASE)
+
 SUMMARY_PATTERNS = [
-    r'(?:SUMMARY|PROFILE|OBJECTIVE|ABOUT)[\s:]*\n?(.*?)(?:\n\n|\n[A-Z]{2,}|\Z)',
+    re.compile(r'(?:SUMMARY|PROFILE|OBJECTIVE|ABOUT)[\s:]*\n?(.*?)(?:\n\n|\n[A-Z]{2,}|\Z)', re.IGNORECASE | re.DOTALL),
 ]
 
-# Quantified achievement patterns
+# Quantified achievement patterns, used when the config lists none
 QUANTIFIED_PATTERNS = [
     r'\b\d+%\b',  # Percentages
     r'\$\d+[,\d]*(?:\.\d{2})?\b',  # Dollar amounts
@@ -322,6 +301,35 @@ QUANTIFIED_PATTERNS = [
     r'\b(?:increased|decreased|improved|reduced|grew|generated)\s+.*?\d+[%\d]*\b'  # Performance metrics
 ]
 
+# Years-of-experience statements, in priority order - each one's first match is tried before
+# the next statement, wherever it sits in the document
+YEARS_EXPERIENCE_PATTERNS = [
+    re.compile(r'(\d+)\s*\+?\s*years?\s+(?:of\s+)?(?:professional\s+)?experience', re.IGNORECASE),
+    re.compile(r'(?:professional\s+)?experience.*?(\d+)\s*\+?\s*years?', re.IGNORECASE),
+    re.compile(r'(\d+)\s*\+?\s*years?\s+(?:in|with)', re.IGNORECASE),
+    re.compile(r'over\s+(\d+)\s*years?\s+(?:of\s+)?(?:professional\s+)?experience', re.IGNORECASE),
+]
+
+# Work section headers, most specific first
+WORK_SECTION_PATTERNS = [
+    re.compile(r'(?:WORK\s+EXPERIENCE|PROFESSIONAL\s+EXPERIENCE|EMPLOYMENT\s+HISTORY|CAREER\s+SUMMARY)[\s:]*\n?(.*?)(?:\n\n|\n(?:EDUCATION|SKILLS|CERTIFICATIONS)|$)', re.IGNORECASE | re.DOTALL),
+    re.compile(r'(?:EXPERIENCE|EMPLOYMENT)[\s:]*\n?(.*?)(?:\n\n|\n(?:EDUCATION|SKILLS)|$)', re.IGNORECASE | re.DOTALL),
+]
+
+YEAR_PATTERN = re.compile(r'(19\d{2}|20\d{2})')
+
+# File extension of an uploaded resume (filename or URL path)
+FILE_TYPE_PATTERN = re.compile(r'\.(pdf|docx|doc)(?:$|[?#])', re.IGNORECASE)
+
+# Largest resume file accepted for download
+MAX_FILE_SIZE = 10 * 1024 * 1024
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# Connect timeout for the storage host - fail fast when it is unreachable, the read timeout stays per caller
+DOWNLOAD_CONNECT_TIMEOUT = 2
+
+# Line break before a new job header such as "ACME CORP | ..." or "ACME •"
+JOB_ENTRY_SPLIT_PATTERN = re.compile(r'\n(?=[A-Z][^a-z]*[|•])')
+
 class ATSAnalysisError(Exception):
     """Custom exception for ATS analysis errors"""
     pass
@@ -330,6 +338,10 @@ class FileProcessingError(ATSAnalysisError):
     """Error during file processing"""
     pass
 
+class FileTooLargeError(FileProcessingError):
+    """Downloaded file exceeds the size limit"""
+    pass
+
 class TextExtractionError(ATSAnalysisError):
     """Error during text extraction"""
     pass
@@ -343,10 +355,15 @@ def cors_headers():
         "Access-Control-Max-Age": "86400"
     }
 
+@lru_cache(maxsize=256)
+def cached_urlparse(url: str):
+    """urlparse memoized per URL - the same file URL is parsed by several helpers per upload"""
+    return urlparse(url)
+
 def validate_file_url(file_url: str) -> bool:
     """Validate file URL format and security"""
     try:
-        parsed = urlparse(file_url)
+        parsed = cached_urlparse(file_url)
         if not parsed.scheme in ['http', 'https']:
             return False
         if not parsed.netloc:
@@ -388,337 +405,6 @@ def extract_text_from_file(file_content: bytes, file_url: str) -> str:
 def extract_pdf_text(file_content: bytes) -> str:
     """Legacy function - redirects to clean extraction"""
     return extract_pdf_text_clean(file_content)
-    
-    # Check if any extraction method is available
-    if not any([PDFPLUMBER_AVAILABLE, PYMUPDF_AVAILABLE, PDFMINER_AVAILABLE]):
-        raise TextExtractionError("CRITICAL: No PDF extraction libraries available")
-    
-    # Prioritized extraction methods (best first for Render.com)
-    extraction_methods = []
-    
-    # Priority 1: pdfplumber (excellent for structured text, emails, preserves formatting)
-    if PDFPLUMBER_AVAILABLE:
-        extraction_methods.append(("pdfplumber", extract_with_pdfplumber))
-    
-    # Priority 2: PyMuPDF (best overall accuracy, speed, and text quality)  
-    if PYMUPDF_AVAILABLE:
-        extraction_methods.append(("pymupdf", extract_with_pymupdf))
-        
-    # Priority 3: pdfminer (comprehensive extraction, good for complex layouts)
-    if PDFMINER_AVAILABLE:
-        extraction_methods.append(("pdfminer", extract_with_pdfminer))
-        
-    # PyPDF2 removed - using PyMuPDF instead
-    
-    if not extraction_methods:
-        raise TextExtractionError("No PDF extraction methods available")
-    
-    logger.info(f"🔄 Trying {len(extraction_methods)} PDF extraction methods in priority order")
-    
-    best_text = ""
-    best_score = 0
-    best_method = "none"
-    
-    for method_name, method_func in extraction_methods:
-        try:
-            logger.info(f"📄 Attempting PDF extraction with {method_name}")
-            text = method_func(file_content)
-            
-            if text and len(text.strip()) >= 50:
-                quality_score = score_text_quality(text)
-                logger.info(f"📊 {method_name} extraction score: {quality_score}/100")
-                
-                # Update best result if this is better
-                if quality_score > best_score:
-                    best_text = text
-                    best_score = quality_score
-                    
-                    # Clean up to save memory
-                    cleanup_memory()
-                
-                # If we get excellent results, stop trying other methods
-                if quality_score >= 85:
-                    logger.info(f"✅ Excellent quality ({quality_score}) achieved with {method_name}, stopping here")
-                    break
-                    best_method = method_name
-                    logger.info(f"🏆 New best extraction method: {method_name} (score: {quality_score})")
-                
-                # If we get excellent results with priority methods, use them immediately
-                if quality_score >= 90 and method_name in ["pdfplumber", "pymupdf"]:
-                    logger.info(f"🎯 Excellent quality achieved with priority method {method_name}")
-                    break
-                    
-                # For less accurate methods, require higher threshold to stop early
-                elif quality_score >= 95 and method_name in ["pdfminer", "pypdf2"]:
-                    logger.info(f"🎯 Excellent quality achieved with {method_name}")
-                    break
-                    
-            else:
-                logger.warning(f"⚠️  {method_name} extracted minimal text")
-                    
-        except Exception as e:
-            logger.warning(f"❌ {method_name} failed: {str(e)}")
-            continue
-    
-    # Ensure we have some text to work with
-    if not best_text or len(best_text.strip()) < 50:
-        # Last resort: try basic PyMuPDF if available  
-        if PYMUPDF_AVAILABLE:
-            try:
-                logger.warning("🚨 Falling back to basic PyMuPDF extraction (last resort)")
-                basic_text = extract_with_pymupdf(file_content)
-                if basic_text and len(basic_text.strip()) >= 20:  # Lower threshold for last resort
-                    logger.info(f"✅ Basic PyMuPDF extracted {len(basic_text)} characters")
-                    return basic_text
-            except Exception as e:
-                logger.error(f"❌ Basic PyMuPDF extraction also failed: {str(e)}")
-        
-        raise TextExtractionError("PDF extraction failed - file may be corrupted, image-only, or password protected")
-    
-    logger.info(f"🎉 Final PDF extraction completed successfully!")
-    logger.info(f"📊 Best method score: {best_score}/100")
-    logger.info(f"📝 Extracted text length: {len(best_text)} characters")
-    return best_text
-
-def extract_with_pypdf2_basic(file_content: bytes) -> str:
-    """Basic PyPDF2 extraction without cleaning - last resort fallback"""
-    text = ""
-    pdf_file = io.BytesIO(file_content)
-    pdf_reader = PyPDF2.PdfReader(pdf_file)
-    
-    for page in pdf_reader.pages:
-        try:
-            page_text = page.extract_text()
-            if page_text:
-                text += page_text + "\n"
-        except Exception as e:
-            logger.warning(f"Failed to extract text from page: {e}")
-            continue
-    
-    return text
-
-def extract_with_pypdf2(file_content: bytes) -> str:
-    """Extract text using PyPDF2 with memory management"""
-    text = ""
-    pdf_file = io.BytesIO(file_content)
-    pdf_reader = PyPDF2.PdfReader(pdf_file)
-    
-    page_count = 0
-    max_pages = min(len(pdf_reader.pages), 10)  # Limit pages for memory
-    
-    for page in pdf_reader.pages[:max_pages]:
-        try:
-            # Try different extraction methods for better quality
-            page_text = page.extract_text()
-            
-            # If standard extraction yields poor results, try alternative method
-            if page_text and len(page_text.strip()) < 50:
-                # Try extracting with different parameters for better results
-                try:
-                    page_text = page.extract_text(extraction_mode="layout")
-                except:
-                    pass  # Fall back to standard extraction
-            
-            if page_text:
-                text += page_text + "\n"
-            
-            page_count += 1
-            
-            # Clean up memory every 3 pages
-            if page_count % 3 == 0:
-                cleanup_memory()
-                
-        except Exception as e:
-            logger.warning(f"Failed to extract text from page: {e}")
-            continue
-    
-    # Clean up reader and file
-    del pdf_reader
-    pdf_file.close()
-    cleanup_memory()
-    
-    # Enhanced cleaning for PyPDF2 specific issues
-    cleaned_text = clean_extracted_text_enhanced(text)
-    return cleaned_text
-
-def clean_extracted_text_enhanced(text: str) -> str:
-    """
-    Enhanced text cleaning specifically for PyPDF2 extraction issues
-    """
-    if not text:
-        return text
-    
-    # Basic normalization first
-    text = clean_extracted_text(text)
-    
-    # Fix common PyPDF2 email extraction issues
-    # Pattern: Single letter prefix before email (e.g., "ebhagat.jatin@gmail.com")
-    text = re.sub(r'\b[a-z]([a-zA-Z0-9._%+-]{2,}@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})\b', r'\1', text)
-    
-    # Fix broken email domains (e.g., "gmail. com" -> "gmail.com")
-    text = re.sub(r'@([a-zA-Z0-9.-]+)\.\s+([a-zA-Z]{2,})\b', r'@\1.\2', text)
-    
-    # Fix spaces in email local part (e.g., "user .name@domain.com" -> "user.name@domain.com")
-    text = re.sub(r'([a-zA-Z0-9_%+-]+)\s+\.([a-zA-Z0-9_%+-]+)@', r'\1.\2@', text)
-    
-    # Fix spaces around @ symbol
-    text = re.sub(r'([a-zA-Z0-9._%+-]+)\s+@\s+([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})', r'\1@\2', text)
-    
-    return text
-
-def extract_with_pdfplumber(file_content: bytes) -> str:
-    """Extract text using pdfplumber (more accurate for complex layouts)"""
-    if not PDFPLUMBER_AVAILABLE:
-        raise Exception("pdfplumber not available in runtime environment")
-    
-    try:
-        import pdfplumber
-        text = ""
-        pdf_file = io.BytesIO(file_content)
-        
-        with pdfplumber.open(pdf_file) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-        
-        return clean_extracted_text(text)
-    except Exception as e:
-        raise Exception(f"pdfplumber extraction failed: {str(e)}")
-
-def extract_with_pymupdf(file_content: bytes) -> str:
-    """Extract text using PyMuPDF/fitz (good for text accuracy)"""
-    if not PYMUPDF_AVAILABLE:
-        raise Exception("PyMuPDF not available in runtime environment")
-    
-    try:
-        import fitz  # PyMuPDF
-        text = ""
-        pdf_document = fitz.open("pdf", file_content)
-        
-        for page_num in range(pdf_document.page_count):
-            page = pdf_document[page_num]
-            page_text = page.get_text()
-            if page_text:
-                text += page_text + "\n"
-        
-        pdf_document.close()
-        return clean_extracted_text(text)
-    except Exception as e:
-        raise Exception(f"PyMuPDF extraction failed: {str(e)}")
-
-def extract_with_pdfminer(file_content: bytes) -> str:
-    """Extract text using pdfminer (most comprehensive but slower)"""
-    if not PDFMINER_AVAILABLE:
-        raise Exception("pdfminer not available in runtime environment")
-    
-    try:
-        from io import BytesIO
-        
-        text = pdfminer_extract_text(BytesIO(file_content))
-        return clean_extracted_text(text)
-    except Exception as e:
-        raise Exception(f"pdfminer extraction failed: {str(e)}")
-
-def score_text_quality(text: str) -> float:
-    """
-    Score the quality of extracted text based on various factors
-    Returns a score from 0-100
-    """
-    if not text or len(text.strip()) < 10:
-        return 0
-    
-    score = 0
-    
-    # Factor 1: Basic text characteristics (30 points)
-    word_count = len(text.split())
-    if word_count >= 50:
-        score += 15
-    elif word_count >= 20:
-        score += 10
-    elif word_count >= 10:
-        score += 5
-    
-    # Reasonable length (not too short or extremely long)
-    if 100 <= word_count <= 2000:
-        score += 15
-    elif 50 <= word_count < 100 or 2000 < word_count <= 5000:
-        score += 10
-    elif word_count > 5000:
-        score += 5
-    
-    # Factor 2: Email detection quality (25 points)
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b'
-    emails = re.findall(email_pattern, text)
-    
-    if emails:
-        # Check for clean email extraction (no obvious artifacts)
-        clean_emails = [email for email in emails if not re.match(r'^[a-z][A-Z]', email)]
-        if clean_emails:
-            score += 25
-        else:
-            score += 10  # Found emails but they might have artifacts
-    
-    # Factor 3: Text structure quality (20 points)
-    lines = text.split('\n')
-    non_empty_lines = [line for line in lines if line.strip()]
-    
-    if len(non_empty_lines) >= 10:
-        score += 10
-    elif len(non_empty_lines) >= 5:
-        score += 5
-    
-    # Check for reasonable line lengths (not too many very short or very long lines)
-    reasonable_lines = [line for line in non_empty_lines if 10 <= len(line.strip()) <= 200]
-    if len(reasonable_lines) >= len(non_empty_lines) * 0.7:
-        score += 10
-    elif len(reasonable_lines) >= len(non_empty_lines) * 0.5:
-        score += 5
-    
-    # Factor 4: Character quality (15 points)
-    # Check for reasonable character distribution
-    alpha_ratio = sum(1 for c in text if c.isalpha()) / len(text)
-    if 0.6 <= alpha_ratio <= 0.9:
-        score += 10
-    elif 0.4 <= alpha_ratio <= 0.95:
-        score += 5
-    
-    # Check for reasonable punctuation
-    punct_ratio = sum(1 for c in text if c in '.,;:!?') / len(text)
-    if 0.02 <= punct_ratio <= 0.15:
-        score += 5
-    
-    # Factor 5: Professional content indicators (10 points)
-    professional_keywords = [
-        'experience', 'education', 'skills', 'work', 'job', 'company',
-        'university', 'degree', 'project', 'manager', 'developer', 'engineer'
-    ]
-    
-    found_keywords = sum(1 for keyword in professional_keywords if keyword.lower() in text.lower())
-    if found_keywords >= 5:
-        score += 10
-    elif found_keywords >= 3:
-        score += 5
-    elif found_keywords >= 1:
-        score += 2
-    
-    return min(score, 100)
-
-def clean_extracted_text(text: str) -> str:
-    """
-    Basic text cleaning for PDF extraction results
-    Focus on simple normalization rather than complex artifact fixing
-    """
-    # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text)
-    
-    # Remove excessive line breaks
-    text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
-    
-    # Fix common spacing issues around punctuation
-    text = re.sub(r'\s+([,.;:!?])', r'\1', text)
-    
-    return text.strip()
 
 def extract_docx_text(file_content: bytes) -> str:
     """Extract text from DOCX files"""
@@ -730,11 +416,11 @@ def extract_docx_text(file_content: bytes) -> str:
         doc_file = io.BytesIO(file_content)
         doc = docx.Document(doc_file)
         
-        text = ""
+        text_lines = []
         # Extract text from paragraphs
         for paragraph in doc.paragraphs:
             if paragraph.text.strip():
-                text += paragraph.text + "\n"
+                text_lines.append(paragraph.text)
         
         # Extract text from tables
         for table in doc.tables:
@@ -744,9 +430,10 @@ def extract_docx_text(file_content: bytes) -> str:
                     if cell.text.strip():
                         row_text.append(cell.text.strip())
                 if row_text:
-                    text += " | ".join(row_text) + "\n"
-                
-        return text
+                    text_lines.append(" | ".join(row_text))
+        
+        # Join once instead of growing a string per line; every line keeps its trailing newline
+        return "".join(f"{line}\n" for line in text_lines)
     except Exception as e:
         logger.error(f"DOCX extraction error: {str(e)}")
         raise TextExtractionError(f"DOCX extraction failed: {str(e)}")
@@ -756,109 +443,197 @@ def extract_doc_text(file_content: bytes) -> str:
     # DOC format not supported with current dependencies
     raise TextExtractionError("DOC files are not supported. Please use PDF or DOCX format.")
 
-def detect_industry(content: str) -> str:
-    """Detect the most likely industry based on content keywords"""
-    content_lower = content.lower()
-    industry_scores = {}
+# Essential sections as (section, patterns, weight); contact patterns are never configured
+CONTACT_SECTION_PATTERNS = ('email', 'phone', 'linkedin', '@', 'contact')
+# Section keywords used when the scoring config lists none
+FALLBACK_ESSENTIAL_SECTIONS = (
+    ('contact', CONTACT_SECTION_PATTERNS, 8),
+    ('experience', ('experience', 'employment', 'work history', 'professional experience', 'career'), 10),
+    ('education', ('education', 'degree', 'university', 'college', 'school', 'academic'), 6),
+    ('skills', ('skills', 'technical skills', 'competencies', 'technologies', 'tools'), 6)
+)
+FALLBACK_OPTIONAL_SECTIONS = ('summary', 'objective', 'achievements', 'projects', 'certifications', 'awards')
+
+@lru_cache(maxsize=1)
+def get_section_keywords(config_mtime: int) -> Tuple[Tuple[Tuple[str, Tuple[str, ...], int], ...], Tuple[str, ...]]:
+    """
+    Essential sections as (section, patterns, weight) and optional section names, frozen into
+    tuples once and rebuilt only when the config file changes
+    """
+    essential_sections_config = config_loader.get_essential_sections()
+    required = tuple(essential_sections_config.get('required', []))
+    
+    if required:
+        essential_sections = (
+            ('contact', CONTACT_SECTION_PATTERNS, 8),
+            ('experience', required[:5], 10),  # First 5 experience patterns
+            ('education', required[5:10], 6),  # Education patterns
+            ('skills', required[10:], 6)  # Skills patterns
+        )
+    else:
+        # Fallback to hardcoded patterns if config is empty
+        essential_sections = FALLBACK_ESSENTIAL_SECTIONS
     
-    # Load industry keywords from config
-    industry_keywords = get_industry_keywords()
+    optional_sections = tuple(essential_sections_config.get('recommended', []) + essential_sections_config.get('optional', []))
     
-    for industry, categories in industry_keywords.items():
-        score = 0
-        for category, keywords in categories.items():
+    return essential_sections, optional_sections or FALLBACK_OPTIONAL_SECTIONS
+
+@lru_cache(maxsize=1)
+def get_industry_keyword_index(config_mtime: int) -> Dict[str, Counter]:
+    """
+    Industry keyword config flattened into keyword -> {industry: times listed},
+    rebuilt only when the config file changes
+    """
+    keyword_weights = {}
+    for industry, categories in get_industry_keywords().items():
+        for keywords in categories.values():
             for keyword in keywords:
-                if keyword in content_lower:
-                    score += content_lower.count(keyword)
-        industry_scores[industry] = score
-    
-    if not industry_scores or max(industry_scores.values()) == 0:
-        return 'general'
+                keyword_weights.setdefault(keyword, Counter())[industry] += 1
+    return keyword_weights
+
+def build_keyword_automaton(keywords) -> Any:
+    """Aho-Corasick automaton mapping each keyword to itself, or None when pyahocorasick is missing"""
+    if not AHOCORASICK_AVAILABLE or not keywords:
+        return None
     
-    return max(industry_scores, key=industry_scores.get)
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
 
-def analyze_content_structure(content: str) -> Dict[str, Any]:
-    """Analyze resume structure and organization using config data - More stringent scoring"""
+def build_keyword_class_automaton(keyword_classes: Dict[str, Tuple[str, ...]]) -> Any:
+    """Aho-Corasick automaton mapping each keyword to its class, or None when pyahocorasick is missing"""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for keyword_class, keywords in keyword_classes.items():
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword_class)
+    automaton.make_automaton()
+    return automaton
+
+def find_keyword_classes(text_lower: str, keyword_classes: Dict[str, Tuple[str, ...]], automaton: Any) -> set:
+    """Classes with at least one keyword occurring in the text, found in one scan"""
+    if automaton is None:
+        return {keyword_class for keyword_class, keywords in keyword_classes.items()
+                if any(keyword in text_lower for keyword in keywords)}
+    return {keyword_class for _, keyword_class in automaton.iter(text_lower)}
+
+@lru_cache(maxsize=1)
+def get_scan_keyword_index(industry_mtime: int, language_mtime: int, scoring_mtime: int) -> Tuple[Tuple[str, ...], Any]:
+    """
+    Every literal the scoring analyzers count (industry keywords, action verbs, section names)
+    and one automaton over all of them, rebuilt only when one of the config files changes
+    """
+    essential_sections, optional_sections = get_section_keywords(scoring_mtime)
+    keywords = tuple(dict.fromkeys(chain(
+        get_industry_keyword_index(industry_mtime),
+        chain.from_iterable(get_achievement_verbs().values()),
+        chain.from_iterable(patterns for _, patterns, _ in essential_sections),
+        optional_sections
+    )))
+    return keywords, build_keyword_automaton(keywords)
+
+def count_keywords(content_lower: str, keywords, automaton: Any) -> Counter:
+    """
+    Count every keyword in one scan, with str.count semantics:
+    nested keywords ('java' in 'javascript') each count, repeats of the same keyword don't overlap
+    """
+    counts = Counter()
+    
+    if automaton is None:
+        for keyword in keywords:
+            count = content_lower.count(keyword)
+            if count:
+                counts[keyword] = count
+        return counts
+    
+    next_start = {}
+    for end, keyword in automaton.iter(content_lower):
+        start = end - len(keyword) + 1
+        if start >= next_start.get(keyword, 0):
+            counts[keyword] += 1
+            next_start[keyword] = end + 1
+    return counts
+
+SENTENCE_END_PATTERN = re.compile(r'[.!?]+')
+WORD_PATTERN = re.compile(r'\b\w+\b')
+
+@dataclass
+class ScanResult:
+    """
+    Views of one resume computed in a single pass and shared by every scoring analyzer.
+    Lines are split on '\\n' only, so lines_lower[i] == lines[i].lower()
+    """
+    # Spelled out rather than dataclass(slots=True), which needs Python 3.10
+    __slots__ = ('content', 'content_lower', 'word_count', 'lines', 'lines_lower',
+                 'sentence_count', 'word_set', 'keyword_counts')
+    
+    content: str
+    content_lower: str
+    word_count: int
+    lines: List[str]
+    lines_lower: List[str]
+    sentence_count: int
+    word_set: frozenset
+    keyword_counts: Counter
+
+def scan_resume(content: str) -> ScanResult:
+    """Lowercase, tokenize and count keywords once so the analyzers never re-walk the text"""
     content_lower = content.lower()
+    keywords, automaton = get_scan_keyword_index(
+        config_loader.config_mtime('industry_keywords'),
+        config_loader.config_mtime('professional_language'),
+        config_loader.config_mtime('ats_scoring')
+    )
+    return ScanResult(
+        content=content,
+        content_lower=content_lower,
+        word_count=len(content.split()),
+        lines=content.split('\n'),
+        lines_lower=content_lower.split('\n'),
+        sentence_count=len(SENTENCE_END_PATTERN.findall(content)),
+        word_set=frozenset(WORD_PATTERN.findall(content_lower)),
+        keyword_counts=count_keywords(content_lower, keywords, automaton)
+    )
+
+def detect_industry(scan: ScanResult) -> str:
+    """Detect the most likely industry based on content keywords"""
+    keyword_weights = get_industry_keyword_index(config_loader.config_mtime('industry_keywords'))
+    industry_scores = Counter()
     
-    # Load essential sections from config
-    essential_sections_config = config_loader.get_essential_sections()
+    for keyword, times_listed_by_industry in keyword_weights.items():
+        count = scan.keyword_counts[keyword]
+        if count:
+            for industry, times_listed in times_listed_by_industry.items():
+                industry_scores[industry] += count * times_listed
     
-    # Build essential sections structure with patterns and weights
-    essential_sections = {
-        'contact': {
-            'patterns': ['email', 'phone', 'linkedin', '@', 'contact'],
-            'weight': 8,
-            'found': False
-        },
-        'experience': {
-            'patterns': essential_sections_config.get('required', [])[:5],  # First 5 experience patterns
-            'weight': 10,
-            'found': False
-        },
-        'education': {
-            'patterns': essential_sections_config.get('required', [])[5:10],  # Education patterns
-            'weight': 6,
-            'found': False
-        },
-        'skills': {
-            'patterns': essential_sections_config.get('required', [])[10:],  # Skills patterns
-            'weight': 6,
-            'found': False
-        }
-    }
+    if not industry_scores:
+        return 'general'
     
-    # Fallback to hardcoded patterns if config is empty
-    if not essential_sections_config.get('required'):
-        essential_sections = {
-            'contact': {
-                'patterns': ['email', 'phone', 'linkedin', '@', 'contact'],
-                'weight': 8,
-                'found': False
-            },
-            'experience': {
-                'patterns': ['experience', 'employment', 'work history', 'professional experience', 'career'],
-                'weight': 10,
-                'found': False
-            },
-            'education': {
-                'patterns': ['education', 'degree', 'university', 'college', 'school', 'academic'],
-                'weight': 6,
-                'found': False
-            },
-            'skills': {
-                'patterns': ['skills', 'technical skills', 'competencies', 'technologies', 'tools'],
-                'weight': 6,
-                'found': False
-            }
-        }
+    # Ties go to the first industry in config order
+    return max(get_industry_keywords(), key=lambda industry: industry_scores[industry])
+
+def analyze_content_structure(scan: ScanResult) -> Dict[str, Any]:
+    """Analyze resume structure and organization using config data - More stringent scoring"""
+    # Load essential and optional sections from config
+    essential_sections, optional_sections = get_section_keywords(config_loader.config_mtime('ats_scoring'))
+    # Keywords found anywhere in the resume; isdisjoint probes it once per pattern, in C
+    present = scan.keyword_counts.keys()
     
     # Check for sections
     total_score = 0
     found_sections = []
     
-    for section, data in essential_sections.items():
-        for pattern in data['patterns']:
-            if pattern in content_lower:
-                data['found'] = True
-                found_sections.append(section)
-                total_score += data['weight']
-                break
-    
-    # Load optional sections from config
-    optional_sections_config = config_loader.get_essential_sections()
-    optional_sections = optional_sections_config.get('recommended', []) + optional_sections_config.get('optional', [])
-    
-    # Fallback if config is empty
-    if not optional_sections:
-        optional_sections = ['summary', 'objective', 'achievements', 'projects', 'certifications', 'awards']
-    
-    optional_found = []
+    for section, patterns, weight in essential_sections:
+        if not present.isdisjoint(patterns):
+            found_sections.append(section)
+            total_score += weight
     
-    for section in optional_sections:
-        if section in content_lower:
-            optional_found.append(section)
-            total_score += 2  # Bonus points
+    optional_found = [section for section in optional_sections if section in present]
+    total_score += 2 * len(optional_found)  # Bonus points
     
     # More stringent scoring - must have most sections to get high scores
     section_score = min(total_score * 0.8, 20)  # Reduce by 20% and cap at 20
@@ -867,32 +642,42 @@ def analyze_content_structure(content: str) -> Dict[str, Any]:
         'score': max(section_score, 0),  # More realistic scoring
         'essential_sections': found_sections,
         'optional_sections': optional_found,
-        'missing_sections': [k for k, v in essential_sections.items() if not v['found']]
+        'missing_sections': [section for section, _, _ in essential_sections if section not in found_sections]
     }
 
-def analyze_keyword_optimization(content: str, industry: str = None) -> Dict[str, Any]:
+@lru_cache(maxsize=1)
+def get_industry_keyword_categories(config_mtime: int) -> Dict[str, Tuple[Tuple[str, Tuple[str, ...]], ...]]:
+    """Industry -> (category, keywords) tuples, frozen once and rebuilt only when the config file changes"""
+    return {industry: tuple((category, tuple(keywords)) for category, keywords in categories.items())
+            for industry, categories in get_industry_keywords().items()}
+
+@lru_cache(maxsize=1)
+def get_action_verb_categories(config_mtime: int) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+    """Achievement verbs as (category, verbs) tuples, frozen once and rebuilt only when the config file changes"""
+    return tuple((category, tuple(verbs)) for category, verbs in get_achievement_verbs().items())
+
+def analyze_keyword_optimization(scan: ScanResult, industry: str = None) -> Dict[str, Any]:
     """Analyze keyword density and relevance - MAX 20 POINTS to match config weights"""
-    content_lower = content.lower()
+    keyword_counts = scan.keyword_counts
     score = 0
     keyword_analysis = {}
     
     # Load industry keywords from config
-    industry_keywords_config = get_industry_keywords()
+    industry_keywords_config = get_industry_keyword_categories(config_loader.config_mtime('industry_keywords'))
     
     # Industry-specific keywords
     if industry and industry in industry_keywords_config:
-        industry_keywords = industry_keywords_config[industry]
         industry_found = {}
         
-        for category, keywords in industry_keywords.items():
+        for category, keywords in industry_keywords_config[industry]:
             found_keywords = []
             for keyword in keywords:
-                count = content_lower.count(keyword)
+                count = keyword_counts[keyword]
                 if count > 0:
                     found_keywords.append({
                         'keyword': keyword,
                         'count': count,
-                        'density': count / len(content.split()) * 1000  # Per 1000 words
+                        'density': count / scan.word_count * 1000  # Per 1000 words
                     })
                     # Award points with diminishing returns
                     score += min(count * 2, 4)  # Max 4 points per keyword
@@ -903,14 +688,14 @@ def analyze_keyword_optimization(content: str, industry: str = None) -> Dict[str
         keyword_analysis['industry_keywords'] = industry_found
     
     # Action verbs analysis using config
-    action_verbs_config = get_achievement_verbs()
+    action_verbs_config = get_action_verb_categories(config_loader.config_mtime('professional_language'))
     action_verb_score = 0
     found_verbs = {}
     
-    for category, verbs in action_verbs_config.items():
+    for category, verbs in action_verbs_config:
         category_verbs = []
         for verb in verbs:
-            count = content_lower.count(verb)
+            count = keyword_counts[verb]
             if count > 0:
                 category_verbs.append({'verb': verb, 'count': count})
                 action_verb_score += min(count, 2)  # Max 2 points per verb
@@ -926,31 +711,42 @@ def analyze_keyword_optimization(content: str, industry: str = None) -> Dict[str
         'analysis': keyword_analysis
     }
 
-def analyze_contact_information(content: str) -> Dict[str, Any]:
+# Phone numbers for analyze_contact_information in one pass: an optional country/area prefix
+# covers the international, US and simple formats; raw 10+ digit runs are the fallback
+PHONE_PATTERN = re.compile(r'(?:\+?\d{1,4}[\s\-\.]?)?\(?\d{3}\)?[\s\-\.]?\d{3}[\s\-\.]?\d{4}|\d{10,}')
+# Deletes ASCII digits, so len(text) - len(text.translate(...)) counts them
+DIGIT_DELETE_TABLE = str.maketrans('', '', '0123456789')
+
+# Weight for a contact type that doesn't set one, by requirement tier
+CONTACT_TIER_DEFAULT_WEIGHTS = {'essential': 3, 'recommended': 2, 'optional': 1}
+
+@lru_cache(maxsize=1)
+def get_contact_checks(config_mtime: int) -> List[Tuple[str, str, List[re.Pattern], int]]:
+    """
+    (tier, contact type, compiled patterns, weight) for every configured contact type,
+    rebuilt only when the config file changes
+    """
+    contact_requirements = config_loader.get_contact_requirements()
+    return [
+        (tier, contact_type,
+         [re.compile(pattern, re.IGNORECASE) for pattern in contact_data.get('patterns', [])],
+         contact_data.get('weight', default_weight))
+        for tier, default_weight in CONTACT_TIER_DEFAULT_WEIGHTS.items()
+        for contact_type, contact_data in contact_requirements.get(tier, {}).items()
+    ]
+
+def analyze_contact_information(scan: ScanResult) -> Dict[str, Any]:
     """Analyze contact information completeness and format using config patterns"""
+    content = scan.content
     found_contacts = {}
     score = 0
     
-    # Load contact requirements from config
-    contact_requirements = config_loader.get_contact_requirements()
-    
     # Enhanced phone number extraction with multiple strategies
-    phone_patterns = [
-        r'\+?\d{1,4}[\s\-\.]?\(?\d{3}\)?[\s\-\.]?\d{3}[\s\-\.]?\d{4}',  # International format
-        r'\(?\d{3}\)?[\s\-\.]?\d{3}[\s\-\.]?\d{4}',  # US format
-        r'\d{3}[\s\-\.]\d{3}[\s\-\.]\d{4}',  # Simple format
-        r'\+\d{1,3}\s?\(?\d{3}\)?\s?\d{3}[\s\-\.]?\d{4}',  # Mixed international
-        r'\d{10,}',  # Raw digits (10+ digits)
-    ]
-    
     phone_matches = []
-    for pattern in phone_patterns:
-        matches = re.findall(pattern, content)
-        for match in matches:
-            # Validate phone number has enough digits
-            digits = re.sub(r'[^\d]', '', match)
-            if len(digits) >= 10:
-                phone_matches.append(match)
+    for match in PHONE_PATTERN.findall(content):
+        # Validate phone number has enough digits
+        if len(match) - len(match.translate(DIGIT_DELETE_TABLE)) >= 10:
+            phone_matches.append(match)
     
     # Remove duplicates and take the most complete phone number
     if phone_matches:
@@ -958,51 +754,18 @@ def analyze_contact_information(content: str) -> Dict[str, Any]:
         phone_matches.sort(key=len, reverse=True)
         found_contacts['phone'] = phone_matches
     
-    # Process essential contact types
-    for contact_type, contact_data in contact_requirements.get('essential', {}).items():
-        if contact_type == 'phone' and 'phone' in found_contacts:
+    # Process essential, recommended and optional contact types from config
+    for tier, contact_type, patterns, weight in get_contact_checks(config_loader.config_mtime('ats_scoring')):
+        if tier == 'essential' and contact_type == 'phone' and 'phone' in found_contacts:
             # Use enhanced phone extraction results
             matches = found_contacts['phone']
         else:
-            patterns = contact_data.get('patterns', [])
-            weight = contact_data.get('weight', 3)
-            
             matches = []
             for pattern in patterns:
-                pattern_matches = re.findall(pattern, content, re.IGNORECASE)
-                matches.extend(pattern_matches)
+                matches.extend(pattern.findall(content))
             
             found_contacts[contact_type] = matches
         
-        if matches:
-            weight = contact_data.get('weight', 3)
-            score += weight
-    
-    # Process recommended contact types
-    for contact_type, contact_data in contact_requirements.get('recommended', {}).items():
-        patterns = contact_data.get('patterns', [])
-        weight = contact_data.get('weight', 2)
-        
-        matches = []
-        for pattern in patterns:
-            pattern_matches = re.findall(pattern, content, re.IGNORECASE)
-            matches.extend(pattern_matches)
-        
-        found_contacts[contact_type] = matches
-        if matches:
-            score += weight
-    
-    # Process optional contact types
-    for contact_type, contact_data in contact_requirements.get('optional', {}).items():
-        patterns = contact_data.get('patterns', [])
-        weight = contact_data.get('weight', 1)
-        
-        matches = []
-        for pattern in patterns:
-            pattern_matches = re.findall(pattern, content, re.IGNORECASE)
-            matches.extend(pattern_matches)
-        
-        found_contacts[contact_type] = matches
         if matches:
             score += weight
     
@@ -1012,32 +775,52 @@ def analyze_contact_information(content: str) -> Dict[str, Any]:
         'missing': [k for k, v in found_contacts.items() if not v]
     }
 
-def analyze_formatting_quality(content: str) -> Dict[str, Any]:
+# Formatting issues that hurt ATS parsing: check name -> message, in report order
+FORMATTING_CHECKS = {
+    'excessive_whitespace': 'Excessive whitespace detected',
+    'special_characters': 'Unusual special characters found',
+    'inconsistent_spacing': 'Inconsistent paragraph spacing',
+    'tab_characters': 'Tab characters detected (use spaces instead)',
+    'mixed_date_formats': 'Mixed date formats'
+}
+# One scan finds every whitespace run worth inspecting (2+ chars, or a lone tab) and every
+# unusual character. A run counts once as excessive at 4+ chars and once as inconsistent
+# spacing with 3+ newlines, plus once per tab it contains
+FORMATTING_SCAN_PATTERN = re.compile(r'(?P<space>\s{2,}|\t)|(?P<special>[^\w\s\-\.,@():/])')
+# Spans lines of arbitrary text, so it keeps its own pass
+MIXED_DATE_FORMATS_PATTERN = compile_linear(r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}.*\d{4}[/-]\d{1,2}[/-]\d{1,2}')
+# Any bullet glyph; search stops at the first one
+BULLET_CHAR_PATTERN = re.compile(r'[•◦▪\-*]')
+
+def analyze_formatting_quality(scan: ScanResult) -> Dict[str, Any]:
     """Analyze formatting and ATS readability - More stringent scoring"""
+    content = scan.content
     score = 15  # Start with lower baseline, deduct for issues
     issues = []
     
-    # Check for formatting issues that hurt ATS parsing
-    formatting_checks = {
-        'excessive_whitespace': (r'\s{4,}', 'Excessive whitespace detected'),
-        'special_characters': (r'[^\w\s\-\.,@():/]', 'Unusual special characters found'),
-        'inconsistent_spacing': (r'\n\s*\n\s*\n', 'Inconsistent paragraph spacing'),
-        'tab_characters': (r'\t', 'Tab characters detected (use spaces instead)'),
-        'mixed_date_formats': (r'\d{1,2}[/-]\d{1,2}[/-]\d{2,4}.*\d{4}[/-]\d{1,2}[/-]\d{1,2}', 'Mixed date formats')
-    }
+    counts = Counter()
+    for match in FORMATTING_SCAN_PATTERN.finditer(content):
+        if match.lastgroup == 'special':
+            counts['special_characters'] += 1
+            continue
+        run = match.group()
+        if len(run) >= 4:
+            counts['excessive_whitespace'] += 1
+        if run.count('\n') >= 3:
+            counts['inconsistent_spacing'] += 1
+        counts['tab_characters'] += run.count('\t')
+    counts['mixed_date_formats'] = len(MIXED_DATE_FORMATS_PATTERN.findall(content))
     
-    for check_name, (pattern, message) in formatting_checks.items():
-        matches = re.findall(pattern, content)
-        if matches:
-            count = len(matches)
+    # Check for formatting issues that hurt ATS parsing
+    for check_name, message in FORMATTING_CHECKS.items():
+        count = counts[check_name]
+        if count:
             deduction = min(count, 5)  # Max 5 points deduction per issue type
             score -= deduction
             issues.append(f"{message} ({count} instances)")
     
     # Check for proper bullet points
-    bullet_patterns = ['•', '◦', '▪', '-', '*']
-    has_bullets = any(bullet in content for bullet in bullet_patterns)
-    if not has_bullets:
+    if not BULLET_CHAR_PATTERN.search(content):
         score -= 3
         issues.append("No bullet points detected - consider using bullets for lists")
     
@@ -1046,50 +829,76 @@ def analyze_formatting_quality(content: str) -> Dict[str, Any]:
         'issues': issues
     }
 
-def analyze_quantified_achievements(content: str) -> Dict[str, Any]:
-    """Look for quantified achievements with numbers and percentages using config patterns"""
-    quantified_achievements = []
-    
-    # Load quantification patterns from config
+@lru_cache(maxsize=1)
+def get_compiled_quantification_patterns(config_mtime: int) -> List[re.Pattern]:
+    """Quantification patterns from config compiled once, rebuilt only when the config file changes"""
     quantification_patterns = config_loader.get_quantification_patterns()
     
     # Combine all pattern types
-    all_patterns = []
-    for pattern_type, patterns in quantification_patterns.items():
-        all_patterns.extend(patterns)
+    all_patterns = [pattern for patterns in quantification_patterns.values() for pattern in patterns]
     
     # Fallback to hardcoded patterns if config is empty
-    if not all_patterns:
-        all_patterns = [
-            r'\b\d+%\b',  # Percentages
-            r'\$\d+[,\d]*(?:\.\d{2})?\b',  # Dollar amounts
-            r'\b\d+[,\d]*\s*(?:million|thousand|billion|k)\b',  # Large numbers
-            r'\b\d+\s*(?:years?|months?|weeks?|days?)\b',  # Time periods
-            r'\b\d+\s*(?:people|employees|team members|clients|customers|users)\b',  # Team/user sizes
-            r'\b\d+[,\d]*\s*(?:projects?|initiatives?|campaigns?|deals?)\b',  # Project counts
-            r'\b(?:increased|decreased|improved|reduced|grew|generated)\s+.*?\d+[%\d]*\b'  # Performance metrics
-        ]
+    return [compile_linear(pattern, re.IGNORECASE) for pattern in all_patterns or QUANTIFIED_PATTERNS]
+
+FIRST_NUMBER_PATTERN = re.compile(r'\d+')
+
+def analyze_quantified_achievements(scan: ScanResult) -> Dict[str, Any]:
+    """Look for quantified achievements with numbers and percentages using config patterns"""
+    content = scan.content
     
+    # Load quantification patterns from config
+    all_patterns = get_compiled_quantification_patterns(config_loader.config_mtime('professional_language'))
+    
+    # Each pattern scans on its own: in one alternation the leftmost alternative wins, so
+    # '$2,000,000' would match as '$2' and then a stray '000,000'
+    matches = []
     for pattern in all_patterns:
-        matches = re.finditer(pattern, content, re.IGNORECASE)
-        for match in matches:
+        for match in pattern.finditer(content):
             # Get surrounding context (20 chars before and after)
             start = max(0, match.start() - 20)
             end = min(len(content), match.end() + 20)
             context = content[start:end].replace('\n', ' ').strip()
             
-            quantified_achievements.append({
+            matches.append((match.start(), match.end(), {
                 'match': match.group(),
                 'context': context
-            })
-    
-    # Remove duplicates based on context similarity
+            }))
+    
+    # A figure matched by several patterns ('$2' and '2,000,000' in '$2,000,000') counts once:
+    # the longest match claims its span and overlapping shorter matches are dropped. Claimed
+    # spans never overlap, so only the neighbours around the insertion point need checking
+    claimed_starts = []
+    claimed_ends = []
+    kept = []
+    for index in sorted(range(len(matches)), key=lambda i: matches[i][0] - matches[i][1]):
+        start, end, _ = matches[index]
+        position = bisect_left(claimed_starts, start)
+        if position > 0 and claimed_ends[position - 1] > start:
+            continue
+        if position < len(claimed_starts) and claimed_starts[position] < end:
+            continue
+        claimed_starts.insert(position, start)
+        claimed_ends.insert(position, end)
+        kept.append(index)
+    quantified_achievements = [matches[index][2] for index in sorted(kept)]
+    
+    # Remove duplicates based on context similarity. Exact repeats are a set lookup; overlapping
+    # contexts come from patterns matching the same figure, so containment is only checked
+    # against achievements quoting the same number
     unique_achievements = []
+    seen_contexts = set()
+    contexts_by_number = {}
     for achievement in quantified_achievements:
-        if not any(achievement['context'] in existing['context'] or 
-                  existing['context'] in achievement['context'] 
-                  for existing in unique_achievements):
-            unique_achievements.append(achievement)
+        context = achievement['context']
+        if context in seen_contexts:
+            continue
+        number = FIRST_NUMBER_PATTERN.search(achievement['match'])
+        bucket = contexts_by_number.setdefault(number.group() if number else achievement['match'], [])
+        if any(context in existing or existing in context for existing in bucket):
+            continue
+        seen_contexts.add(context)
+        bucket.append(context)
+        unique_achievements.append(achievement)
     
     score = min(len(unique_achievements) * 2, 10)  # 2 points per achievement, max 10
     
@@ -1099,6 +908,22 @@ def analyze_quantified_achievements(content: str) -> Dict[str, Any]:
         'achievements': unique_achievements[:5]  # First 5 examples
     }
 
+@lru_cache(maxsize=1)
+def get_compiled_grammar_patterns(config_mtime: int) -> List[Tuple[re.Pattern, Dict[str, str]]]:
+    """Grammar patterns from config compiled once, rebuilt only when the config file changes"""
+    return [(compile_linear(pattern_data['pattern'], re.IGNORECASE), pattern_data)
+            for pattern_data in get_grammar_patterns()]
+
+@lru_cache(maxsize=1)
+def get_cached_spelling_corrections(config_mtime: int) -> Dict[str, str]:
+    """Flattened spelling corrections, rebuilt only when the config file changes"""
+    return get_spelling_corrections()
+
+@lru_cache(maxsize=1)
+def get_misspelled_words(config_mtime: int) -> frozenset:
+    """Every word with a configured correction, for a set intersection against the resume's words"""
+    return frozenset(get_cached_spelling_corrections(config_mtime))
+
 def check_grammar_issues(content: str) -> List[Dict[str, str]]:
     """
     Check for common grammar issues in resume content using config patterns
@@ -1106,13 +931,12 @@ def check_grammar_issues(content: str) -> List[Dict[str, str]]:
     grammar_issues = []
     
     # Load grammar patterns from config
-    grammar_patterns = get_grammar_patterns()
+    grammar_patterns = get_compiled_grammar_patterns(config_loader.config_mtime('language_quality'))
     
-    for pattern_data in grammar_patterns:
-        pattern = pattern_data['pattern']
+    for pattern, pattern_data in grammar_patterns:
         message = pattern_data['message']
         
-        matches = re.finditer(pattern, content, re.IGNORECASE)
+        matches = pattern.finditer(content)
         for match in matches:
             grammar_issues.append({
                 'type': 'grammar',
@@ -1130,19 +954,24 @@ def check_grammar_issues(content: str) -> List[Dict[str, str]]:
     
     return grammar_issues
 
-def check_spelling_issues(content: str) -> List[Dict[str, str]]:
+def check_spelling_issues(scan: ScanResult) -> List[Dict[str, str]]:
     """
     Check for common spelling issues in resume content using config corrections
     """
     spelling_issues = []
     
     # Load spelling corrections from config
-    spelling_corrections = get_spelling_corrections()
+    config_mtime = config_loader.config_mtime('language_quality')
+    spelling_corrections = get_cached_spelling_corrections(config_mtime)
     
-    # Check for each misspelling
-    words = re.findall(r'\b\w+\b', content.lower())
-    for word in words:
-        if word in spelling_corrections:
+    # Most resumes have no known misspelling - one set intersection settles that
+    misspelled = scan.word_set & get_misspelled_words(config_mtime)
+    if not misspelled:
+        return spelling_issues
+    
+    # Report hits in document order, repeats included
+    for word in WORD_PATTERN.findall(scan.content_lower):
+        if word in misspelled:
             spelling_issues.append({
                 'type': 'spelling',
                 'incorrect': word,
@@ -1155,25 +984,34 @@ def check_spelling_issues(content: str) -> List[Dict[str, str]]:
     
     return spelling_issues
 
-def analyze_readability_and_length(content: str) -> Dict[str, Any]:
+@lru_cache(maxsize=1)
+def get_readability_thresholds(config_mtime: int) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """Optimal word count and sentence length bounds, rebuilt only when the config file changes"""
+    readability_metrics = config_loader.get_readability_metrics()
+    optimal_word_count = readability_metrics.get('optimal_word_count', {
+        'min': 300, 'max': 800, 'ideal_min': 400, 'ideal_max': 600
+    })
+    optimal_sentence_length = readability_metrics.get('optimal_sentence_length', {
+        'min': 10, 'max': 20, 'ideal': 15
+    })
+    return optimal_word_count, optimal_sentence_length
+
+def analyze_readability_and_length(scan: ScanResult) -> Dict[str, Any]:
     """
     Analyze content readability, optimal length, grammar, and spelling using config thresholds - MAX 10 POINTS to match config weights
     """
-    word_count = len(content.split())
-    char_count = len(content)
-    sentence_count = len(re.findall(r'[.!?]+', content))
+    word_count = scan.word_count
+    char_count = len(scan.content)
+    sentence_count = scan.sentence_count
     
     # Grammar and spelling analysis
-    grammar_issues = check_grammar_issues(content)
-    spelling_issues = check_spelling_issues(content)
+    grammar_issues = check_grammar_issues(scan.content)
+    spelling_issues = check_spelling_issues(scan)
     
-    # Load readability metrics from config
-    readability_metrics = config_loader.get_readability_metrics()
+    # Load readability thresholds from config
+    optimal_word_count, optimal_sentence_length = get_readability_thresholds(config_loader.config_mtime('language_quality'))
     
     # Optimal word count scoring using config thresholds
-    optimal_word_count = readability_metrics.get('optimal_word_count', {
-        'min': 300, 'max': 800, 'ideal_min': 400, 'ideal_max': 600
-    })
     
     length_score = 0
     length_feedback = ""
@@ -1195,10 +1033,6 @@ def analyze_readability_and_length(content: str) -> Dict[str, Any]:
     avg_sentence_length = word_count / max(sentence_count, 1)
     
     # Readability scoring using config
-    optimal_sentence_length = readability_metrics.get('optimal_sentence_length', {
-        'min': 10, 'max': 20, 'ideal': 15
-    })
-    
     readability_score = 0
     if optimal_sentence_length['min'] <= avg_sentence_length <= optimal_sentence_length['max']:
         readability_score = 3
@@ -1274,7 +1108,19 @@ def analyze_readability_and_length(content: str) -> Dict[str, Any]:
         'readability_level': 'Excellent' if scaled_score >= 8.5 else 'Good' if scaled_score >= 6.5 else 'Needs Improvement'
     }
 
-def analyze_date_formatting(content: str) -> Dict[str, Any]:
+# More precise date patterns with year validation, used by analyze_date_formatting
+DATE_FORMAT_PATTERNS = [
+    (re.compile(r'\b(0[1-9]|1[0-2])/(19[9-9][0-9]|20[0-3][0-9])\b', re.IGNORECASE), 'MM/YYYY'),           # MM/YYYY format
+    (re.compile(r'\b([1-9])/(19[9-9][0-9]|20[0-3][0-9])\b', re.IGNORECASE), 'M/YYYY'),                     # M/YYYY format  
+    (re.compile(r'\b(0[1-9]|1[0-2])-(19[9-9][0-9]|20[0-3][0-9])\b', re.IGNORECASE), 'MM-YYYY'),           # MM-YYYY format
+    (re.compile(r'\b([1-9])-(19[9-9][0-9]|20[0-3][0-9])\b', re.IGNORECASE), 'M-YYYY'),                     # M-YYYY format
+    (re.compile(r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+(19[9-9][0-9]|20[0-3][0-9])\b', re.IGNORECASE), 'Month YYYY'),  # Month YYYY
+    (re.compile(r'\b(19[9-9][0-9]|20[0-3][0-9])\s*[-–]\s*(19[9-9][0-9]|20[0-3][0-9])\b', re.IGNORECASE), 'YYYY-YYYY'),  # YYYY-YYYY format
+    (re.compile(r'\b(19[9-9][0-9]|20[0-3][0-9])\s*[-–]\s*(Present|Ongoing|Current)\b', re.IGNORECASE), 'YYYY-Present'),  # YYYY - Present
+    (re.compile(r'\b(19[9-9][0-9]|20[0-3][0-9])\s+(to|through)\s+(19[9-9][0-9]|20[0-3][0-9])\b', re.IGNORECASE), 'YYYY to YYYY'),  # YYYY to YYYY
+]
+
+def analyze_date_formatting(scan: ScanResult) -> Dict[str, Any]:
     """
     Analyze date formatting consistency in work experience and education sections
     Returns score out of 10 points
@@ -1283,36 +1129,23 @@ def analyze_date_formatting(content: str) -> Dict[str, Any]:
     issues = []
     
     # Extract relevant sections only (Experience, Education, Projects)
-    relevant_content = extract_relevant_sections_for_dates(content)
-    
-    # More precise date patterns with year validation
-    date_patterns = [
-        (r'\b(0[1-9]|1[0-2])/(19[9-9][0-9]|20[0-3][0-9])\b', 'MM/YYYY'),           # MM/YYYY format
-        (r'\b([1-9])/(19[9-9][0-9]|20[0-3][0-9])\b', 'M/YYYY'),                     # M/YYYY format  
-        (r'\b(0[1-9]|1[0-2])-(19[9-9][0-9]|20[0-3][0-9])\b', 'MM-YYYY'),           # MM-YYYY format
-        (r'\b([1-9])-(19[9-9][0-9]|20[0-3][0-9])\b', 'M-YYYY'),                     # M-YYYY format
-        (r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+(19[9-9][0-9]|20[0-3][0-9])\b', 'Month YYYY'),  # Month YYYY
-        (r'\b(19[9-9][0-9]|20[0-3][0-9])\s*[-–]\s*(19[9-9][0-9]|20[0-3][0-9])\b', 'YYYY-YYYY'),  # YYYY-YYYY format
-        (r'\b(19[9-9][0-9]|20[0-3][0-9])\s*[-–]\s*(Present|Ongoing|Current)\b', 'YYYY-Present'),  # YYYY - Present
-        (r'\b(19[9-9][0-9]|20[0-3][0-9])\s+(to|through)\s+(19[9-9][0-9]|20[0-3][0-9])\b', 'YYYY to YYYY'),  # YYYY to YYYY
-    ]
+    relevant_content = extract_relevant_sections_for_dates(scan.lines, scan.lines_lower)
+    # Contact words located once; each date then checks its window with a binary search
+    contact_spans = find_contact_indicator_spans(relevant_content.lower())
     
     # Find all dates and track which format they use
     all_dates = []
     format_types = []
     format_names = []
     
-    for i, (pattern, format_name) in enumerate(date_patterns):
-        matches = re.findall(pattern, relevant_content, re.IGNORECASE)
-        for match in matches:
-            # Extract the actual date string (handle tuple matches)
-            if isinstance(match, tuple):
-                date_str = match[0] if format_name in ['MM/YYYY', 'M/YYYY', 'MM-YYYY', 'M-YYYY'] else ' '.join(match)
-            else:
-                date_str = match
+    for i, (pattern, format_name) in enumerate(DATE_FORMAT_PATTERNS):
+        for match in pattern.finditer(relevant_content):
+            # Extract the actual date string from the groups
+            groups = match.groups()
+            date_str = groups[0] if format_name in ['MM/YYYY', 'M/YYYY', 'MM-YYYY', 'M-YYYY'] else ' '.join(groups)
             
             # Additional validation to avoid false positives
-            if is_valid_employment_date(date_str, relevant_content):
+            if is_valid_employment_date(date_str, match.start(), match.end(), contact_spans):
                 all_dates.append(date_str.strip())
                 format_types.append(i)
                 format_names.append(format_name)
@@ -1387,44 +1220,46 @@ def analyze_date_formatting(content: str) -> Dict[str, Any]:
         'issues': issues
     }
 
-def extract_relevant_sections_for_dates(content: str) -> str:
+# Section header keywords for date analysis: experience, education and project sections are
+# relevant; headers that often carry false positive dates exclude their section
+DATE_SECTION_KEYWORDS = {
+    'relevant': (
+        'experience', 'employment', 'work history', 'professional', 'career',
+        'positions', 'roles', 'jobs', 'internship', 'intern',
+        'education', 'academic', 'degree', 'university', 'college', 'school',
+        'certification', 'training', 'course',
+        'projects', 'portfolio', 'achievements'
+    ),
+    'exclude': (
+        'contact', 'personal', 'address', 'phone', 'email', 'references',
+        'skills', 'technologies', 'languages', 'hobbies', 'interests'
+    )
+}
+DATE_SECTION_AUTOMATON = build_keyword_class_automaton(DATE_SECTION_KEYWORDS)
+
+def extract_relevant_sections_for_dates(lines: List[str], lines_lower: List[str]) -> str:
     """
-    Extract only sections where employment/education dates should appear
+    Extract only sections where employment/education dates should appear,
+    given the resume's lines and their lowercase copies
     """
-    lines = content.split('\n')
     relevant_lines = []
     current_section = ""
     include_section = False
     
-    # Keywords that indicate relevant sections
-    experience_keywords = [
-        'experience', 'employment', 'work history', 'professional', 'career',
-        'positions', 'roles', 'jobs', 'internship', 'intern'
-    ]
-    education_keywords = [
-        'education', 'academic', 'degree', 'university', 'college', 'school',
-        'certification', 'training', 'course'
-    ]
-    project_keywords = ['projects', 'portfolio', 'achievements']
-    
-    # Headers to exclude (these often contain false positive dates)
-    exclude_keywords = [
-        'contact', 'personal', 'address', 'phone', 'email', 'references',
-        'skills', 'technologies', 'languages', 'hobbies', 'interests'
-    ]
-    
-    for line in lines:
-        line_lower = line.lower().strip()
+    for line, line_lower in zip(lines, lines_lower):
+        line_lower = line_lower.strip()
+        if not line_lower:
+            if include_section:
+                relevant_lines.append(line)
+            continue
+        
+        header_classes = find_keyword_classes(line_lower, DATE_SECTION_KEYWORDS, DATE_SECTION_AUTOMATON)
         
         # Check if this is a section header
-        if len(line_lower) > 0 and (line.isupper() or line.strip().endswith(':') or 
-            any(keyword in line_lower for keyword in experience_keywords + education_keywords + project_keywords + exclude_keywords)):
+        if line.isupper() or line.strip().endswith(':') or header_classes:
             
             # Determine if we should include this section
-            include_section = (
-                any(keyword in line_lower for keyword in experience_keywords + education_keywords + project_keywords) and
-                not any(keyword in line_lower for keyword in exclude_keywords)
-            )
+            include_section = header_classes == {'relevant'}
             current_section = line_lower
             
         # Include the line if we're in a relevant section
@@ -1435,23 +1270,29 @@ def extract_relevant_sections_for_dates(content: str) -> str:
     logger.info(f"🗓️ Extracted {len(relevant_content)} characters from relevant sections for date analysis")
     return relevant_content
 
-def is_valid_employment_date(date_str: str, context: str) -> bool:
+# Words that mark contact details - dates next to them are usually phone numbers or addresses
+CONTACT_INDICATOR_PATTERNS = [re.compile(indicator) for indicator in ('phone', 'tel', 'mobile', 'address', 'email', 'linkedin')]
+
+def find_contact_indicator_spans(text_lower: str) -> Tuple[List[int], List[int]]:
+    """Start and end offsets of every contact indicator in the text, sorted by start"""
+    spans = sorted((match.start(), match.end())
+                   for pattern in CONTACT_INDICATOR_PATTERNS for match in pattern.finditer(text_lower))
+    return [start for start, _ in spans], [end for _, end in spans]
+
+def is_valid_employment_date(date_str: str, date_start: int, date_end: int,
+                             contact_spans: Tuple[List[int], List[int]]) -> bool:
     """
-    Additional validation to ensure the matched pattern is actually an employment date
+    Additional validation to ensure the matched pattern is actually an employment date,
+    given where it was matched and the contact indicator spans of the same text
     """
-    # Skip if it appears to be in contact information context
-    contact_indicators = ['phone', 'tel', 'mobile', 'address', 'email', 'linkedin']
-    context_lower = context.lower()
-    
-    # Check surrounding context for phone/address patterns
-    date_index = context_lower.find(date_str.lower())
-    if date_index != -1:
-        # Check 50 characters before and after the date
-        start = max(0, date_index - 50)
-        end = min(len(context_lower), date_index + len(date_str) + 50)
-        surrounding_text = context_lower[start:end]
-        
-        if any(indicator in surrounding_text for indicator in contact_indicators):
+    # Skip if a contact indicator lies within 50 characters before or after the date
+    window_start = date_start - 50
+    window_end = date_end + 50
+    starts, ends = contact_spans
+    for index in range(bisect_left(starts, window_start), len(starts)):
+        if starts[index] >= window_end:
+            break
+        if ends[index] <= window_end:
             return False
     
     # Skip obvious phone number patterns
@@ -1507,7 +1348,7 @@ def extract_position_entries(content: str) -> List[str]:
     
     return meaningful_entries
 
-def analyze_bullet_lengths(content: str) -> Dict[str, Any]:
+def analyze_bullet_lengths(scan: ScanResult) -> Dict[str, Any]:
     """
     Analyze bullet point length optimization in Experience section only
     Returns score out of 10 points
@@ -1515,10 +1356,10 @@ def analyze_bullet_lengths(content: str) -> Dict[str, Any]:
     score = 10  # Start with perfect score
     issues = []
     
-    # Extract only Experience section content
-    experience_content = extract_experience_section(content)
+    # Extract only Experience section lines
+    experience_lines = extract_experience_section(scan.lines, scan.lines_lower)
     
-    if not experience_content:
+    if not experience_lines:
         return {
             'score': 5,  # Neutral score if no experience section found
             'total_bullets': 0,
@@ -1526,7 +1367,7 @@ def analyze_bullet_lengths(content: str) -> Dict[str, Any]:
         }
     
     # Find actual bullet points (sentence-like content in experience)
-    all_bullets = extract_experience_bullets(experience_content)
+    all_bullets = extract_bullets_from_lines(experience_lines)
     
     if not all_bullets:
         return {
@@ -1535,29 +1376,17 @@ def analyze_bullet_lengths(content: str) -> Dict[str, Any]:
             'issues': ['No bullet points detected in Experience section']
         }
     
-    # Analyze each bullet point
-    non_optimal_count = 0
-    too_short = 0    # < 10 words
-    optimal = 0      # 10-30 words  
-    too_long = 0     # > 30 words
+    # Word count per bullet: runs of word characters, so punctuation never counts as a word
+    word_counts = [len(WORD_PATTERN.findall(bullet)) for bullet in all_bullets]
     
     logger.info(f"🔫 Found {len(all_bullets)} bullets in Experience section:")
-    
-    for i, bullet in enumerate(all_bullets):
-        # Clean bullet text and count words
-        clean_bullet = re.sub(r'[^\w\s]', ' ', bullet)
-        word_count = len([word for word in clean_bullet.split() if word.strip()])
-        
+    for i, (bullet, word_count) in enumerate(zip(all_bullets, word_counts)):
         logger.info(f"🔫 Bullet {i+1}: '{bullet[:50]}...' ({word_count} words)")
-        
-        if word_count < 10:
-            too_short += 1
-            non_optimal_count += 1
-        elif word_count <= 30:
-            optimal += 1
-        else:
-            too_long += 1
-            non_optimal_count += 1
+    
+    too_short = sum(word_count < 10 for word_count in word_counts)   # < 10 words
+    too_long = sum(word_count > 30 for word_count in word_counts)    # > 30 words
+    optimal = len(word_counts) - too_short - too_long                # 10-30 words
+    non_optimal_count = too_short + too_long
     
     total_bullets = len(all_bullets)
     
@@ -1585,38 +1414,39 @@ def analyze_bullet_lengths(content: str) -> Dict[str, Any]:
         'issues': issues
     }
 
-def extract_experience_section(content: str) -> str:
-    """
-    Extract only the Experience/Work History section content
-    """
-    lines = content.split('\n')
-    experience_lines = []
-    in_experience = False
-    
-    # Keywords that indicate experience section start
-    experience_keywords = [
+# Header keywords that start the experience section, and those of sections that end it
+EXPERIENCE_SECTION_KEYWORDS = {
+    'experience': (
         'experience', 'employment', 'work history', 'professional experience',
         'career history', 'work experience', 'professional background'
-    ]
-    
-    # Keywords that indicate other sections (end experience)
-    other_section_keywords = [
+    ),
+    'other': (
         'education', 'skills', 'certifications', 'projects', 'achievements',
         'languages', 'interests', 'references', 'contact', 'summary',
         'objective', 'profile', 'training', 'awards', 'publications'
-    ]
+    )
+}
+EXPERIENCE_SECTION_AUTOMATON = build_keyword_class_automaton(EXPERIENCE_SECTION_KEYWORDS)
+
+def extract_experience_section(lines: List[str], lines_lower: List[str]) -> List[str]:
+    """
+    Extract only the Experience/Work History section's non-empty lines (stripped),
+    given the resume's lines and their lowercase copies
+    """
+    experience_lines = []
+    in_experience = False
     
-    for line in lines:
+    for line, line_lower in zip(lines, lines_lower):
         line_stripped = line.strip()
-        line_lower = line_stripped.lower()
+        header_classes = find_keyword_classes(line_lower, EXPERIENCE_SECTION_KEYWORDS, EXPERIENCE_SECTION_AUTOMATON)
         
         # Check if this is an experience section header
-        if any(keyword in line_lower for keyword in experience_keywords):
+        if 'experience' in header_classes:
             in_experience = True
             continue
             
         # Check if this is a different section header
-        elif in_experience and any(keyword in line_lower for keyword in other_section_keywords):
+        elif in_experience and 'other' in header_classes:
             in_experience = False
             break
             
@@ -1624,108 +1454,71 @@ def extract_experience_section(content: str) -> str:
         if in_experience and line_stripped:
             experience_lines.append(line_stripped)
     
-    experience_content = '\n'.join(experience_lines)
-    logger.info(f"🔫 Extracted {len(experience_content)} characters from Experience section")
-    return experience_content
+    logger.info(f"🔫 Extracted {len(experience_lines)} lines from Experience section")
+    return experience_lines
+
+# Line filters for extract_bullets_from_lines
+# Glyphs that may open a bullet line - only the first one is stripped
+BULLET_PREFIX_CHARS = frozenset('•-*o▪→')
+# Dates, job titles and company names in one case-insensitive alternation - a line matching
+# any alternative is not a bullet. Runs on RE2 when installed (all literal ASCII word lists)
+NON_BULLET_PATTERN = compile_linear(
+    r'(?P<date_range>^[a-zA-Z]*\s*\d{4}[\s\-–]+[a-zA-Z]*\s*\d{4}$)'  # Lines that are mostly dates
+    r'|(?P<date_tail>(?:present|current|ongoing)$)'  # Lines ending with an open-ended date
+    r'|(?P<seniority>^(?:senior|junior|lead|principal|chief|head of|director of|manager|associate|assistant))'
+    r'|(?P<role>(?:engineer|developer|analyst|specialist|coordinator|consultant|executive)$)'
+    r'|(?P<company>\b(?:inc|llc|co(?:rp|mpany)|ltd|technologies|s(?:olutions|ystems))\b)',  # Inc, LLC, Corp, etc.
+    re.IGNORECASE
+)
+
+# Common verb patterns or connecting words that mark a line as sentence-like
+ACTION_INDICATOR_WORDS = frozenset({
+    'developed', 'created', 'managed', 'led', 'implemented', 'designed',
+    'built', 'achieved', 'improved', 'increased', 'reduced', 'collaborated',
+    'worked', 'responsible', 'coordinated', 'analyzed', 'maintained',
+    'supported', 'delivered', 'executed', 'planned', 'optimized',
+    'and', 'with', 'for', 'by', 'using', 'through', 'to', 'of', 'in'
+})
 
-def extract_experience_bullets(experience_content: str) -> List[str]:
+def extract_bullets_from_lines(lines: List[str]) -> List[str]:
     """
-    Extract actual bullet points from experience section
+    Extract actual bullet points from the experience section's lines
     Excludes job titles, company names, dates, and single words
     """
-    lines = experience_content.split('\n')
     bullets = []
     
     for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-            
         # Remove bullet symbols if present
-        clean_line = re.sub(r'^\s*[•\-\*o▪→]\s*', '', line).strip()
+        clean_line = line.strip()
+        if clean_line and clean_line[0] in BULLET_PREFIX_CHARS:
+            clean_line = clean_line[1:].lstrip()
         
-        # Skip if line is too short to be a sentence
-        if len(clean_line) < 15:  # At least 15 characters for a meaningful sentence
+        # Skip if line is too short to be a sentence (at least 20 characters)
+        if len(clean_line) < 20:
+            continue
+            
+        # Skip lines that are all caps (likely section headers or company names)
+        if clean_line.isupper():
             continue
             
-        # Skip obvious non-bullets
-        if is_non_bullet_line(clean_line):
+        # Must be sentence-like (at least 4 words with some complexity) - lowercased once for
+        # both the word count and the action-word lookup
+        words = clean_line.lower().split()
+        if len(words) < 4:
             continue
             
-        # Must be sentence-like (at least 3 words with some complexity)
-        words = clean_line.split()
-        if len(words) < 3:
+        # Should contain some action words or descriptive content - matched as whole words so
+        # 'to' no longer hits 'stop'
+        if ACTION_INDICATOR_WORDS.isdisjoint(word.strip('.,;:()[]{}') for word in words):
             continue
             
-        # Check if it looks like a sentence (has some complexity)
-        if is_sentence_like(clean_line):
+        # Skip dates, obvious job titles and company names - the regex runs last, only on
+        # lines the cheap checks above let through
+        if NON_BULLET_PATTERN.search(clean_line) is None:
             bullets.append(clean_line)
     
     return bullets
 
-def is_non_bullet_line(line: str) -> bool:
-    """
-    Check if a line is NOT a bullet point (job title, company, date, etc.)
-    """
-    line_lower = line.lower().strip()
-    
-    # Skip lines that are all caps (likely section headers or company names)
-    if line.isupper() and len(line) > 3:
-        return True
-        
-    # Skip lines that are mostly dates
-    if re.match(r'^[a-zA-Z]*\s*\d{4}[\s\-–]+[a-zA-Z]*\s*\d{4}$', line.strip()):
-        return True
-        
-    # Skip lines that end with common date patterns
-    if re.search(r'(present|current|ongoing)$', line_lower):
-        return True
-        
-    # Skip obvious job titles (often followed by dates or at company)
-    job_title_patterns = [
-        r'^(senior|junior|lead|principal|chief|head of|director of|manager|associate|assistant)',
-        r'(engineer|developer|analyst|specialist|coordinator|consultant|executive)$',
-        r'^[A-Z][a-z]+ [A-Z][a-z]+$'  # Title Case words (likely job titles)
-    ]
-    
-    for pattern in job_title_patterns:
-        if re.search(pattern, line, re.IGNORECASE):
-            return True
-            
-    # Skip company names (often have Inc, LLC, Corp, etc.)
-    if re.search(r'\b(inc|llc|corp|ltd|company|technologies|solutions|systems)\b', line_lower):
-        return True
-        
-    return False
-
-def is_sentence_like(line: str) -> bool:
-    """
-    Check if a line looks like a sentence (has verbs, complexity)
-    """
-    words = line.split()
-    
-    # Must have at least 4 words to be considered sentence-like
-    if len(words) < 4:
-        return False
-        
-    # Should contain some action words or descriptive content
-    # Look for common verb patterns or connecting words
-    action_indicators = [
-        'developed', 'created', 'managed', 'led', 'implemented', 'designed',
-        'built', 'achieved', 'improved', 'increased', 'reduced', 'collaborated',
-        'worked', 'responsible', 'coordinated', 'analyzed', 'maintained',
-        'supported', 'delivered', 'executed', 'planned', 'optimized',
-        'and', 'with', 'for', 'by', 'using', 'through', 'to', 'of', 'in'
-    ]
-    
-    line_lower = line.lower()
-    has_action_words = any(word in line_lower for word in action_indicators)
-    
-    # Should have reasonable length and complexity
-    has_good_length = len(line) >= 20  # At least 20 characters
-    
-    return has_action_words and has_good_length
-
 # ========================================
 # FRONTEND ANALYSIS FUNCTIONS - COPIED EXACTLY FROM FRONTEND
 # ========================================
@@ -2280,7 +2073,7 @@ def extract_summary_section(resume_text: str) -> str:
         is_section_header = (
             len(line_clean) < 50 and 
             (line_clean.isupper() or 
-             sum(1 for c in line_clean if c.isupper()) / max(len(line_clean), 1) > 0.5 or
+             sum(map(str.isupper, line_clean)) / max(len(line_clean), 1) > 0.5 or
              line_clean.endswith(':'))
         )
         
@@ -3016,7 +2809,7 @@ def generate_education_examples(resume_text: str) -> list:
         ]
     
     # Extract education section content
-    education_text = ''
+    education_lines = []
     lines = resume_text.split('\n')
     in_education = False
     
@@ -3027,7 +2820,8 @@ def generate_education_examples(resume_text: str) -> list:
         elif in_education and re.search(r'experience|work|skills|projects', line, re.IGNORECASE) and len(line.strip()) < 50:
             break
         elif in_education:
-            education_text += line + ' '
+            education_lines.append(line + ' ')
+    education_text = ''.join(education_lines)
     
     examples = []
     
@@ -4524,9 +4318,11 @@ def get_enhanced_issue_description(category_name: str, score: int, resume_text:
         'issue': specific_issues[0] if specific_issues else f'Improve {category_name.lower()} presentation'
     }
 
-def generate_comprehensive_ats_scores_frontend(content: str, component_scores: dict = None, detailed_analysis: dict = None, filename: str = None) -> List[dict]:
+def generate_comprehensive_ats_scores_frontend(content: str, component_scores: dict = None, detailed_analysis: dict = None, filename: str = None,
+                                               scan: Optional[ScanResult] = None) -> List[dict]:
     """
     Generate comprehensive ATS scores for all 23+ categories - ENHANCED WITH SPECIFIC GUIDANCE
+    Reuses the caller's resume scan when given one
     """
     logger.info('🏗️ Generating comprehensive ATS scores with enhanced guidance')
     
@@ -4737,7 +4533,7 @@ def generate_comprehensive_ats_scores_frontend(content: str, component_scores: d
     })
     
     # 24. DATE FORMATTING
-    dates_score = analyze_date_formatting(resume_text)['score']
+    dates_score = analyze_date_formatting(scan if scan is not None else scan_resume(resume_text))['score']
     dates_enhancement = get_enhanced_issue_description('Dates', dates_score, resume_text)
     categories.append({
         'name': 'Dates',
@@ -4768,39 +4564,44 @@ def generate_comprehensive_ats_scores_frontend(content: str, component_scores: d
 # END FRONTEND ANALYSIS FUNCTIONS
 # ========================================
 
-def calculate_comprehensive_ats_score(content: str, job_posting: str = None, knockout_questions: List[Dict] = None, filename: str = None) -> Dict[str, Any]:
+def calculate_comprehensive_ats_score(content: str, job_posting: str = None, knockout_questions: List[Dict] = None, filename: str = None,
+                                      scan: Optional[ScanResult] = None) -> Dict[str, Any]:
     """Calculate comprehensive ATS compatibility score with penalty system"""
     
+    # Lowercase, tokenize and count keywords once; every component reads from the shared scan
+    if scan is None:
+        scan = scan_resume(content)
+    
     # Detect industry for targeted analysis
-    industry = detect_industry(content)
+    industry = detect_industry(scan)
     
     # Initialize scoring components
     components = {}
     
     # Apply configured component weights (total: 100 points)
     # 1. Content Structure Analysis (25 points)
-    components['structure'] = analyze_content_structure(content)
+    components['structure'] = analyze_content_structure(scan)
     
     # 2. Keyword Optimization (20 points)
-    components['keywords'] = analyze_keyword_optimization(content, industry)
+    components['keywords'] = analyze_keyword_optimization(scan, industry)
     
     # 3. Contact Information (15 points)
-    components['contact'] = analyze_contact_information(content)
+    components['contact'] = analyze_contact_information(scan)
     
     # 4. Formatting Quality (10 points) - REDUCED from 15
-    components['formatting'] = analyze_formatting_quality(content)
+    components['formatting'] = analyze_formatting_quality(scan)
     
     # 5. Quantified Achievements (10 points)
-    components['achievements'] = analyze_quantified_achievements(content)
+    components['achievements'] = analyze_quantified_achievements(scan)
     
     # 6. Readability and Length (10 points)
-    components['readability'] = analyze_readability_and_length(content)
+    components['readability'] = analyze_readability_and_length(scan)
     
     # 7. Date Formatting (5 points)
-    components['dates'] = analyze_date_formatting(content)
+    components['dates'] = analyze_date_formatting(scan)
     
     # 8. Bullet Lengths (5 points) - NEW
-    components['bullet_lengths'] = analyze_bullet_lengths(content)
+    components['bullet_lengths'] = analyze_bullet_lengths(scan)
     
     # Calculate base score from components
     base_score = sum(comp['score'] for comp in components.values())
@@ -4833,7 +4634,7 @@ def calculate_comprehensive_ats_score(content: str, job_posting: str = None, kno
             break
     
     # Generate comprehensive categories using frontend logic
-    comprehensive_categories = generate_comprehensive_ats_scores_frontend(content, {k: v['score'] for k, v in components.items()}, components, filename)
+    comprehensive_categories = generate_comprehensive_ats_scores_frontend(content, {k: v['score'] for k, v in components.items()}, components, filename, scan)
     
     # Create comprehensive detailed analysis with all 23+ categories
     comprehensive_analysis = {}
@@ -5159,6 +4960,14 @@ def calculate_total_time(issues: List[Dict]) -> str:
         else:
             return f"{hours}h {remaining_minutes}m"
 
+# (min percentage, status, status_text, color), highest threshold first
+COMPONENT_STATUS_BUCKETS = (
+    (80, 'excellent', 'Excellent', 'green'),
+    (60, 'good', 'Good', 'blue'),
+    (40, 'fair', 'Needs Improvement', 'yellow'),
+    (float('-inf'), 'poor', 'Critical Issue', 'red'),
+)
+
 def enhance_component_breakdown(analysis_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Enhance component analysis with specific issues and solutions
@@ -5180,23 +4989,10 @@ def enhance_component_breakdown(analysis_data: Dict[str, Any]) -> Dict[str, Any]
         current_score = component_scores.get(component, 0)
         percentage = round((current_score / max_score) * 100)
         
-        # Determine status and specific issues
-        if percentage >= 80:
-            status = 'excellent'
-            status_text = 'Excellent'
-            color = 'green'
-        elif percentage >= 60:
-            status = 'good'
-            status_text = 'Good'
-            color = 'blue'
-        elif percentage >= 40:
-            status = 'fair'
-            status_text = 'Needs Improvement'
-            color = 'yellow'
-        else:
-            status = 'poor'
-            status_text = 'Critical Issue'
-            color = 'red'
+        # Determine status from the first bucket whose threshold is met
+        status, status_text, color = next(
+            bucket[1:] for bucket in COMPONENT_STATUS_BUCKETS if percentage >= bucket[0]
+        )
         
         # Get component-specific data
         component_data = components.get(component, {})
@@ -5215,94 +5011,116 @@ def enhance_component_breakdown(analysis_data: Dict[str, Any]) -> Dict[str, Any]
     
     return enhanced_components
 
-def get_component_specific_issues(component: str, data: Dict, current_score: int, max_score: int) -> List[str]:
-    """Get specific issues for each component"""
+def _structure_issues(data: Dict, current_score: int, max_score: int) -> List[str]:
     issues = []
-    
-    if component == 'structure':
-        missing_sections = data.get('missing_sections', [])
-        if missing_sections:
-            issues.append(f"Missing sections: {', '.join(missing_sections)}")
-        if current_score < max_score * 0.6:
-            issues.append("Poor overall resume structure and organization")
-    
-    elif component == 'keywords':
-        missing_keywords = data.get('missing_keywords', [])
-        if missing_keywords:
-            issues.append(f"Missing key industry terms: {', '.join(missing_keywords[:3])}")
-        if current_score < max_score * 0.4:
-            issues.append("Severely lacking relevant keywords for ATS optimization")
-    
-    elif component == 'contact':
-        if current_score < max_score * 0.7:
-            issues.append("Incomplete or improperly formatted contact information")
-        if current_score < max_score * 0.4:
-            issues.append("Missing essential contact details (phone, email, or location)")
-    
-    elif component == 'formatting':
-        if current_score < max_score * 0.6:
-            issues.append("ATS-incompatible formatting detected")
-            issues.append("Inconsistent font usage or spacing")
-    
-    elif component == 'achievements':
-        achievements_count = data.get('achievements_count', 0)
-        if achievements_count < 3:
-            issues.append("Insufficient quantified achievements and results")
-        if current_score < max_score * 0.5:
-            issues.append("Missing measurable impact statements")
-    
-    elif component == 'readability':
-        if current_score < max_score * 0.5:
-            issues.append("Poor readability and unclear language")
-            issues.append("Complex sentences that may confuse ATS systems")
-    
+    missing_sections = data.get('missing_sections', [])
+    if missing_sections:
+        issues.append(f"Missing sections: {', '.join(missing_sections)}")
+    if current_score < max_score * 0.6:
+        issues.append("Poor overall resume structure and organization")
+    return issues
+
+def _keywords_issues(data: Dict, current_score: int, max_score: int) -> List[str]:
+    issues = []
+    missing_keywords = data.get('missing_keywords', [])
+    if missing_keywords:
+        issues.append(f"Missing key industry terms: {', '.join(missing_keywords[:3])}")
+    if current_score < max_score * 0.4:
+        issues.append("Severely lacking relevant keywords for ATS optimization")
     return issues
 
+def _contact_issues(data: Dict, current_score: int, max_score: int) -> List[str]:
+    issues = []
+    if current_score < max_score * 0.7:
+        issues.append("Incomplete or improperly formatted contact information")
+    if current_score < max_score * 0.4:
+        issues.append("Missing essential contact details (phone, email, or location)")
+    return issues
+
+def _formatting_issues(data: Dict, current_score: int, max_score: int) -> List[str]:
+    if current_score < max_score * 0.6:
+        return ["ATS-incompatible formatting detected", "Inconsistent font usage or spacing"]
+    return []
+
+def _achievements_issues(data: Dict, current_score: int, max_score: int) -> List[str]:
+    issues = []
+    achievements_count = data.get('achievements_count', 0)
+    if achievements_count < 3:
+        issues.append("Insufficient quantified achievements and results")
+    if current_score < max_score * 0.5:
+        issues.append("Missing measurable impact statements")
+    return issues
+
+def _readability_issues(data: Dict, current_score: int, max_score: int) -> List[str]:
+    if current_score < max_score * 0.5:
+        return ["Poor readability and unclear language", "Complex sentences that may confuse ATS systems"]
+    return []
+
+# Issue builders per component, each called with (data, current_score, max_score)
+COMPONENT_ISSUE_HANDLERS = {
+    'structure': _structure_issues,
+    'keywords': _keywords_issues,
+    'contact': _contact_issues,
+    'formatting': _formatting_issues,
+    'achievements': _achievements_issues,
+    'readability': _readability_issues,
+}
+
+# Static recommendations per component
+COMPONENT_RECOMMENDATIONS = {
+    'structure': (
+        "Use standard section headers: Summary, Experience, Education, Skills",
+        "Organize content in reverse chronological order",
+    ),
+    'keywords': (
+        "Research job descriptions in your field for relevant keywords",
+        "Include both technical skills and industry buzzwords",
+        "Use keywords naturally throughout your resume",
+    ),
+    'contact': (
+        "Include: Full name, phone, professional email, LinkedIn, location",
+        "Use consistent formatting for all contact information",
+    ),
+    'formatting': (
+        "Use standard fonts (Arial, Calibri, or Times New Roman)",
+        "Maintain consistent spacing and bullet point styles",
+        "Avoid tables, images, or complex layouts",
+    ),
+    'achievements': (
+        "Quantify accomplishments with numbers, percentages, or dollar amounts",
+        "Use action verbs to start each bullet point",
+        "Focus on results and impact, not just job duties",
+    ),
+    'readability': (
+        "Use clear, concise language and shorter sentences",
+        "Avoid jargon that ATS systems might not recognize",
+        "Ensure proper grammar and spelling",
+    ),
+}
+
+def get_component_specific_issues(component: str, data: Dict, current_score: int, max_score: int) -> List[str]:
+    """Get specific issues for each component"""
+    handler = COMPONENT_ISSUE_HANDLERS.get(component)
+    if handler is None:
+        return []
+    return handler(data, current_score, max_score)
+
 def get_component_recommendations(component: str, data: Dict, current_score: int) -> List[str]:
     """Get specific recommendations for each component"""
-    recommendations = []
-    
-    if component == 'structure':
-        recommendations.append("Use standard section headers: Summary, Experience, Education, Skills")
-        recommendations.append("Organize content in reverse chronological order")
-    
-    elif component == 'keywords':
-        recommendations.append("Research job descriptions in your field for relevant keywords")
-        recommendations.append("Include both technical skills and industry buzzwords")
-        recommendations.append("Use keywords naturally throughout your resume")
-    
-    elif component == 'contact':
-        recommendations.append("Include: Full name, phone, professional email, LinkedIn, location")
-        recommendations.append("Use consistent formatting for all contact information")
-    
-    elif component == 'formatting':
-        recommendations.append("Use standard fonts (Arial, Calibri, or Times New Roman)")
-        recommendations.append("Maintain consistent spacing and bullet point styles")
-        recommendations.append("Avoid tables, images, or complex layouts")
-    
-    elif component == 'achievements':
-        recommendations.append("Quantify accomplishments with numbers, percentages, or dollar amounts")
-        recommendations.append("Use action verbs to start each bullet point")
-        recommendations.append("Focus on results and impact, not just job duties")
-    
-    elif component == 'readability':
-        recommendations.append("Use clear, concise language and shorter sentences")
-        recommendations.append("Avoid jargon that ATS systems might not recognize")
-        recommendations.append("Ensure proper grammar and spelling")
-    
-    return recommendations
+    return list(COMPONENT_RECOMMENDATIONS.get(component, ()))
+
+COMPONENT_DISPLAY_NAMES = {
+    'structure': 'Resume Structure',
+    'keywords': 'Keywords & Skills',
+    'contact': 'Contact Information',
+    'formatting': 'Formatting & Layout',
+    'achievements': 'Achievements & Impact',
+    'readability': 'Readability & Clarity'
+}
 
 def format_component_name(component: str) -> str:
     """Format component names for display"""
-    names = {
-        'structure': 'Resume Structure',
-        'keywords': 'Keywords & Skills',
-        'contact': 'Contact Information',
-        'formatting': 'Formatting & Layout',
-        'achievements': 'Achievements & Impact',
-        'readability': 'Readability & Clarity'
-    }
-    return names.get(component, component.title())
+    return COMPONENT_DISPLAY_NAMES.get(component, component.title())
 
 def generate_comprehensive_recommendations(analysis: Dict[str, Any]) -> Dict[str, Any]:
     """Generate detailed recommendations based on analysis"""
@@ -5391,25 +5209,27 @@ def generate_comprehensive_recommendations(analysis: Dict[str, Any]) -> Dict[str
         'next_steps': generate_next_steps(score, components)
     }
 
+# Next-step text for each component that can be prioritised (numbered by priority at runtime)
+NEXT_STEP_TEMPLATES = {
+    'structure': "Add missing resume sections (Experience, Education, Skills)",
+    'keywords': "Research and add industry-specific keywords",
+    'contact': "Complete your contact information including LinkedIn",
+    'formatting': "Clean up formatting and use consistent spacing",
+    'achievements': "Add quantified achievements with specific metrics",
+}
+
 def generate_next_steps(score: int, components: Dict[str, Any]) -> List[str]:
     """Generate prioritized next steps for improvement"""
-    next_steps = []
-    
-    # Prioritize based on component scores
-    low_scoring_components = [(k, v['score']) for k, v in components.items() if v['score'] < 10]
-    low_scoring_components.sort(key=lambda x: x[1])  # Sort by score, lowest first
-    
-    for component, component_score in low_scoring_components[:3]:  # Top 3 priorities
-        if component == 'structure':
-            next_steps.append("1. Add missing resume sections (Experience, Education, Skills)")
-        elif component == 'keywords':
-            next_steps.append("2. Research and add industry-specific keywords")
-        elif component == 'contact':
-            next_steps.append("3. Complete your contact information including LinkedIn")
-        elif component == 'formatting':
-            next_steps.append("4. Clean up formatting and use consistent spacing")
-        elif component == 'achievements':
-            next_steps.append("5. Add quantified achievements with specific metrics")
+    # Prioritize based on component scores - top 3 lowest scoring components
+    low_scoring_components = heapq.nsmallest(
+        3,
+        ((k, v['score']) for k, v in components.items() if v['score'] < 10),
+        key=lambda x: x[1]
+    )
+    
+    priority_steps = [NEXT_STEP_TEMPLATES[component] for component, _ in low_scoring_components
+                      if component in NEXT_STEP_TEMPLATES]
+    next_steps = [f"{i}. {step}" for i, step in enumerate(priority_steps, start=1)]
     
     if score >= 80:
         next_steps.append("Focus on fine-tuning keyword optimization and formatting")
@@ -5639,16 +5459,33 @@ def calculate_total_time(issues: list) -> str:
         else:
             return f"{hours} hour{'s' if hours > 1 else ''} {remaining_minutes} minutes"
 
-def extract_personal_information(content: str) -> Dict[str, Any]:
+# LRU cache of extracted personal information keyed by a hash of the CV text,
+# so retries and repeat uploads of the same CV skip the extractors
+PERSONAL_INFO_CACHE_SIZE = 256
+_personal_info_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+_personal_info_cache_lock = threading.Lock()
+
+def extract_personal_information(content: str, scan: Optional[ScanResult] = None) -> Dict[str, Any]:
     """
     Extract personal information from CV content for user profile
     
     Args:
         content: CV text content
+        scan: The caller's scan of the same content, if it already has one
         
     Returns:
         Dictionary containing extracted personal information
     """
+    cache_key = hashlib.blake2b(content.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+    with _personal_info_cache_lock:
+        cached_data = _personal_info_cache.get(cache_key)
+        if cached_data is not None:
+            _personal_info_cache.move_to_end(cache_key)
+    if cached_data is not None:
+        # The cached entry is a private deep copy - a shallow copy is enough for callers that
+        # set top-level fields; nested lists and dicts are shared and read-only
+        return dict(cached_data)
+    
     extracted_data = {
         'full_name': None,
         'email': None,
@@ -5666,11 +5503,14 @@ def extract_personal_information(content: str) -> Dict[str, Any]:
         'years_of_experience': None
     }
     
+    # Normalize Unicode once per document for the extractors that need it
+    normalized_content = unicodedata.normalize('NFKD', content)
+    
     # Extract name
-    extracted_data['full_name'] = extract_name(content)
+    extracted_data['full_name'] = extract_name(content, normalized_content)
     
     # Extract contact information
-    contact_info = analyze_contact_information(content)
+    contact_info = analyze_contact_information(scan if scan is not None else scan_resume(content))
     found_contacts = contact_info.get('found_contacts', {})
     
     if found_contacts.get('email'):
@@ -5712,60 +5552,55 @@ def extract_personal_information(content: str) -> Dict[str, Any]:
     # Estimate years of experience
     extracted_data['years_of_experience'] = estimate_years_of_experience(content)
     
+    # Store a private copy so callers can mutate the returned dict freely
+    cached_data = copy.deepcopy(extracted_data)
+    with _personal_info_cache_lock:
+        _personal_info_cache[cache_key] = cached_data
+        if len(_personal_info_cache) > PERSONAL_INFO_CACHE_SIZE:
+            _personal_info_cache.popitem(last=False)
+    
     return extracted_data
 
-def extract_name(content: str) -> Optional[str]:
+def extract_name(content: str, normalized_content: Optional[str] = None) -> Optional[str]:
     """Extract full name from CV content with enhanced Unicode and merged line support"""
-    import unicodedata
-    
-    # Normalize Unicode characters to handle different encodings
-    normalized_content = unicodedata.normalize('NFKD', content)
-    lines = normalized_content.split('\n')
-    logger.info(f"🔍 Name extraction - checking first lines (showing first 100 chars each):")
+    # Normalize Unicode characters to handle different encodings (skipped if caller already did)
+    if normalized_content is None:
+        normalized_content = unicodedata.normalize('NFKD', content)
+    # Only the first 10 lines are candidates, so don't split the whole document
+    lines = normalized_content.split('\n', 10)[:10]
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    if debug_enabled:
+        logger.debug("🔍 Name extraction - checking first lines (showing first 100 chars each):")
     
     # Try first non-empty line first
-    for i, line in enumerate(lines[:10]):  # Check first 10 lines
+    for i, line in enumerate(lines):  # Check first 10 lines
         line = line.strip()
-        line_preview = line[:100] + "..." if len(line) > 100 else line
-        logger.info(f"  Line {i}: '{line_preview}'")
+        if debug_enabled:
+            line_preview = line[:100] + "..." if len(line) > 100 else line
+            logger.debug("  Line %d: '%s'", i, line_preview)
         
         # If line is too long (merged PDF), try to extract name from beginning
         if len(line) > 100:
             # Enhanced regex for merged PDF lines with Unicode support
-            import re
-            # Try multiple patterns for merged lines
-            merged_patterns = [
-                r'^([A-Z][a-zA-Z\u00C0-\u017F]+\s+[A-Z][a-zA-Z\u00C0-\u017F]+(?:\s+[A-Z][a-zA-Z\u00C0-\u017F]+)?)',  # Unicode names
-                r'^([A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)(?:[\s\|\-•])',  # Name followed by separator
-                r'^([A-Z][a-z]+\s[A-Z][a-z]+)(?:\s*[A-Z][a-z]+@)',  # Name before email
-                r'^([A-Z][a-z]+\s[A-Z][a-z]+)(?:\s*\+?\d)',  # Name before phone
-            ]
-            
-            for pattern in merged_patterns:
-                name_match = re.match(pattern, line)
+            for pattern in MERGED_NAME_PATTERNS:
+                name_match = pattern.match(line)
                 if name_match:
                     potential_name = name_match.group(1).strip()
                     # Validate name length and content
                     if 4 <= len(potential_name) <= 40 and potential_name.count(' ') >= 1:
-                        logger.info(f"✅ Found name at start of long line: '{potential_name}'")
+                        logger.info("✅ Found name at start of long line: '%s'", potential_name)
                         return potential_name
         
-        if line and len(line.split()) >= 2:
+        words = line.split()
+        if len(words) >= 2:
             # More flexible name detection with Unicode support
-            words = line.split()
-            if len(words) >= 2 and len(words) <= 4:  # Names are typically 2-4 words
-                # Enhanced check for title case including Unicode characters
-                def is_title_case_unicode(word):
-                    if not word:
-                        return False
-                    first_char = word[0]
-                    # Check if first character is uppercase (including Unicode)
-                    return first_char.isupper() or unicodedata.category(first_char) == 'Lu'
-                
-                if all(is_title_case_unicode(word) for word in words[:2]):
+            if len(words) <= 4:  # Names are typically 2-4 words
+                # Title case check - str.isupper already covers Unicode uppercase
+                if words[0][0].isupper() and words[1][0].isupper():
                     if len(line) < 80 and not any(char in line for char in '@.com|+()'):  # Not email/phone/url
                         # Additional checks to avoid headers
-                        if not any(keyword in line.upper() for keyword in ['CURRICULUM', 'RESUME', 'CV', 'PROFILE', 'CONTACT']):
+                        line_upper = line.upper()
+                        if not any(keyword in line_upper for keyword in NAME_HEADER_KEYWORDS):
                             # Validate that it looks like a real name
                             name_score = 0
                             for word in words[:2]:
@@ -5773,27 +5608,27 @@ def extract_name(content: str) -> Optional[str]:
                                     name_score += 1
                             
                             if name_score >= 2:  # At least 2 valid name words
-                                logger.info(f"✅ Found potential name: '{line}'")
+                                logger.info("✅ Found potential name: '%s'", line)
                                 return line
                             else:
-                                logger.info(f"❌ Rejected (invalid name pattern): '{line}'")
+                                logger.debug("❌ Rejected (invalid name pattern): '%s'", line)
                         else:
-                            logger.info(f"❌ Rejected (keyword): '{line}'")
+                            logger.debug("❌ Rejected (keyword): '%s'", line)
                     else:
-                        logger.info(f"❌ Rejected (long/contact): '{line}'")
+                        logger.debug("❌ Rejected (long/contact): '%s'", line)
                 else:
-                    logger.info(f"❌ Rejected (not title case): '{line}'")
+                    logger.debug("❌ Rejected (not title case): '%s'", line)
             else:
-                logger.info(f"❌ Rejected (word count): '{line}' ({len(words)} words)")
+                logger.debug("❌ Rejected (word count): '%s' (%d words)", line, len(words))
     
     # Try regex patterns with normalized content
     for pattern in NAME_PATTERNS:
-        match = re.search(pattern, normalized_content, re.MULTILINE)
+        match = pattern.search(normalized_content)
         if match:
             potential_name = match.group(1).strip()
             # Additional validation for regex-found names
             if 4 <= len(potential_name) <= 40 and potential_name.count(' ') >= 1:
-                logger.info(f"✅ Found name via regex: '{potential_name}'")
+                logger.info("✅ Found name via regex: '%s'", potential_name)
                 return potential_name
     
     logger.warning("⚠️ No valid name found in content")
@@ -5891,7 +5726,7 @@ def extract_address_from_contact_section(content: str) -> Dict[str, Optional[str
             
             # Extract city/state from contact section
             for city_pattern in CITY_STATE_PATTERNS:
-                city_match = re.search(city_pattern, contact_text, re.MULTILINE)
+                city_match = city_pattern.search(contact_text)
                 if city_match and len(city_match.groups()) >= 2:
                     city = city_match.group(1).strip()
                     state = city_match.group(2).strip()
@@ -5930,7 +5765,7 @@ def extract_address_careful_fallback(content: str) -> Dict[str, Optional[str]]:
     
     # Now search in the cleaned content
     for pattern in CITY_STATE_PATTERNS:
-        match = re.search(pattern, cleaned_content, re.MULTILINE)
+        match = pattern.search(cleaned_content)
         if match and len(match.groups()) >= 2:
             city = match.group(1).strip()
             state = match.group(2).strip()
@@ -6023,7 +5858,7 @@ def is_valid_location(city: str, state: str) -> bool:
 def extract_summary(content: str) -> Optional[str]:
     """Extract professional summary from CV content"""
     for pattern in SUMMARY_PATTERNS:
-        match = re.search(pattern, content, re.IGNORECASE | re.DOTALL)
+        match = pattern.search(content)
         if match:
             summary = match.group(1).strip()
             # Clean up the summary
@@ -6039,32 +5874,29 @@ def extract_skills_list(content: str) -> List[str]:
     skills = []
     
     for pattern in SKILLS_PATTERNS:
-        match = re.search(pattern, content, re.IGNORECASE | re.DOTALL)
+        match = pattern.search(content)
         if match:
             skills_text = match.group(1).strip()
             # Parse skills from various formats
             parsed_skills = parse_skills_text(skills_text)
             skills.extend(parsed_skills)
     
-    # Remove duplicates and clean up
-    unique_skills = list(set(skill.strip() for skill in skills if skill.strip()))
+    # Remove duplicates, keeping first-seen order (skills are already stripped)
+    unique_skills = list(dict.fromkeys(skill for skill in skills if skill))
     return unique_skills[:20]  # Limit to 20 skills
 
 def parse_skills_text(skills_text: str) -> List[str]:
     """Parse skills from text using various delimiters"""
     skills = []
     
-    # Try different separators
-    separators = [',', '•', '|', ';', '\n', '/', '\\']
+    # Split on the first separator present
+    separator = next((sep for sep in SKILL_SEPARATORS if sep in skills_text), None)
     
-    for separator in separators:
-        if separator in skills_text:
-            parts = skills_text.split(separator)
-            for part in parts:
-                skill = part.strip().strip('•').strip('-').strip()
-                if skill and len(skill) < 50:
-                    skills.append(skill)
-            break
+    if separator is not None:
+        for part in skills_text.split(separator):
+            skill = part.strip().strip('•').strip('-').strip()
+            if skill and len(skill) < 50:
+                skills.append(skill)
     
     # If no separators found, try word-based extraction
     if not skills:
@@ -6081,15 +5913,20 @@ def extract_education_list(content: str) -> List[Dict[str, str]]:
     """Extract education information from CV content"""
     education = []
     
+    # Scan match by match and stop as soon as 5 entries are found
     for pattern in EDUCATION_PATTERNS:
-        matches = re.finditer(pattern, content, re.IGNORECASE | re.DOTALL)
-        for match in matches:
+        pos = 0
+        while len(education) < 5:
+            match = pattern.search(content, pos)
+            if not match:
+                break
             edu_text = match.group(1).strip()
             edu_info = parse_education_entry(edu_text)
             if edu_info:
                 education.append(edu_info)
+            pos = max(match.end(), pos + 1)
     
-    return education[:5]  # Limit to 5 education entries
+    return education  # Limited to 5 education entries
 
 def parse_education_entry(edu_text: str) -> Optional[Dict[str, str]]:
     """Parse individual education entry"""
@@ -6104,24 +5941,19 @@ def parse_education_entry(edu_text: str) -> Optional[Dict[str, str]]:
     }
     
     # Try to extract degree
-    degree_patterns = [
-        r'(Bachelor[^,\n]*|Master[^,\n]*|PhD[^,\n]*|MBA[^,\n]*|B\.S\.[^,\n]*|M\.S\.[^,\n]*|B\.A\.[^,\n]*|M\.A\.[^,\n]*)',
-        r'(Associate[^,\n]*|Diploma[^,\n]*|Certificate[^,\n]*)'
-    ]
-    
-    for pattern in degree_patterns:
-        match = re.search(pattern, edu_text, re.IGNORECASE)
+    for pattern in DEGREE_PATTERNS:
+        match = pattern.search(edu_text)
         if match:
             edu_info['degree'] = match.group(1).strip()
             break
     
     # Try to extract institution
-    institution_match = re.search(r'([A-Za-z\s]+(?:University|College|Institute|School))', edu_text, re.IGNORECASE)
+    institution_match = INSTITUTION_PATTERN.search(edu_text)
     if institution_match:
         edu_info['institution'] = institution_match.group(1).strip()
     
     # Try to extract year
-    year_match = re.search(r'(19\d{2}|20\d{2})', edu_text)
+    year_match = YEAR_PATTERN.search(edu_text)
     if year_match:
         edu_info['year'] = year_match.group(1)
     
@@ -6131,17 +5963,22 @@ def extract_work_experience_list(content: str) -> List[Dict[str, str]]:
     """Extract work experience from CV content"""
     experience = []
     
+    # Scan match by match and stop as soon as 5 entries are found
     for pattern in EXPERIENCE_PATTERNS:
-        matches = re.finditer(pattern, content, re.IGNORECASE | re.DOTALL)
-        for match in matches:
+        pos = 0
+        while len(experience) < 5:
+            match = pattern.search(content, pos)
+            if not match:
+                break
             exp_text = match.group(1).strip()
             # Split by likely job separators
-            job_entries = re.split(r'\n(?=[A-Z][^a-z]*[|•])', exp_text)
+            job_entries = JOB_ENTRY_SPLIT_PATTERN.split(exp_text)
             
             for entry in job_entries:
                 exp_info = parse_experience_entry(entry.strip())
                 if exp_info:
                     experience.append(exp_info)
+            pos = max(match.end(), pos + 1)
     
     return experience[:5]  # Limit to 5 experience entries
 
@@ -6158,11 +5995,11 @@ def parse_experience_entry(exp_text: str) -> Optional[Dict[str, str]]:
     }
     
     # Try to extract title | company | duration pattern
-    pipe_match = re.search(r'([^|]+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)', exp_text)
-    if pipe_match:
-        exp_info['title'] = pipe_match.group(1).strip()
-        exp_info['company'] = pipe_match.group(2).strip()
-        exp_info['duration'] = pipe_match.group(3).strip()
+    parts = exp_text.split('|', 3)
+    if len(parts) >= 3 and all(parts[:3]):
+        exp_info['title'] = parts[0].strip()
+        exp_info['company'] = parts[1].strip()
+        exp_info['duration'] = parts[2].strip()
     else:
         # Try to extract from first line
         first_line = exp_text.split('\n')[0]
@@ -6180,15 +6017,8 @@ def estimate_years_of_experience(content: str) -> Optional[int]:
     """Estimate years of professional experience from CV content"""
     
     # First, try to find explicit experience statements
-    exp_statements = [
-        r'(\d+)\s*\+?\s*years?\s+(?:of\s+)?(?:professional\s+)?experience',
-        r'(?:professional\s+)?experience.*?(\d+)\s*\+?\s*years?',
-        r'(\d+)\s*\+?\s*years?\s+(?:in|with)',
-        r'over\s+(\d+)\s*years?\s+(?:of\s+)?(?:professional\s+)?experience'
-    ]
-    
-    for pattern in exp_statements:
-        match = re.search(pattern, content, re.IGNORECASE)
+    for pattern in YEARS_EXPERIENCE_PATTERNS:
+        match = pattern.search(content)
         if match:
             years_exp = int(match.group(1))
             if 0 < years_exp < 50:
@@ -6196,21 +6026,15 @@ def estimate_years_of_experience(content: str) -> Optional[int]:
     
     # If no explicit statement, look for work experience years only (not education)
     work_section = ""
-    work_patterns = [
-        r'(?:WORK\s+EXPERIENCE|PROFESSIONAL\s+EXPERIENCE|EMPLOYMENT\s+HISTORY|CAREER\s+SUMMARY)[\s:]*\n?(.*?)(?:\n\n|\n(?:EDUCATION|SKILLS|CERTIFICATIONS)|$)',
-        r'(?:EXPERIENCE|EMPLOYMENT)[\s:]*\n?(.*?)(?:\n\n|\n(?:EDUCATION|SKILLS)|$)'
-    ]
-    
-    for pattern in work_patterns:
-        match = re.search(pattern, content, re.IGNORECASE | re.DOTALL)
+    for pattern in WORK_SECTION_PATTERNS:
+        match = pattern.search(content)
         if match:
             work_section = match.group(1)
             break
     
     if work_section:
         # Extract years from work experience section only
-        year_pattern = r'(19\d{2}|20\d{2})'
-        matches = re.findall(year_pattern, work_section)
+        matches = YEAR_PATTERN.findall(work_section)
         if matches:
             years = [int(year) for year in matches]
             years.sort()
@@ -6224,60 +6048,56 @@ def estimate_years_of_experience(content: str) -> Optional[int]:
     return None
 
 def generate_session_uuid() -> str:
-    """Generate a unique session UUID for tracking"""
+    """
+    Generate a unique session UUID for tracking
+    
+    Keeps the canonical dashed form (not uuid4().hex): temporary emails must
+    match what the generate_temp_email_from_uuid SQL function builds from the
+    same UUID column value.
+    """
     return str(uuid.uuid4())
 
 def generate_temp_email_from_uuid(session_uuid: str) -> str:
-    """Generate temporary email from UUID for CVs without email"""
-    return f"{session_uuid}@bestcvbuilder.com"
+    """Generate temporary email from an already formatted session UUID for CVs without email"""
+    return f"{session_uuid}{TEMP_EMAIL_DOMAIN}"
+
+# Shared session so repeated requests to the storage host reuse pooled TCP/TLS connections
+HTTP_SESSION = requests.Session()
+
+# Leading bytes identifying each supported file type
+FILE_SIGNATURES = (
+    (b'%PDF', 'pdf'),
+    (b'PK\x03\x04', 'docx'),  # DOCX is a ZIP container
+    (b'\xd0\xcf\x11\xe0', 'doc'),  # OLE2 compound document
+)
 
-def get_file_info_from_url(file_url: str) -> Optional[Dict[str, Any]]:
+def get_file_info_from_bytes(file_url: str, file_content: bytes) -> Dict[str, Any]:
     """
-    Get file information from URL by making a HEAD request
+    Get file information from already-downloaded content, without another request
     
     Args:
         file_url: URL of the uploaded file
+        file_content: Downloaded file bytes
         
     Returns:
-        Dictionary with file info or None if failed
+        Dictionary with filename, size, type and SHA-256 content hash
     """
-    try:
-        import requests
-        from urllib.parse import urlparse
-        
-        # Make HEAD request to get file metadata
-        response = requests.head(file_url, timeout=10)
-        
-        if response.status_code == 200:
-            # Get file size from Content-Length header
-            file_size = int(response.headers.get('content-length', 1024))
-            
-            # Parse filename from URL
-            parsed_url = urlparse(file_url)
-            filename = parsed_url.path.split('/')[-1] or 'uploaded_resume.pdf'
-            
-            # Determine file type from filename or content-type
-            content_type = response.headers.get('content-type', '')
-            if '.pdf' in filename.lower() or 'pdf' in content_type:
-                file_type = 'pdf'
-            elif '.docx' in filename.lower() or 'docx' in content_type:
-                file_type = 'docx'
-            elif '.doc' in filename.lower() or 'msword' in content_type:
-                file_type = 'doc'
-            else:
-                file_type = 'pdf'  # Default
-            
-            return {
-                'original_filename': filename,
-                'file_size': max(file_size, 1),  # Ensure at least 1 byte
-                'file_type': file_type
-            }
-    except Exception as e:
-        logger.warning(f"Failed to get file info from URL: {str(e)}")
+    filename = cached_urlparse(file_url).path.split('/')[-1] or 'uploaded_resume.pdf'
     
-    return None
+    # Trust the magic number over the extension, then fall back to the extension
+    file_type = next((kind for signature, kind in FILE_SIGNATURES if file_content.startswith(signature)), None)
+    if file_type is None:
+        type_match = FILE_TYPE_PATTERN.search(filename)
+        file_type = type_match.group(1).lower() if type_match else 'pdf'
+    
+    return {
+        'original_filename': filename,
+        'file_size': max(len(file_content), 1),  # Ensure at least 1 byte
+        'file_type': file_type,
+        'file_hash': hashlib.sha256(file_content).hexdigest()
+    }
 
-def handle_missing_email(extracted_data: Dict[str, Any], session_uuid: str) -> str:
+def handle_missing_email(extracted_data: Dict[str, Any], session_uuid: str) -> Tuple[str, bool]:
     """
     Handle cases where CV doesn't contain an email address
     
@@ -6286,86 +6106,289 @@ def handle_missing_email(extracted_data: Dict[str, Any], session_uuid: str) -> s
         session_uuid: Session UUID for this upload
         
     Returns:
-        Email address (real or temporary)
+        Tuple of (email address, whether it is a generated temporary email)
     """
     extracted_email = extracted_data.get('email')
     
     if extracted_email and '@' in extracted_email:
         logger.info(f"Real email found in CV: {extracted_email}")
-        return extracted_email
+        return extracted_email, False
     else:
         temp_email = generate_temp_email_from_uuid(session_uuid)
         logger.info(f"No email found in CV, generated temporary email: {temp_email}")
-        return temp_email
+        return temp_email, True
 
-def save_user_profile_data(email: str, extracted_data: Dict[str, Any], session_uuid: str = None) -> bool:
+def get_email_source(email: str, is_temp_email: Optional[bool] = None) -> str:
+    """Classify an email as generated ('generated_temp') or taken from the CV ('cv_extracted')"""
+    if is_temp_email is None:
+        is_temp_email = email.endswith(TEMP_EMAIL_DOMAIN)
+    return 'generated_temp' if is_temp_email else 'cv_extracted'
+
+@lru_cache(maxsize=1)
+def get_supabase_client():
+    """
+    Return a process-wide Supabase client, created on first use
+    
+    Reusing one client keeps its HTTP connection pool (and TLS sessions) alive
+    across the profile/resume/analysis/activity writes of every request.
+    
+    Returns:
+        Supabase client, or None if the library or credentials are not available
+    """
+    if not SUPABASE_AVAILABLE:
+        return None
+    
+    supabase_url = os.getenv('SUPABASE_URL')
+    supabase_key = os.getenv('SUPABASE_SERVICE_ROLE_KEY') or os.getenv('PUBLIC_SUPABASE_PUBLISHABLE_DEFAULT_KEY')  # Fallback to public key
+    
+    if not supabase_url or not supabase_key:
+        return None
+    
+    return create_client(supabase_url, supabase_key)
+
+# PostgREST status codes worth retrying (rate limiting and transient gateway errors)
+RETRYABLE_STATUS_CODES = frozenset({'429', '502', '503', '504'})
+
+def is_retryable_supabase_error(error: Exception) -> bool:
+    """
+    Whether a failed Supabase query is worth retrying
+    
+    Network-level httpx errors never reached the server. A non-JSON error body carries the HTTP
+    status as its code; PostgREST's own JSON errors always carry a PGRST/SQLSTATE code, so an
+    APIError without one came from the gateway in front of it (e.g. a rate-limit 429).
+    APIError keeps no response headers, so Retry-After is not available here.
+    """
+    if SUPABASE_AVAILABLE and isinstance(error, SupabaseTransportError):
+        return True
+    code = getattr(error, 'code', None)
+    if code is None:
+        return SUPABASE_AVAILABLE and isinstance(error, SupabaseAPIError)
+    return str(code) in RETRYABLE_STATUS_CODES
+
+def execute_with_retry(query, tries: int = 3):
+    """
+    Execute a Supabase query, retrying transient failures with exponential backoff and jitter
+    
+    Args:
+        query: Supabase query or RPC builder (anything with .execute())
+        tries: Maximum number of attempts
+        
+    Returns:
+        Query response from the first successful attempt
+    """
+    delay = 0.1
+    for attempt in range(tries):
+        try:
+            return query.execute()
+        except Exception as e:
+            if attempt == tries - 1 or not is_retryable_supabase_error(e):
+                raise
+            wait = delay + random.random() * 0.05
+            logger.warning(f"Supabase query failed ({e!r}), retrying in {wait:.2f}s (attempt {attempt + 1}/{tries})")
+            time.sleep(wait)
+            delay *= 2
+
+def build_profile_data(extracted_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the user_profiles payload from extracted CV data
+    
+    Args:
+        extracted_data: Extracted personal information
+        
+    Returns:
+        Profile fields with None values and empty strings/arrays removed
+    """
+    profile_data = {
+        'full_name': extracted_data.get('full_name'),
+        'phone': extracted_data.get('phone'),
+        'address': extracted_data.get('address'),
+        'city': extracted_data.get('city'),
+        'state': extracted_data.get('state'),
+        'linkedin_url': extracted_data.get('linkedin_url'),
+        'github_url': extracted_data.get('github_url'),
+        'website_url': extracted_data.get('website_url'),
+        'professional_summary': extracted_data.get('professional_summary'),
+        'years_of_experience': extracted_data.get('years_of_experience'),
+        'skills': extracted_data.get('skills', []),
+        'education': extracted_data.get('education', []),
+        'work_experience': extracted_data.get('work_experience', [])
+    }
+    
+    # Clean phone number (remove trailing spaces and validate length)
+    if profile_data.get('phone'):
+        phone = profile_data['phone'].strip()
+        # Only keep phone if it's at least 10 characters (as per constraint)
+        if len(phone) >= 10:
+            profile_data['phone'] = phone
+        else:
+            profile_data['phone'] = None
+    
+    # Remove None values and empty strings/arrays
+    return {k: v for k, v in profile_data.items() 
+            if v is not None and v != '' and v != []}
+
+def build_resume_record(email: str, file_url: str, file_info: Dict[str, Any], session_uuid: str = None,
+                        status: str = 'completed', processed_at: str = None,
+                        is_temp_email: Optional[bool] = None) -> Dict[str, Any]:
+    """
+    Build the resumes row for an uploaded file
+    
+    Args:
+        email: User email address
+        file_url: URL of uploaded file
+        file_info: File metadata (filename, size, type, etc.)
+        status: Processing status - the row is written after analysis, so completed by default
+        processed_at: ISO timestamp of completion (defaults to now)
+        is_temp_email: Whether the email was generated (derived from the email if omitted)
+        
+    Returns:
+        Resume record ready for insertion
+    """
+    # Prefer the SHA-256 of the downloaded bytes; fall back to hashing the URL
+    file_hash = file_info.get('file_hash') or hashlib.sha256(file_url.encode()).hexdigest()[:16]
+    
+    # Parse file info from URL and metadata
+    parsed_url = cached_urlparse(file_url)
+    filename = file_info.get('original_filename', 'unknown.pdf')
+    
+    # Determine email source
+    email_source = get_email_source(email, is_temp_email)
+    
+    return {
+        'email': email,
+        'session_uuid': session_uuid,
+        'original_filename': filename,
+        'file_path': parsed_url.path,
+        'file_url': file_url,
+        'file_size': file_info.get('file_size', 0),
+        'file_type': file_info.get('file_type', 'pdf'),
+        'file_hash': file_hash,
+        'processing_status': status,
+        'processed_at': processed_at or datetime.now(timezone.utc).isoformat(),
+        'upload_source': 'web_app',
+        'email_source': email_source
+    }
+
+def _clean_for_database_recursive(obj):
+    """Recursively clean data for database storage"""
+    if isinstance(obj, str):
+        # Remove null bytes and other problematic Unicode characters
+        return obj.replace('\x00', '').encode('utf-8', 'ignore').decode('utf-8')
+    elif isinstance(obj, dict):
+        return {k: _clean_for_database_recursive(v) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [_clean_for_database_recursive(item) for item in obj]
+    else:
+        return obj
+
+def clean_for_database(obj):
+    """Clean data for database storage, scanning it once with orjson for null bytes"""
+    if not ORJSON_AVAILABLE:
+        return _clean_for_database_recursive(obj)
+    
+    try:
+        raw = orjson.dumps(obj)
+    except TypeError:
+        # Lone surrogates or non-JSON values - fall back to the per-value walk
+        return _clean_for_database_recursive(obj)
+    
+    # Most analyses contain no null bytes - skip rebuilding the structure.
+    # orjson escapes NUL as \u0000; a byte replace could also hit an escaped
+    # backslash followed by "u0000", so the rare dirty case takes the walk.
+    if b'\\u0000' not in raw:
+        return obj
+    return _clean_for_database_recursive(obj)
+
+# Top-level analysis keys that build_analysis_record reads - everything else is never stored
+PERSISTED_ANALYSIS_KEYS = (
+    'comprehensive_final_score', 'ats_score', 'category', 'component_scores',
+    'strengths', 'improvements', 'critical_issues', 'suggestions',
+    'detailed_analysis', 'next_steps', 'industry',
+)
+
+# (resume_analysis column, component_scores key, max points) - caps match the table constraints
+ANALYSIS_SCORE_LIMITS = (
+    ('structure_score', 'structure', 25),
+    ('keywords_score', 'keywords', 20),
+    ('contact_score', 'contact', 15),
+    ('formatting_score', 'formatting', 20),
+    ('achievements_score', 'achievements', 10),
+    ('readability_score', 'readability', 10),
+)
+
+def build_analysis_record(email: str, resume_id: Optional[int], analysis_data: Dict[str, Any], session_uuid: str = None) -> Dict[str, Any]:
+    """
+    Build the resume_analysis row from ATS analysis results
+    
+    Args:
+        email: User email address
+        resume_id: ID of the resume that was analyzed (None when the database assigns it)
+        analysis_data: Analysis results from ATS processing
+        
+    Returns:
+        Analysis record with scores clamped to the table constraints
+    """
+    # Drop fields that are never stored, then clean the rest of null bytes and other problematic characters
+    persisted_data = {key: analysis_data[key] for key in PERSISTED_ANALYSIS_KEYS if key in analysis_data}
+    cleaned_analysis_data = clean_for_database(persisted_data)
+    component_scores = cleaned_analysis_data.get('component_scores') or {}
+    
+    analysis_record = {
+        'email': email,
+        'resume_id': resume_id,
+        'session_uuid': session_uuid,
+        'ats_score': min(100, max(0, int(cleaned_analysis_data.get('comprehensive_final_score', cleaned_analysis_data.get('ats_score', 0))))),
+        'score_category': cleaned_analysis_data.get('category', 'poor'),
+        'strengths': cleaned_analysis_data.get('strengths', []),
+        'improvements': cleaned_analysis_data.get('improvements', []),
+        'missing_keywords': cleaned_analysis_data.get('critical_issues', []),
+        'found_keywords': cleaned_analysis_data.get('suggestions', []),
+        'detailed_analysis': cleaned_analysis_data.get('detailed_analysis', {}),
+        'recommendations': cleaned_analysis_data.get('next_steps', []),
+        'detected_industry': cleaned_analysis_data.get('industry', 'general'),
+        'analysis_version': '2.0'
+    }
+    analysis_record.update({
+        column: min(max_points, max(0, int(component_scores.get(key, 0))))
+        for column, key, max_points in ANALYSIS_SCORE_LIMITS
+    })
+    return analysis_record
+
+def save_user_profile_data(email: str, extracted_data: Dict[str, Any], session_uuid: str = None,
+                           is_temp_email: Optional[bool] = None) -> bool:
     """
     Save extracted CV data to user_profiles table using email-based architecture
     
     Args:
         email: User email address extracted from CV
         extracted_data: Extracted personal information
+        is_temp_email: Whether the email was generated (derived from the email if omitted)
         
     Returns:
         Boolean indicating success
     """
     try:
-        from supabase import create_client, Client
-        import os
-        
-        # Initialize Supabase client
-        supabase_url = os.getenv('SUPABASE_URL')
-        supabase_key = os.getenv('SUPABASE_SERVICE_ROLE_KEY') or os.getenv('PUBLIC_SUPABASE_PUBLISHABLE_DEFAULT_KEY') or os.getenv('PUBLIC_SUPABASE_PUBLISHABLE_DEFAULT_KEY')  # Fallback to public key
-        
-        if not supabase_url or not supabase_key:
+        supabase = get_supabase_client()
+        if supabase is None:
             logger.warning("Warning: Supabase credentials not found, skipping database save")
             return False
-            
-        supabase: Client = create_client(supabase_url, supabase_key)
         
         # Prepare profile data for database (only include non-None values)
-        profile_data = {
-            'full_name': extracted_data.get('full_name'),
-            'phone': extracted_data.get('phone'),
-            'address': extracted_data.get('address'),
-            'city': extracted_data.get('city'),
-            'state': extracted_data.get('state'),
-            'linkedin_url': extracted_data.get('linkedin_url'),
-            'github_url': extracted_data.get('github_url'),
-            'website_url': extracted_data.get('website_url'),
-            'professional_summary': extracted_data.get('professional_summary'),
-            'years_of_experience': extracted_data.get('years_of_experience'),
-            'skills': extracted_data.get('skills', []),
-            'education': extracted_data.get('education', []),
-            'work_experience': extracted_data.get('work_experience', [])
-        }
-        
-        # Clean phone number (remove trailing spaces and validate length)
-        if profile_data.get('phone'):
-            phone = profile_data['phone'].strip()
-            # Only keep phone if it's at least 10 characters (as per constraint)
-            if len(phone) >= 10:
-                profile_data['phone'] = phone
-            else:
-                profile_data['phone'] = None
-        
-        # Remove None values and empty strings/arrays
-        profile_data = {k: v for k, v in profile_data.items() 
-                       if v is not None and v != '' and v != []}
+        profile_data = build_profile_data(extracted_data)
         
         # Determine email source type
-        email_source = 'generated_temp' if '@bestcvbuilder.com' in email else 'cv_extracted'
+        email_source = get_email_source(email, is_temp_email)
         
         # Use the enhanced upsert function with UUID support
         logger.info(f"Upserting user profile for email: {email} (source: {email_source})")
         
         # Call the enhanced database function with UUID support
-        result = supabase.rpc('upsert_user_profile_with_uuid', {
+        result = execute_with_retry(supabase.rpc('upsert_user_profile_with_uuid', {
             'p_email': email,
             'p_session_uuid': session_uuid,
             'p_profile_data': profile_data,
             'p_email_source': email_source
-        }).execute()
+        }))
         
         if result.data:
             logger.info(f"Successfully upserted user profile for email: {email}")
@@ -6379,7 +6402,9 @@ def save_user_profile_data(email: str, extracted_data: Dict[str, Any], session_u
         logger.error(f"Failed to save user profile data for {email}: {str(e)}")
         return False
 
-def save_resume_record(email: str, file_url: str, file_info: Dict[str, Any], session_uuid: str = None) -> Optional[int]:
+def save_resume_record(email: str, file_url: str, file_info: Dict[str, Any], session_uuid: str = None,
+                       status: str = 'completed', processed_at: str = None,
+                       is_temp_email: Optional[bool] = None) -> Optional[int]:
     """
     Save resume upload record to resumes table
     
@@ -6387,53 +6412,25 @@ def save_resume_record(email: str, file_url: str, file_info: Dict[str, Any], ses
         email: User email address
         file_url: URL of uploaded file
         file_info: File metadata (filename, size, type, etc.)
+        status: Processing status stored with the row
+        processed_at: ISO timestamp of completion (defaults to now)
+        is_temp_email: Whether the email was generated (derived from the email if omitted)
         
     Returns:
         Resume ID if successful, None otherwise
     """
     try:
-        from supabase import create_client, Client
-        import os
-        import hashlib
-        from urllib.parse import urlparse
-        
-        supabase_url = os.getenv('SUPABASE_URL')
-        supabase_key = os.getenv('SUPABASE_SERVICE_ROLE_KEY') or os.getenv('PUBLIC_SUPABASE_PUBLISHABLE_DEFAULT_KEY')
-        
-        if not supabase_url or not supabase_key:
+        supabase = get_supabase_client()
+        if supabase is None:
             logger.warning("Supabase credentials not found, skipping resume record save")
             return None
-            
-        supabase: Client = create_client(supabase_url, supabase_key)
         
-        # Generate file hash for duplicate detection
-        file_hash = hashlib.sha256(file_url.encode()).hexdigest()[:16]  # Shortened hash
-        
-        # Parse file info from URL and metadata
-        parsed_url = urlparse(file_url)
-        filename = file_info.get('original_filename', 'unknown.pdf')
-        
-        # Determine email source
-        email_source = 'generated_temp' if '@bestcvbuilder.com' in email else 'cv_extracted'
-        
-        resume_data = {
-            'email': email,
-            'session_uuid': session_uuid,
-            'original_filename': filename,
-            'file_path': parsed_url.path,
-            'file_url': file_url,
-            'file_size': file_info.get('file_size', 0),
-            'file_type': file_info.get('file_type', 'pdf'),
-            'file_hash': file_hash,
-            'processing_status': 'processing',
-            'upload_source': 'web_app',
-            'email_source': email_source
-        }
+        resume_data = build_resume_record(email, file_url, file_info, session_uuid, status, processed_at, is_temp_email)
         
         logger.info(f"Saving resume record for email: {email}")
         
-        # Insert resume record
-        result = supabase.table('resumes').insert(resume_data).execute()
+        # Insert resume record - re-uploading the same file for the same email reuses its row
+        result = execute_with_retry(supabase.table('resumes').upsert(resume_data, on_conflict='email,file_hash'))
         
         if result.data and len(result.data) > 0:
             resume_id = result.data[0]['id']
@@ -6460,61 +6457,18 @@ def save_analysis_results(email: str, resume_id: int, analysis_data: Dict[str, A
         Boolean indicating success
     """
     try:
-        from supabase import create_client, Client
-        import os
-        
-        supabase_url = os.getenv('SUPABASE_URL')
-        supabase_key = os.getenv('SUPABASE_SERVICE_ROLE_KEY') or os.getenv('PUBLIC_SUPABASE_PUBLISHABLE_DEFAULT_KEY')
-        
-        if not supabase_url or not supabase_key:
+        supabase = get_supabase_client()
+        if supabase is None:
             logger.warning("Supabase credentials not found, skipping analysis save")
             return False
-            
-        supabase: Client = create_client(supabase_url, supabase_key)
-        
-        # Clean analysis data to remove null bytes and other problematic characters
-        def clean_for_database(obj):
-            """Recursively clean data for database storage"""
-            if isinstance(obj, str):
-                # Remove null bytes and other problematic Unicode characters
-                return obj.replace('\x00', '').replace('\u0000', '').encode('utf-8', 'ignore').decode('utf-8')
-            elif isinstance(obj, dict):
-                return {k: clean_for_database(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [clean_for_database(item) for item in obj]
-            else:
-                return obj
-        
-        # Clean the analysis data
-        cleaned_analysis_data = clean_for_database(analysis_data)
         
         # Prepare analysis data for database
-        analysis_record = {
-            'email': email,
-            'resume_id': resume_id,
-            'session_uuid': session_uuid,
-            'ats_score': min(100, max(0, int(cleaned_analysis_data.get('comprehensive_final_score', cleaned_analysis_data.get('ats_score', 0))))),
-            'score_category': cleaned_analysis_data.get('category', 'poor'),
-            'structure_score': min(25, max(0, int(cleaned_analysis_data.get('component_scores', {}).get('structure', 0)))),
-            'keywords_score': min(20, max(0, int(cleaned_analysis_data.get('component_scores', {}).get('keywords', 0)))),  # Fixed: 20 not 25
-            'contact_score': min(15, max(0, int(cleaned_analysis_data.get('component_scores', {}).get('contact', 0)))),
-            'formatting_score': min(20, max(0, int(cleaned_analysis_data.get('component_scores', {}).get('formatting', 0)))),
-            'achievements_score': min(10, max(0, int(cleaned_analysis_data.get('component_scores', {}).get('achievements', 0)))),
-            'readability_score': min(10, max(0, int(cleaned_analysis_data.get('component_scores', {}).get('readability', 0)))),
-            'strengths': cleaned_analysis_data.get('strengths', []),
-            'improvements': cleaned_analysis_data.get('improvements', []),
-            'missing_keywords': cleaned_analysis_data.get('critical_issues', []),
-            'found_keywords': cleaned_analysis_data.get('suggestions', []),
-            'detailed_analysis': cleaned_analysis_data.get('detailed_analysis', {}),
-            'recommendations': cleaned_analysis_data.get('next_steps', []),
-            'detected_industry': cleaned_analysis_data.get('industry', 'general'),
-            'analysis_version': '2.0'
-        }
+        analysis_record = build_analysis_record(email, resume_id, analysis_data, session_uuid)
         
         logger.info(f"Saving analysis results for resume ID: {resume_id}")
         
         # Insert analysis results
-        result = supabase.table('resume_analysis').insert(analysis_record).execute()
+        result = execute_with_retry(supabase.table('resume_analysis').upsert(analysis_record, on_conflict='resume_id'))
         
         if result.data:
             logger.info(f"Successfully saved analysis results for resume {resume_id}")
@@ -6527,6 +6481,58 @@ def save_analysis_results(email: str, resume_id: int, analysis_data: Dict[str, A
         logger.error(f"Failed to save analysis results: {str(e)}")
         return False
 
+def save_cv_submission(email: str, extracted_data: Dict[str, Any], file_url: str, file_info: Dict[str, Any],
+                       analysis_data: Dict[str, Any], session_uuid: str = None,
+                       is_temp_email: Optional[bool] = None) -> Optional[Dict[str, Any]]:
+    """
+    Save profile, resume record and analysis results in one database round trip
+    
+    Calls the process_cv_submission database function, which runs all three
+    writes in a single transaction.
+    
+    Args:
+        email: User email address
+        extracted_data: Extracted personal information
+        file_url: URL of uploaded file
+        file_info: File metadata (filename, size, type, etc.)
+        analysis_data: Analysis results from ATS processing
+        session_uuid: Session UUID for this upload
+        is_temp_email: Whether the email was generated (derived from the email if omitted)
+        
+    Returns:
+        Dictionary with 'resume_id', 'profile_saved' and 'analysis_saved', or None if the
+        batched save failed and the caller should fall back to the individual save_* helpers
+    """
+    try:
+        supabase = get_supabase_client()
+        if supabase is None:
+            logger.warning("Supabase credentials not found, skipping batched CV save")
+            return None
+        
+        email_source = get_email_source(email, is_temp_email)
+        
+        logger.info(f"Saving CV submission for email: {email} (source: {email_source})")
+        
+        result = execute_with_retry(supabase.rpc('process_cv_submission', {
+            'p_email': email,
+            'p_session_uuid': session_uuid,
+            'p_email_source': email_source,
+            'p_profile_data': build_profile_data(extracted_data),
+            'p_resume_data': build_resume_record(email, file_url, file_info, session_uuid, is_temp_email=is_temp_email),
+            'p_analysis_data': build_analysis_record(email, None, analysis_data, session_uuid)
+        }))
+        
+        if result.data and result.data.get('resume_id'):
+            logger.info(f"Successfully saved CV submission with resume ID: {result.data['resume_id']}")
+            return result.data
+        else:
+            logger.warning(f"Batched CV save returned no resume for {email}")
+            return None
+        
+    except Exception as e:
+        logger.error(f"Failed to save CV submission: {str(e)}")
+        return None
+
 def log_activity(email: str, action: str, resource_type: str = None, resource_id: int = None, 
                 success: bool = True, error_message: str = None, metadata: Dict = None, session_uuid: str = None):
     """
@@ -6542,16 +6548,9 @@ def log_activity(email: str, action: str, resource_type: str = None, resource_id
         metadata: Additional metadata
     """
     try:
-        from supabase import create_client, Client
-        import os
-        
-        supabase_url = os.getenv('SUPABASE_URL')
-        supabase_key = os.getenv('SUPABASE_SERVICE_ROLE_KEY') or os.getenv('PUBLIC_SUPABASE_PUBLISHABLE_DEFAULT_KEY')
-        
-        if not supabase_url or not supabase_key:
+        supabase = get_supabase_client()
+        if supabase is None:
             return  # Silently fail for logging
-            
-        supabase: Client = create_client(supabase_url, supabase_key)
         
         activity_data = {
             'email': email,
@@ -6564,424 +6563,71 @@ def log_activity(email: str, action: str, resource_type: str = None, resource_id
             'session_uuid': session_uuid
         }
         
-        supabase.table('activity_logs').insert(activity_data).execute()
+        execute_with_retry(supabase.table('activity_logs').insert(activity_data))
         
     except Exception as e:
         logger.error(f"Failed to log activity: {str(e)}")  # Don't fail the main operation
 
-def analyze_resume_content_fast(file_url: str) -> Dict[str, Any]:
+# Background worker for audit logging - keeps the activity insert off the response path
+ACTIVITY_LOG_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix='activity-log')
+# Drain queued inserts when the worker process exits (e.g. gunicorn max-requests recycling)
+atexit.register(ACTIVITY_LOG_POOL.shutdown, wait=True)
+
+def log_activity_async(**kwargs):
+    """Queue log_activity on the background pool and return immediately"""
+    ACTIVITY_LOG_POOL.submit(log_activity, **kwargs)
+
+def download_file_content(file_url: str, timeout: int) -> bytearray:
     """
-    Fast analysis function for quick ATS scoring with reduced complexity
-    Provides essential scores without deep analysis for faster response times
+    Download a resume file, streaming it with a hard size cap
     
     Args:
         file_url: URL of the uploaded resume file
+        timeout: Read timeout in seconds
         
     Returns:
-        Dictionary containing basic analysis results optimized for speed
+        File content - the download buffer itself, handed on without a bytes() copy
     """
+    response = HTTP_SESSION.get(file_url, timeout=(DOWNLOAD_CONNECT_TIMEOUT, timeout), stream=True)
     try:
-        logger.info('⚡ Starting fast ATS analysis')
-        
-        # Validate URL (quick check)
-        if not validate_file_url(file_url):
-            raise FileProcessingError("Invalid file URL format")
-        
-        # Download file with shorter timeout for speed
-        response = requests.get(file_url, timeout=15, stream=True)
         response.raise_for_status()
         
-        # Check file size quickly (max 10MB)
+        # Fast reject when the server advertises the size
         content_length = response.headers.get('content-length')
-        if content_length and int(content_length) > 10 * 1024 * 1024:
-            raise FileProcessingError("File size exceeds 10MB limit")
-        
-        # Read content with limit
-        file_content = b''
-        for chunk in response.iter_content(chunk_size=8192):
-            file_content += chunk
-            if len(file_content) > 10 * 1024 * 1024:
-                raise FileProcessingError("File size exceeds 10MB limit")
-        
-        # Quick file type detection
-        content_type = response.headers.get('content-type', '').lower()
-        file_extension = get_file_extension_from_url(file_url).lower()
-        
-        # Fast text extraction (use fastest method available)
-        if file_extension in ['.pdf'] or 'pdf' in content_type:
-            resume_text = extract_text_from_pdf_fast(file_content)
-        elif file_extension in ['.docx', '.doc'] or 'word' in content_type:
-            resume_text = extract_text_from_docx(file_content)
-        else:
-            resume_text = file_content.decode('utf-8', errors='ignore')
-        
-        if not resume_text or len(resume_text.strip()) < 100:
-            raise TextExtractionError("Insufficient text content extracted from resume")
-        
-        logger.info(f'⚡ Fast text extraction completed: {len(resume_text)} characters')
-        
-        # Fast scoring - use only essential categories for speed
-        fast_categories = generate_fast_ats_scores(resume_text)
-        
-        # Calculate overall score quickly
-        total_score = sum(cat['score'] for cat in fast_categories)
-        max_score = len(fast_categories) * 10
-        overall_score = min(100, (total_score / max_score) * 100)
-        
-        # Basic personal info extraction (minimal)
-        personal_info = {
-            'email': extract_email_fast(resume_text),
-            'phone': extract_phone_fast(resume_text),
-            'name': extract_name_fast(resume_text)
-        }
-        
-        # Return simplified results for speed
-        result = {
-            'ats_score': round(overall_score),
-            'personal_information': personal_info,
-            'detailed_analysis': {cat['name']: cat for cat in fast_categories},
-            'total_categories': len(fast_categories),
-            'strengths': [cat['name'] for cat in fast_categories if cat['score'] >= 8],
-            'improvements_needed': [cat['name'] for cat in fast_categories if cat['score'] < 7],
-            'analysis_type': 'fast',
-            'processing_time': 'under_30_seconds',
-            'file_url': file_url,
-            'content': content
-        }
-        
-        # CRITICAL: Generate comprehensive TXT issues report for FAST analysis too
-        try:
-            logger.info("🔍 FAST ANALYSIS: Starting comprehensive TXT issues report generation...")
-            comprehensive_report = generate_comprehensive_issues_report(result)
-            
-            if comprehensive_report and len(comprehensive_report) > 100:
-                result['comprehensive_issues_report'] = comprehensive_report
-                logger.info(f"✅ FAST ANALYSIS: Comprehensive TXT issues report generated successfully ({len(comprehensive_report)} chars)")
-            else:
-                logger.warning(f"⚠️ FAST ANALYSIS: Comprehensive report generated but appears empty or too short: {comprehensive_report}")
-                result['comprehensive_issues_report'] = None
-                
-        except Exception as report_error:
-            logger.error(f"❌ FAST ANALYSIS: Failed to generate comprehensive report: {str(report_error)}")
-            result['comprehensive_issues_report'] = None
-        
-        return result
-        
-    except Exception as e:
-        logger.error(f"Fast analysis error: {str(e)}")
-        # Fallback to basic scoring if fast analysis fails
-        fallback_result = {
-            'ats_score': 65,  # Default reasonable score
-            'personal_information': {},
-            'detailed_analysis': {},
-            'analysis_type': 'fast_fallback',
-            'error': 'Fast analysis failed, using fallback scoring',
-            'file_url': file_url,
-            'content': ''
-        }
-        
-        # Try to generate comprehensive report even in fallback case
-        try:
-            logger.info("🔍 FAST FALLBACK: Attempting comprehensive report generation...")
-            comprehensive_report = generate_comprehensive_issues_report(fallback_result)
-            if comprehensive_report:
-                fallback_result['comprehensive_issues_report'] = comprehensive_report
-                logger.info(f"✅ FAST FALLBACK: Generated fallback comprehensive report")
-            else:
-                fallback_result['comprehensive_issues_report'] = None
-        except Exception as fallback_error:
-            logger.error(f"❌ FAST FALLBACK: Could not generate comprehensive report: {str(fallback_error)}")
-            fallback_result['comprehensive_issues_report'] = None
-            
-        return fallback_result
-
-def extract_text_from_pdf_fast(file_content: bytes) -> str:
-    """Fast PDF text extraction using most available method"""
-    try:
-        if PYPDF2_AVAILABLE:
-            import PyPDF2
-            pdf_file = io.BytesIO(file_content)
-            reader = PyPDF2.PdfReader(pdf_file)
-            text = ""
-            for page in reader.pages[:5]:  # Only process first 5 pages for speed
-                text += page.extract_text() + "\n"
-            return text
-        else:
-            # Fallback - return placeholder
-            return "PDF content extracted via fallback method"
-    except Exception as e:
-        logger.warning(f"Fast PDF extraction failed: {e}")
-        return "PDF text extraction failed"
-
-def extract_email_fast(text: str) -> str:
-    """Fast email extraction"""
-    import re
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    matches = re.findall(email_pattern, text)
-    return matches[0] if matches else ""
+        expected_size = int(content_length) if content_length and content_length.isdigit() else 0
+        if expected_size > MAX_FILE_SIZE:
+            raise FileTooLargeError("File size exceeds 10MB limit")
+        
+        # Preallocate from Content-Length so chunks are copied in place instead of regrowing
+        # the buffer; slice assignment still grows it if the header was missing or too small
+        buffer = bytearray(expected_size)
+        size = 0
+        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+            end = size + len(chunk)
+            if end > MAX_FILE_SIZE:
+                raise FileTooLargeError("File size exceeds 10MB limit")
+            buffer[size:end] = chunk
+            size = end
+        
+        # Trim unused preallocation if fewer bytes arrived than advertised
+        del buffer[size:]
+        return buffer
+    finally:
+        response.close()
 
-def extract_phone_fast(text: str) -> str:
-    """Fast phone extraction"""
-    import re
-    phone_pattern = r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-    matches = re.findall(phone_pattern, text)
-    return ''.join(matches[0]) if matches else ""
-
-def extract_name_fast(text: str) -> str:
-    """Fast name extraction - get first line"""
-    lines = text.strip().split('\n')
-    for line in lines[:3]:  # Check first 3 lines
-        line = line.strip()
-        if len(line) > 2 and len(line) < 50 and not '@' in line:
-            return line
-    return ""
+def is_quick_fix(issue: Dict[str, Any]) -> bool:
+    """Check whether an issue's time_to_fix (e.g. "5 minutes") is five minutes or less"""
+    time_to_fix = (issue.get('time_to_fix') or '').split(None, 1)
+    return bool(time_to_fix) and time_to_fix[0].isdigit() and int(time_to_fix[0]) <= 5
 
-def generate_fast_ats_scores(text: str) -> List[Dict]:
-    """Generate comprehensive ATS scores for all categories needed for specific issue extraction"""
-    categories = []
-    text_lower = text.lower()
-    lines = text.split('\n')
-    word_count = len(text.split())
-    
-    # CONTACT DETAILS
-    has_email = '@' in text
-    has_phone = any(char.isdigit() for char in text) and any(p in text for p in ['phone', 'tel', '(', ')', '-'])
-    categories.append({
-        'name': 'Contact Details',
-        'score': 10 if has_email and has_phone else (8 if has_email or has_phone else 5),
-        'issues': ['Contact formatting optimization opportunity: All contact elements present but formatting could be enhanced'] if has_email and has_phone else ['Missing essential contact information'],
-        'suggestions': ['Optimize contact section layout'] if has_email and has_phone else ['Add missing phone number or email']
-    })
-    
-    # SPELLING  
-    categories.append({
-        'name': 'Spelling',
-        'score': 10,  # Assume good unless we detect obvious issues
-        'issues': ['Fix spelling errors using AI-powered detection'],
-        'suggestions': ['Use spell-check tools for final review']
-    })
-    
-    # ACTION VERBS
-    action_verbs = ['managed', 'led', 'created', 'developed', 'implemented', 'designed', 'optimized', 'achieved']
-    verb_score = min(10, len([v for v in action_verbs if v in text_lower]) + 4)
-    categories.append({
-        'name': 'Action Verbs',
-        'score': verb_score,
-        'issues': ['Use more strong action verbs to start bullet points'],
-        'suggestions': ['Replace weak verbs with power words like "spearheaded", "orchestrated", "streamlined"']
-    })
-    
-    # QUANTIFIABLE ACHIEVEMENTS
-    has_numbers = any(char.isdigit() for char in text)
-    has_percentages = '%' in text
-    quant_score = 9 if has_numbers and has_percentages else (7 if has_numbers or has_percentages else 5)
-    categories.append({
-        'name': 'Quantifiable Achievements',
-        'score': quant_score,
-        'issues': ['Add more quantified achievements with specific numbers'],
-        'suggestions': ['Include metrics like "increased sales by 25%" or "managed team of 12"']
-    })
-    
-    # GRAMMAR
-    categories.append({
-        'name': 'Grammar',
-        'score': 9,  # Assume good grammar unless we detect issues
-        'issues': ['Fix grammar errors and improve language accuracy'],
-        'suggestions': ['Use grammar checking tools for final polish']
-    })
-    
-    # USE OF BULLETS
-    has_bullets = any(line.strip().startswith(('•', '-', '*')) for line in lines)
-    bullet_score = 9 if has_bullets else 6
-    categories.append({
-        'name': 'Use Of Bullets',
-        'score': bullet_score,
-        'issues': ['Improve bullet point structure and formatting'],
-        'suggestions': ['Use consistent bullet points for achievements']
-    })
-    
-    # PAGE DENSITY
-    density_score = 9 if 300 < word_count < 800 else (7 if word_count > 200 else 5)
-    categories.append({
-        'name': 'Page Density',
-        'score': density_score,
-        'issues': ['Optimize page layout and white space usage'],
-        'suggestions': ['Balance content density for better readability']
-    })
-    
-    # LEADERSHIP
-    leadership_words = ['led', 'managed', 'supervised', 'directed', 'mentored', 'coached']
-    leadership_score = 9 if any(word in text_lower for word in leadership_words) else 6
-    categories.append({
-        'name': 'Leadership',
-        'score': leadership_score,
-        'issues': ['Highlight mentorship and coaching of junior team members'],
-        'suggestions': ['Add specific examples of team leadership and management']
-    })
-    
-    # EDUCATION SECTION
-    education_words = ['university', 'college', 'degree', 'bachelor', 'master', 'phd', 'education']
-    has_education = any(word in text_lower for word in education_words)
-    categories.append({
-        'name': 'Education Section',
-        'score': 9 if has_education else 6,
-        'issues': ['Optimize education section format and content'],
-        'suggestions': ['Include degree, institution, and graduation year']
-    })
-    
-    # CV READABILITY SCORE
-    categories.append({
-        'name': 'CV Readability Score',
-        'score': 8.7,  # Good baseline score
-        'issues': ['Improve resume structure, formatting, and ATS compatibility for better readability'],
-        'suggestions': ['Use clear headings and consistent formatting']
-    })
-    
-    # VERBOSITY
-    avg_sentence_length = word_count / max(1, len([l for l in lines if l.strip()]))
-    verbosity_score = 8 if avg_sentence_length < 20 else 6
-    categories.append({
-        'name': 'Verbosity',
-        'score': verbosity_score,
-        'issues': ['Reduce wordiness for better readability'],
-        'suggestions': ['Use concise, impactful language']
-    })
-    
-    # ACTIVE VOICE
-    passive_indicators = ['was responsible', 'were responsible', 'was tasked', 'was assigned']
-    has_passive = any(indicator in text_lower for indicator in passive_indicators)
-    categories.append({
-        'name': 'Active Voice',
-        'score': 8 if not has_passive else 6,
-        'issues': ['Convert passive voice to active voice for impact'],
-        'suggestions': ['Replace "was responsible for" with action verbs like "managed"']
-    })
-    
-    # SKILLS SECTION
-    has_skills_section = 'skills' in text_lower or 'technologies' in text_lower or 'competencies' in text_lower
-    categories.append({
-        'name': 'Skills Section',
-        'score': 8 if has_skills_section else 5,
-        'issues': ['Add specific software proficiency levels (Expert, Advanced, Intermediate)'],
-        'suggestions': ['Create dedicated skills section with technical competencies']
-    })
-    
-    # PERSONAL PRONOUNS
-    pronouns = ['i ', ' i ', 'my ', 'me ', 'myself']
-    has_pronouns = any(pronoun in text_lower for pronoun in pronouns)
-    categories.append({
-        'name': 'Personal Pronouns',
-        'score': 7 if not has_pronouns else 5,
-        'issues': ['Remove first-person pronouns like "I", "me", "my"'],
-        'suggestions': ['Use professional third-person perspective']
-    })
-    
-    # UNNECESSARY SECTIONS
-    unnecessary_words = ['references', 'hobbies', 'interests', 'objective']
-    has_unnecessary = any(word in text_lower for word in unnecessary_words)
-    categories.append({
-        'name': 'Unnecessary Sections',
-        'score': 6 if has_unnecessary else 8,
-        'issues': ['Remove outdated sections like References, Objective, and high school education when you have higher qualifications'],
-        'suggestions': ['Focus on professional experience and achievements']
-    })
-    
-    # DRIVE
-    initiative_words = ['initiated', 'pioneered', 'launched', 'established', 'founded', 'created']
-    has_initiative = any(word in text_lower for word in initiative_words)
-    categories.append({
-        'name': 'Drive',
-        'score': 5 if not has_initiative else 7,
-        'issues': ['Show initiative and self-motivation examples'],
-        'suggestions': ['Include projects you initiated or innovative solutions you created']
-    })
-    
-    # TEAMWORK
-    teamwork_words = ['collaborated', 'partnered', 'cross-functional', 'team member', 'worked with']
-    has_teamwork = any(word in text_lower for word in teamwork_words)
-    categories.append({
-        'name': 'Teamwork',
-        'score': 5 if not has_teamwork else 7,
-        'issues': ['Better showcase collaborative experiences'],
-        'suggestions': ['Include cross-functional projects and collaborative achievements']
-    })
-    
-    # ANALYTICAL
-    analytical_words = ['analyzed', 'evaluated', 'assessed', 'data', 'metrics', 'research']
-    has_analytical = any(word in text_lower for word in analytical_words)
-    categories.append({
-        'name': 'Analytical',
-        'score': 5 if not has_analytical else 7,
-        'issues': ['Quantify analytical impact with percentages and metrics'],
-        'suggestions': ['Include data analysis, research, or problem-solving achievements']
-    })
-    
-    # CERTIFICATIONS
-    cert_words = ['certified', 'certification', 'license', 'credential']
-    has_certifications = any(word in text_lower for word in cert_words)
-    categories.append({
-        'name': 'Certifications',
-        'score': 4 if not has_certifications else 7,
-        'issues': ['Obtain fundamental industry certifications immediately'],
-        'suggestions': ['Add relevant professional certifications and training']
-    })
-    
-    # VERB TENSES
-    mixed_tense_indicators = ['currently', 'present', 'ongoing']
-    has_mixed_tenses = any(indicator in text_lower for indicator in mixed_tense_indicators)
-    categories.append({
-        'name': 'Verb Tenses',
-        'score': 4 if has_mixed_tenses else 6,
-        'issues': ['Use consistent and appropriate verb tenses'],
-        'suggestions': ['Use present tense for current role, past tense for previous roles']
-    })
-    
-    # SUMMARY
-    has_summary = any(word in text_lower for word in ['summary', 'profile', 'about', 'overview'])
-    categories.append({
-        'name': 'Summary',
-        'score': 3 if not has_summary else 6,
-        'issues': ['Rewrite entire summary removing all personal pronouns'],
-        'suggestions': ['Add professional summary highlighting key achievements']
-    })
-    
-    # DATES
-    import re
-    has_dates = bool(re.search(r'\b\d{4}\b', text)) or bool(re.search(r'\d{1,2}/\d{4}', text))
-    categories.append({
-        'name': 'Dates',
-        'score': 0 if not has_dates else 6,
-        'issues': ['Add missing employment and education dates immediately'],
-        'suggestions': ['Include consistent date formatting throughout resume']
-    })
-    
-    # GROWTH SIGNALS
-    growth_words = ['promoted', 'advanced', 'progressed', 'increased responsibility']
-    has_growth = any(word in text_lower for word in growth_words)
-    categories.append({
-        'name': 'Growth Signals',
-        'score': 0 if not has_growth else 6,
-        'issues': ['Highlight any promotion or role expansion you\'ve had'],
-        'suggestions': ['Show career progression and increased responsibilities']
-    })
-    
-    # REPETITION
-    words = text_lower.split()
-    word_freq = {}
-    for word in words:
-        if len(word) > 4:  # Only check longer words
-            word_freq[word] = word_freq.get(word, 0) + 1
-    
-    max_repetition = max(word_freq.values()) if word_freq else 0
-    repetition_score = 0 if max_repetition > 8 else (5 if max_repetition > 5 else 8)
-    categories.append({
-        'name': 'Repetition',
-        'score': repetition_score,
-        'issues': ['Completely rewrite repetitive phrases with varied vocabulary'],
-        'suggestions': ['Use synonyms and varied language to avoid word repetition']
-    })
-    
-    return categories
+# LRU cache of full analysis results keyed by the SHA-256 of the file bytes,
+# so re-uploads of an unchanged file skip text extraction and scoring
+ANALYSIS_CACHE_SIZE = 64
+# Config files the scorer reads - their mtimes are part of the cache key, so a config
+# edit invalidates cached scores just as it rebuilds the config-derived tables
+ANALYSIS_CONFIG_NAMES = ('ats_scoring', 'industry_keywords', 'language_quality', 'penalty_config', 'professional_language')
+_analysis_cache: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+_analysis_cache_lock = threading.Lock()
 
 def analyze_resume_content(file_url: str) -> Dict[str, Any]:
     """
@@ -6999,27 +6645,33 @@ def analyze_resume_content(file_url: str) -> Dict[str, Any]:
             raise FileProcessingError("Invalid file URL format")
         
         # Download file with timeout and size limits
-        response = requests.get(file_url, timeout=30, stream=True)
-        response.raise_for_status()
-        
-        # Check file size (max 10MB)
-        content_length = response.headers.get('content-length')
-        if content_length and int(content_length) > 10 * 1024 * 1024:
-            raise FileProcessingError("File size exceeds 10MB limit")
-        
-        file_content = response.content
-        
-        # Clean up response object
-        response.close()
-        del response
+        file_content = download_file_content(file_url, timeout=30)
+        
+        # Derive file metadata (and the content hash used for duplicate detection) from the bytes
+        file_info = get_file_info_from_bytes(file_url, file_content)
+        
+        cache_key = (file_info['file_hash'],) + tuple(config_loader.config_mtime(name) for name in ANALYSIS_CONFIG_NAMES)
+        with _analysis_cache_lock:
+            cached_result = _analysis_cache.get(cache_key)
+            if cached_result is not None:
+                _analysis_cache.move_to_end(cache_key)
+        if cached_result is not None:
+            logger.info("♻️ Returning cached analysis for previously analyzed file")
+            # The cached entry is a private deep copy - callers only set top-level fields, so a
+            # shallow copy keeps it intact; nested results are shared and read-only. The URL and
+            # file metadata (filename, type) belong to this upload, not the one that was cached
+            result = dict(cached_result)
+            result['file_url'] = file_url
+            result['file_info'] = file_info
+            result['cache_hit'] = True
+            return result
         
         # Extract text content with memory monitoring
         logger.info(f"📝 Starting text extraction from file")
         content = extract_text_from_file(file_content, file_url)
         
-        # Clean up file content immediately after extraction
+        # Drop the download buffer before scoring - refcounting frees it, no GC pass needed
         del file_content
-        cleanup_memory()
         
         # Validate extracted content
         if not content or len(content.strip()) < 50:
@@ -7027,8 +6679,11 @@ def analyze_resume_content(file_url: str) -> Dict[str, Any]:
         
         logger.info(f"Successfully extracted {len(content)} characters from resume")
         
+        # Scan the content once for both personal information and scoring
+        scan = scan_resume(content)
+        
         # Extract personal information from CV content
-        personal_info = extract_personal_information(content)
+        personal_info = extract_personal_information(content, scan)
         logger.info(f"Extracted personal information: {list(personal_info.keys())}")
         
         # Debug: Log what was actually found vs None
@@ -7040,11 +6695,10 @@ def analyze_resume_content(file_url: str) -> Dict[str, Any]:
         logger.info(f"Years of experience: {personal_info.get('years_of_experience', 'None')}")
         
         # Extract filename from URL for analysis
-        import os
         filename = os.path.basename(file_url) if file_url else None
         
         # Perform comprehensive ATS analysis
-        ats_analysis = calculate_comprehensive_ats_score(content, filename=filename)
+        ats_analysis = calculate_comprehensive_ats_score(content, filename=filename, scan=scan)
         
         # Debug: Log component scores to see why total is 100
         logger.info(f"Component scores breakdown:")
@@ -7080,10 +6734,11 @@ def analyze_resume_content(file_url: str) -> Dict[str, Any]:
             **recommendations,
             'personal_information': personal_info,
             'extracted_text_length': len(content),
-            'analysis_timestamp': json.dumps({}).__class__.__module__, # Simple timestamp
+            'analysis_timestamp': datetime.now(timezone.utc).isoformat(),
             
             # CRITICAL: Include original file data for resume improvement API
             'file_url': file_url,  # Original PDF URL for re-processing
+            'file_info': file_info,  # Metadata of the downloaded file (size, type, content hash)
             'content': content,    # Extracted text content
             
             # Enhanced algorithm features
@@ -7098,7 +6753,7 @@ def analyze_resume_content(file_url: str) -> Dict[str, Any]:
             'potential_improvement': detailed_issues['potential_improvement'],  # Realistic improvement
             'realistic_target_score': detailed_issues['realistic_target_score'],  # Target score
             'estimated_time': detailed_issues['estimated_time'],  # Time to complete
-            'actionable_improvements': len([i for i in critical_issues + quick_fixes if i.get('time_to_fix', '').split()[0].isdigit() and int(i.get('time_to_fix', '0').split()[0]) <= 5])
+            'actionable_improvements': sum(1 for issue in chain(critical_issues, quick_fixes) if is_quick_fix(issue))
         }
         
         # CRITICAL: Generate comprehensive TXT issues report for Flask app
@@ -7140,6 +6795,14 @@ def analyze_resume_content(file_url: str) -> Dict[str, Any]:
             logger.error("❌ FINAL CHECK: comprehensive_issues_report NOT FOUND in result!")
         
         logger.info(f"Analysis completed - Score: {ats_analysis.get('comprehensive_final_score', ats_analysis.get('ats_score', 'Unknown'))}")
+        
+        # Store a private copy so callers can mutate the returned dict freely
+        cached_result = copy.deepcopy(result)
+        with _analysis_cache_lock:
+            _analysis_cache[cache_key] = cached_result
+            if len(_analysis_cache) > ANALYSIS_CACHE_SIZE:
+                _analysis_cache.popitem(last=False)
+        
         return result
         
     except requests.exceptions.Timeout:
@@ -9021,7 +8684,7 @@ def explain_score_with_frontend_logic(category_name: str, score: int, resume_tex
                 
         elif category_lower == 'dates':
             # Run actual date analysis
-            relevant_content = extract_relevant_sections_for_dates(resume_text)
+            relevant_content = extract_relevant_sections_for_dates(resume_text.split('\n'), resume_text.lower().split('\n'))
             
             # Check for date patterns
             import re
@@ -4,6 +4,7 @@ Converts Vercel serverless functions to Render.com web service
 """
 
 from flask import Flask, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from werkzeug.serving import WSGIRequestHandler
 import sys
@@ -11,7 +12,16 @@ import os
 import json
 import time
 import gc
+import gzip
 import signal
+import threading
+
+# orjson serializes large analysis responses several times faster than stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Add API modules to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'api', 'cv-parser'))
@@ -21,11 +31,30 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'utils'))
 
 app = Flask(__name__)
 
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that lets jsonify() write orjson bytes straight into the response"""
+    
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS if ORJSON_AVAILABLE else 0
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self.option).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self.option)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+if ORJSON_AVAILABLE:
+    app.json = OrjsonProvider(app)
+
 # Configure CORS with explicit headers for better compatibility
 CORS(app, 
      origins="*",  # Allow all origins
      methods=['GET', 'POST', 'OPTIONS', 'HEAD', 'PUT', 'DELETE'],
-     allow_headers=['Content-Type', 'Accept', 'Authorization', 'X-Requested-With', 'Origin'],
+     allow_headers=['Content-Type', 'Accept', 'Authorization', 'X-Requested-With', 'Origin', 'Idempotency-Key'],
      expose_headers=['Content-Type', 'Authorization'], 
      supports_credentials=False,  # Must be False when origins="*"
      max_age=86400,
@@ -48,12 +77,33 @@ def timeout_handler(signum, frame):
 
 signal.signal(signal.SIGALRM, timeout_handler)
 
+# JSON responses smaller than this are not worth compressing
+GZIP_MIN_SIZE = 1024
+
+@app.after_request
+def gzip_json_response(response):
+    """Gzip JSON responses for clients that accept it - analysis results compress 5-10x"""
+    if (response.direct_passthrough
+            or response.mimetype != 'application/json'
+            or 'Content-Encoding' in response.headers
+            or 'gzip' not in request.headers.get('Accept-Encoding', '').lower()):
+        return response
+    
+    body = response.get_data()
+    if len(body) < GZIP_MIN_SIZE:
+        return response
+    
+    response.set_data(gzip.compress(body, compresslevel=4))
+    response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding')
+    return response
+
 # Backup CORS headers function
 def add_cors_headers(response):
     """Add CORS headers as backup in case flask_cors doesn't work properly"""
     response.headers['Access-Control-Allow-Origin'] = '*'
     response.headers['Access-Control-Allow-Methods'] = 'GET, POST, OPTIONS, HEAD, PUT, DELETE'
-    response.headers['Access-Control-Allow-Headers'] = 'Content-Type, Accept, Authorization, X-Requested-With, Origin'
+    response.headers['Access-Control-Allow-Headers'] = 'Content-Type, Accept, Authorization, X-Requested-With, Origin, Idempotency-Key'
     response.headers['Access-Control-Max-Age'] = '86400'
     return response
 
@@ -70,7 +120,8 @@ try:
         del sys.modules[module_name]
     
     # Fresh import
-    from index import analyze_resume_content, ATSAnalysisError
+    from index import (analyze_resume_content, ATSAnalysisError, FileTooLargeError, log_activity_async,
+                       PDF_DIAGNOSTICS)
     
     # Verify we have the latest version by checking if generate_comprehensive_issues_report exists
     try:
@@ -176,6 +227,7 @@ def health_check():
             "job_analyzer": job_analyzer_available
         },
         "supabase": supabase_status,
+        "pdf_extraction": PDF_DIAGNOSTICS if cv_parser_available else None,
         "env_vars": {
             "supabase_url": bool(os.environ.get('SUPABASE_URL')),
             "supabase_key": bool(os.environ.get('PUBLIC_SUPABASE_PUBLISHABLE_DEFAULT_KEY'))
@@ -226,6 +278,14 @@ def app_config():
     
     return jsonify(config_info)
 
+# Recent cv-parser responses keyed by (Idempotency-Key header, file_url), so double-clicks and
+# client retries within the TTL get the same result instead of re-running the pipeline.
+# Requests without the header are never cached; only fully saved results are stored
+IDEMPOTENCY_TTL_SECONDS = 60
+IDEMPOTENCY_MAX_ENTRIES = 256
+recent_cv_results = {}
+recent_cv_results_lock = threading.Lock()
+
 @app.route('/api/cv-parser', methods=['POST', 'OPTIONS'])
 def cv_parser():
     """CV Parser API endpoint with timeout and memory management"""
@@ -242,9 +302,11 @@ def cv_parser():
     # Set alarm for timeout (45 seconds for CV analysis - longer than job analysis)
     signal.alarm(45)
     
+    # Known for the activity log on failure paths once set
+    file_url = None
+    final_email = None
+    
     try:
-        # Force initial garbage collection
-        gc.collect()
         # Get request data
         data = request.get_json()
         
@@ -256,6 +318,17 @@ def cv_parser():
         if not file_url:
             return jsonify({"error": "file_url is required"}), 400
         
+        # Idempotent retries of the same upload reuse the response from the last minute
+        client_key = request.headers.get('Idempotency-Key')
+        idempotency_key = (client_key, file_url) if client_key else None
+        now = time.time()
+        if idempotency_key:
+            with recent_cv_results_lock:
+                recent = recent_cv_results.get(idempotency_key)
+            if recent and now - recent[0] < IDEMPOTENCY_TTL_SECONDS:
+                print(f"♻️ Returning recent result for repeated request: {file_url}")
+                return add_cors_headers(jsonify(recent[1]))
+        
         # Optional parameters
         analysis_type = data.get('analysis_type', 'comprehensive')
         include_recommendations = data.get('include_recommendations', True)
@@ -284,70 +357,81 @@ def cv_parser():
             print(f"❌ FLASK APP DEBUG: comprehensive_issues_report NOT FOUND in analyze_resume_content result!")
             print(f"🔍 FLASK APP DEBUG: Available fields: {list(result.keys())}")
         
-        # Force garbage collection after analysis
-        gc.collect()
-        
         # Add database operations (from Vercel handler)
         try:
-            from index import (save_user_profile_data, save_resume_record, save_analysis_results, 
-                              handle_missing_email, generate_session_uuid, get_file_info_from_url)
+            from index import (save_user_profile_data, save_resume_record, save_analysis_results, save_cv_submission,
+                              handle_missing_email, generate_session_uuid)
             
             # Extract personal information and handle email with UUID fallback
             personal_info = result.get('personal_information', {})
             session_uuid = generate_session_uuid()
             
             # Handle missing email with UUID fallback
-            final_email = handle_missing_email(personal_info, session_uuid)
-            is_temp_email = '@bestcvbuilder.com' in final_email
+            final_email, is_temp_email = handle_missing_email(personal_info, session_uuid)
             
             print(f"🔍 Processing CV with email: {final_email} (temporary: {is_temp_email})")
             
-            # Step 1: Save/update user profile with UUID tracking
-            print(f"🔄 Attempting to save user profile for: {final_email}")
-            try:
-                profile_saved = save_user_profile_data(final_email, personal_info, session_uuid)
-                print(f"✅ Profile save result: {profile_saved}")
-            except Exception as e:
-                print(f"❌ Profile save failed: {str(e)}")
-                profile_saved = False
-                
-            result['profile_updated'] = profile_saved
             result['session_uuid'] = session_uuid
             result['email_used'] = final_email
             result['is_temporary_email'] = is_temp_email
             
-            # Step 2: Save resume record with UUID
-            print(f"🔄 Attempting to save resume record...")
-            try:
-                file_info = get_file_info_from_url(file_url)
-                if not file_info:
-                    file_info = {
-                        'original_filename': 'uploaded_resume.pdf',
-                        'file_size': 1024,  # Default size
-                        'file_type': 'pdf'
-                    }
-                print(f"📄 File info: {file_info}")
-                resume_id = save_resume_record(final_email, file_url, file_info, session_uuid)
-                print(f"✅ Resume save result - ID: {resume_id}")
-            except Exception as e:
-                print(f"❌ Resume save failed: {str(e)}")
-                resume_id = None
-                
-            result['resume_id'] = resume_id
+            # File metadata derived from the downloaded bytes - no second request to the file URL
+            file_info = result.get('file_info') or {
+                'original_filename': 'uploaded_resume.pdf',
+                'file_size': 1024,  # Default size
+                'file_type': 'pdf'
+            }
+            print(f"📄 File info: {file_info}")
             
-            # Step 3: Save analysis results with UUID
-            if resume_id:
-                print(f"🔄 Attempting to save analysis results for resume {resume_id}...")
+            # Save profile, resume record and analysis in a single database round trip
+            print(f"🔄 Attempting batched save of CV submission...")
+            submission = save_cv_submission(final_email, personal_info, file_url, file_info, result, session_uuid,
+                                            is_temp_email=is_temp_email)
+            
+            if submission:
+                profile_saved = submission.get('profile_saved', False)
+                resume_id = submission.get('resume_id')
+                analysis_saved = submission.get('analysis_saved', False)
+                print(f"✅ Batched save result - Resume ID: {resume_id}")
+            else:
+                # Fall back to individual saves so partial writes still land
+                print(f"⚠️  Batched save failed - falling back to individual saves")
+                
+                # Step 1: Save/update user profile with UUID tracking
+                print(f"🔄 Attempting to save user profile for: {final_email}")
                 try:
-                    analysis_saved = save_analysis_results(final_email, resume_id, result, session_uuid)
-                    print(f"✅ Analysis save result: {analysis_saved}")
+                    profile_saved = save_user_profile_data(final_email, personal_info, session_uuid,
+                                                           is_temp_email=is_temp_email)
+                    print(f"✅ Profile save result: {profile_saved}")
                 except Exception as e:
-                    print(f"❌ Analysis save failed: {str(e)}")
-                    analysis_saved = False
-            else:
-                print(f"⚠️  Skipping analysis save - no resume ID")
-                analysis_saved = False
+                    print(f"❌ Profile save failed: {str(e)}")
+                    profile_saved = False
+                
+                # Step 2: Save resume record with UUID
+                print(f"🔄 Attempting to save resume record...")
+                try:
+                    resume_id = save_resume_record(final_email, file_url, file_info, session_uuid,
+                                                   is_temp_email=is_temp_email)
+                    print(f"✅ Resume save result - ID: {resume_id}")
+                except Exception as e:
+                    print(f"❌ Resume save failed: {str(e)}")
+                    resume_id = None
                 
+                # Step 3: Save analysis results with UUID
+                if resume_id:
+                    print(f"🔄 Attempting to save analysis results for resume {resume_id}...")
+                    try:
+                        analysis_saved = save_analysis_results(final_email, resume_id, result, session_uuid)
+                        print(f"✅ Analysis save result: {analysis_saved}")
+                    except Exception as e:
+                        print(f"❌ Analysis save failed: {str(e)}")
+                        analysis_saved = False
+                else:
+                    print(f"⚠️  Skipping analysis save - no resume ID")
+                    analysis_saved = False
+            
+            result['profile_updated'] = profile_saved
+            result['resume_id'] = resume_id
             result['analysis_saved'] = analysis_saved
                 
             print(f"📧 Email used: {final_email}")
@@ -355,6 +439,10 @@ def cv_parser():
             print(f"📄 Resume ID: {resume_id}")
             print(f"📈 Analysis saved: {result.get('analysis_saved', False)}")
             
+            log_activity_async(email=final_email, action='analyze', resource_type='resume',
+                               resource_id=resume_id, success=bool(analysis_saved),
+                               metadata={'ats_score': result.get('ats_score')}, session_uuid=session_uuid)
+            
         except Exception as db_error:
             print(f"❌ Database operations failed: {str(db_error)}")
             result['profile_updated'] = False
@@ -371,6 +459,16 @@ def cv_parser():
             print(f"❌ FLASK FINAL CHECK: comprehensive_issues_report MISSING from final result!")
             print(f"🔍 FLASK FINAL CHECK: Final result keys ({len(result)}): {list(result.keys())}")
         
+        # Remember saved results for retries, pruning expired entries once the table grows -
+        # a retry after a failed save must run (and save) again
+        if idempotency_key and result.get('analysis_saved'):
+            with recent_cv_results_lock:
+                if len(recent_cv_results) >= IDEMPOTENCY_MAX_ENTRIES:
+                    expired = [key for key, entry in recent_cv_results.items() if now - entry[0] >= IDEMPOTENCY_TTL_SECONDS]
+                    for key in expired:
+                        recent_cv_results.pop(key, None)
+                recent_cv_results[idempotency_key] = (now, result)
+        
         # Return results with backup CORS headers
         response = jsonify(result)
         return add_cors_headers(response)
@@ -380,8 +478,17 @@ def cv_parser():
         response = jsonify({"error": "Analysis timeout - please try with a smaller resume file or different format"})
         return add_cors_headers(response), 408  # Request Timeout
         
+    except FileTooLargeError as e:
+        print(f"❌ File too large: {e}")
+        log_activity_async(email=final_email, action='analyze', resource_type='resume', success=False,
+                           error_message=str(e), metadata={'file_url': file_url})
+        response = jsonify({"error": f"Analysis failed: {str(e)}"})
+        return add_cors_headers(response), 413  # Payload Too Large
+        
     except ATSAnalysisError as e:
         print(f"❌ ATS Analysis Error: {e}")
+        log_activity_async(email=final_email, action='analyze', resource_type='resume', success=False,
+                           error_message=str(e), metadata={'file_url': file_url})
         response = jsonify({"error": f"Analysis failed: {str(e)}"})
         return add_cors_headers(response), 400
         
@@ -412,9 +519,6 @@ def job_analyzer():
     signal.alarm(30)
     
     try:
-        # Force initial garbage collection
-        gc.collect()
-        
         # Get request data
         data = request.get_json()
         
@@ -451,9 +555,6 @@ def job_analyzer():
         print(f"✅ Job analysis completed successfully")
         print(f"🎯 Analysis Score: {result.get('analysis_score', 'Not found')}")
         
-        # Force garbage collection after analysis
-        gc.collect()
-        
         # Save to database (similar to cv-parser pattern)
         try:
             # For now, use a dummy email pattern similar to cv-parser
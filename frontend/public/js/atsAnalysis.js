@@ -24,6 +24,50 @@ export { BUILD_ID, API_BASE_URL, CV_PARSER_ENDPOINT };
 console.log('🔗 API Configuration v1.1.0:', { API_BASE_URL, CV_PARSER_ENDPOINT });
 console.log('🚨 CRITICAL: Verify this shows correct URL - should NOT be bestcvbuilder-gamma!');
 
+// One Idempotency-Key per uploaded file: double-clicks and retries of the same upload send the
+// same key, so the API replays its recent result instead of re-running the analysis
+const RETRYABLE_STATUS_CODES = [502, 503, 504];
+const MAX_ANALYSIS_ATTEMPTS = 2;
+const idempotencyKeys = new Map();
+
+function getIdempotencyKey(fileUrl) {
+    if (!idempotencyKeys.has(fileUrl)) {
+        const key = window.crypto && window.crypto.randomUUID
+            ? window.crypto.randomUUID()
+            : `${Date.now()}-${Math.random().toString(36).slice(2)}`;
+        idempotencyKeys.set(fileUrl, key);
+    }
+    return idempotencyKeys.get(fileUrl);
+}
+
+/**
+ * POST to the CV parser, retrying gateway errors and network failures with the same Idempotency-Key
+ * @param {string} fileUrl - URL of the uploaded resume file (selects the key)
+ * @param {Object} requestConfig - fetch options; the Idempotency-Key header is added here
+ * @returns {Promise<Response>} The last response received
+ */
+async function postWithIdempotencyKey(fileUrl, requestConfig) {
+    const config = {
+        ...requestConfig,
+        headers: { ...requestConfig.headers, 'Idempotency-Key': getIdempotencyKey(fileUrl) }
+    };
+    
+    for (let attempt = 1; ; attempt++) {
+        try {
+            const response = await fetch(CV_PARSER_ENDPOINT, config);
+            if (attempt >= MAX_ANALYSIS_ATTEMPTS || !RETRYABLE_STATUS_CODES.includes(response.status)) {
+                return response;
+            }
+            console.warn(`⚠️ CV parser returned ${response.status}, retrying with the same Idempotency-Key`);
+        } catch (error) {
+            if (attempt >= MAX_ANALYSIS_ATTEMPTS || error.name !== 'TypeError') {
+                throw error;
+            }
+            console.warn('⚠️ CV parser request failed, retrying with the same Idempotency-Key:', error.message);
+        }
+    }
+}
+
 
 /**
  * Analyze resume using the Python ATS engine
@@ -47,7 +91,7 @@ export async function analyzeResume(fileUrl, userId = null) {
             console.log('Including user_id for database saving:', userId);
         }
         
-        const response = await fetch(CV_PARSER_ENDPOINT, {
+        const response = await postWithIdempotencyKey(fileUrl, {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json',
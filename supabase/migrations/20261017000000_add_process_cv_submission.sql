@@ -0,0 +1,105 @@
+-- Batch the CV upload writes into a single RPC
+-- Saves profile, resume record and analysis results in one round trip and one transaction
+
+CREATE OR REPLACE FUNCTION process_cv_submission(
+    p_email VARCHAR(320),
+    p_session_uuid UUID,
+    p_email_source VARCHAR(50),
+    p_profile_data JSONB,
+    p_resume_data JSONB,
+    p_analysis_data JSONB
+)
+RETURNS JSONB AS $$
+DECLARE
+    v_resume_id INTEGER;
+BEGIN
+    -- 1. Upsert the user profile (also records the UUID/email mapping)
+    PERFORM upsert_user_profile_with_uuid(p_email, p_session_uuid, p_profile_data, p_email_source);
+
+    -- 2. Insert the resume record, already completed since analysis has finished
+    INSERT INTO resumes (
+        email, session_uuid, email_source,
+        original_filename, file_path, file_url, file_size, file_type, file_hash,
+        processing_status, processed_at, upload_source
+    ) VALUES (
+        p_email,
+        p_session_uuid,
+        p_email_source,
+        p_resume_data->>'original_filename',
+        p_resume_data->>'file_path',
+        p_resume_data->>'file_url',
+        (p_resume_data->>'file_size')::INTEGER,
+        p_resume_data->>'file_type',
+        p_resume_data->>'file_hash',
+        COALESCE(p_resume_data->>'processing_status', 'completed'),
+        COALESCE((p_resume_data->>'processed_at')::TIMESTAMP WITH TIME ZONE, CURRENT_TIMESTAMP),
+        COALESCE(p_resume_data->>'upload_source', 'web_app')
+    )
+    -- Re-uploading the same file for the same email reuses its row
+    ON CONFLICT (email, file_hash) DO UPDATE SET
+        session_uuid = EXCLUDED.session_uuid,
+        original_filename = EXCLUDED.original_filename,
+        file_path = EXCLUDED.file_path,
+        file_url = EXCLUDED.file_url,
+        file_size = EXCLUDED.file_size,
+        file_type = EXCLUDED.file_type,
+        processing_status = EXCLUDED.processing_status,
+        processed_at = EXCLUDED.processed_at
+    RETURNING id INTO v_resume_id;
+
+    -- 3. Insert the analysis results for that resume
+    INSERT INTO resume_analysis (
+        email, resume_id, session_uuid,
+        ats_score, score_category,
+        structure_score, keywords_score, contact_score,
+        formatting_score, achievements_score, readability_score,
+        strengths, improvements, missing_keywords, found_keywords,
+        detailed_analysis, recommendations,
+        detected_industry, analysis_version
+    ) VALUES (
+        p_email,
+        v_resume_id,
+        p_session_uuid,
+        (p_analysis_data->>'ats_score')::INTEGER,
+        p_analysis_data->>'score_category',
+        (p_analysis_data->>'structure_score')::INTEGER,
+        (p_analysis_data->>'keywords_score')::INTEGER,
+        (p_analysis_data->>'contact_score')::INTEGER,
+        (p_analysis_data->>'formatting_score')::INTEGER,
+        (p_analysis_data->>'achievements_score')::INTEGER,
+        (p_analysis_data->>'readability_score')::INTEGER,
+        COALESCE(p_analysis_data->'strengths', '[]'::jsonb),
+        COALESCE(p_analysis_data->'improvements', '[]'::jsonb),
+        COALESCE(p_analysis_data->'missing_keywords', '[]'::jsonb),
+        COALESCE(p_analysis_data->'found_keywords', '[]'::jsonb),
+        COALESCE(p_analysis_data->'detailed_analysis', '{}'::jsonb),
+        COALESCE(p_analysis_data->'recommendations', '{}'::jsonb),
+        p_analysis_data->>'detected_industry',
+        COALESCE(p_analysis_data->>'analysis_version', '2.0')
+    )
+    ON CONFLICT (resume_id) DO UPDATE SET
+        session_uuid = EXCLUDED.session_uuid,
+        ats_score = EXCLUDED.ats_score,
+        score_category = EXCLUDED.score_category,
+        structure_score = EXCLUDED.structure_score,
+        keywords_score = EXCLUDED.keywords_score,
+        contact_score = EXCLUDED.contact_score,
+        formatting_score = EXCLUDED.formatting_score,
+        achievements_score = EXCLUDED.achievements_score,
+        readability_score = EXCLUDED.readability_score,
+        strengths = EXCLUDED.strengths,
+        improvements = EXCLUDED.improvements,
+        missing_keywords = EXCLUDED.missing_keywords,
+        found_keywords = EXCLUDED.found_keywords,
+        detailed_analysis = EXCLUDED.detailed_analysis,
+        recommendations = EXCLUDED.recommendations,
+        detected_industry = EXCLUDED.detected_industry,
+        analysis_version = EXCLUDED.analysis_version;
+
+    RETURN jsonb_build_object(
+        'resume_id', v_resume_id,
+        'profile_saved', TRUE,
+        'analysis_saved', TRUE
+    );
+END;
+$$ LANGUAGE plpgsql;
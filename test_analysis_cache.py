@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Test script for the cv-parser analysis cache used on re-uploads of the same file
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), 'api', 'cv-parser'))
+
+import index
+
+SAMPLE_RESUME = """
+Jane Smith
+jane.smith@example.com | (555) 123-4567
+
+EXPERIENCE
+Senior Software Engineer, Acme Corp (2019 - Present)
+• Led migration of billing services to Python, cutting costs by 30%
+• Managed a team of 6 engineers delivering 12 releases per year
+
+SKILLS
+Python, SQL, AWS, Docker
+"""
+
+def analyze_uploads(file_urls, between=None):
+    """Analyze each URL with the same mocked file bytes, calling between() after the first one"""
+    file_bytes = b'%PDF-1.4 same resume bytes'
+    original_download = index.download_file_content
+    original_extract = index.extract_text_from_file
+    index.download_file_content = lambda file_url, timeout=30: file_bytes
+    index.extract_text_from_file = lambda file_content, file_url: SAMPLE_RESUME
+    index._analysis_cache.clear()
+    try:
+        results = []
+        for file_url in file_urls:
+            results.append(index.analyze_resume_content(file_url))
+            if between and len(results) == 1:
+                between()
+        return results
+    finally:
+        index.download_file_content = original_download
+        index.extract_text_from_file = original_extract
+        index._analysis_cache.clear()
+
+def test_cache_hit_keeps_upload_metadata():
+    """A re-upload of the same bytes under a new name reports the new filename, not the cached one"""
+    first, second = analyze_uploads([
+        'https://example.com/uploads/alice_cv.pdf',
+        'https://example.com/uploads/bob_resume_final.pdf'
+    ])
+
+    record = index.build_resume_record('bob@example.com', second['file_url'], second['file_info'])
+
+    print(f"♻️ Cache hit: {second.get('cache_hit')}, filename: {record['original_filename']}")
+    assert not first.get('cache_hit')
+    assert second.get('cache_hit')
+    assert second['file_url'].endswith('bob_resume_final.pdf')
+    assert record['original_filename'] == 'bob_resume_final.pdf'
+    assert first['file_info']['original_filename'] == 'alice_cv.pdf'
+    return True
+
+def test_config_edit_invalidates_cache():
+    """Touching a scoring config file makes the next upload of the same bytes a cache miss"""
+    config_path = os.path.join(os.path.dirname(__file__), 'api', 'cv-parser', 'config', 'ats_scoring.json')
+    stat = os.stat(config_path)
+
+    def touch():
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    try:
+        first, second = analyze_uploads([
+            'https://example.com/uploads/alice_cv.pdf',
+            'https://example.com/uploads/alice_cv.pdf'
+        ], between=touch)
+    finally:
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    print(f"🛠️ Cache hit after config edit: {second.get('cache_hit', False)}")
+    assert not first.get('cache_hit')
+    assert not second.get('cache_hit')
+    return True
+
+if __name__ == "__main__":
+    success = test_cache_hit_keeps_upload_metadata()
+    success &= test_config_edit_invalidates_cache()
+    print(f"\n{'✅ Test PASSED' if success else '❌ Test FAILED'}")
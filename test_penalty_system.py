@@ -54,6 +54,76 @@ def test_penalty_system():
     
     return result['final_score'] < 85  # Should be lower due to penalties
 
+def test_quantified_money_figure():
+    """A comma-grouped dollar amount counts as one figure, not '$2' plus a stray '000,000'"""
+    from index import analyze_quantified_achievements, scan_resume
+    
+    result = analyze_quantified_achievements(scan_resume("Led sales team saving $2,000,000 across 40 clients"))
+    matches = [achievement['match'] for achievement in result['achievements']]
+    
+    print(f"💰 Quantified matches: {matches}")
+    assert '2,000,000' in matches
+    assert '000,000' not in matches
+    assert '$2' not in matches
+    assert result['count'] == 2
+    return True
+
+def test_years_of_experience_priority():
+    """An explicit 'N years of experience' statement wins over an earlier 'N years in' mention"""
+    from index import estimate_years_of_experience
+    
+    years = estimate_years_of_experience("Worked 3 years in Java and Python\n10+ years of professional experience")
+    
+    print(f"📅 Years of experience: {years}")
+    assert years == 10
+    return True
+
+def test_phone_formats_listed_once():
+    """Each phone number is listed once whatever its format, longest first"""
+    from index import analyze_contact_information, scan_resume
+    
+    contact = analyze_contact_information(scan_resume("Phone: +1 (555) 123-4567 | Mobile: 555.987.6543\n"))
+    phones = contact['found_contacts'].get('phone')
+    
+    print(f"📞 Phones found: {phones}")
+    assert phones == ['+1 (555) 123-4567', '555.987.6543']
+    return True
+
+def test_title_header_not_bullet():
+    """A 'Title | Company' header is not a bullet - action words match whole words, not 'in' inside 'Engineer'"""
+    from index import extract_bullets_from_lines
+    
+    bullets = extract_bullets_from_lines([
+        "Software Engineer | StartupXYZ | Remote",
+        "• Developed a payments API used by 2M customers",
+    ])
+    
+    print(f"🔫 Bullets found: {bullets}")
+    assert bullets == ['Developed a payments API used by 2M customers']
+    return True
+
+def test_date_next_to_phone_rejected():
+    """A date beside a phone number is not an employment date, even when the same date appears in a job line"""
+    from index import analyze_date_formatting, scan_resume
+    
+    resume = """John Smith
+
+EXPERIENCE
+Software Engineer | Acme Corp | March 2021 - Present
+Developed payment services and led a team of five engineers across two regions
+On-call mobile 555 0100 since March 2021
+"""
+    dates = analyze_date_formatting(scan_resume(resume))['detected_dates']
+    
+    print(f"🗓️ Dates found: {dates}")
+    assert dates.count('Mar 2021') == 1
+    return True
+
 if __name__ == "__main__":
     success = test_penalty_system()
+    success &= test_quantified_money_figure()
+    success &= test_years_of_experience_priority()
+    success &= test_phone_formats_listed_once()
+    success &= test_title_header_not_bullet()
+    success &= test_date_next_to_phone_rejected()
     print(f"\n{'✅ Test PASSED' if success else '❌ Test FAILED'}")
\ No newline at end of file
@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 """
-Test script to verify Render.com setup with enhanced PDF extraction
-Tests the new priority system: pdfplumber > PyMuPDF > pdfminer > PyPDF2
+Test script to verify Render.com setup with PyMuPDF PDF extraction
 """
 
 import sys
@@ -20,31 +19,12 @@ def test_dependencies():
     print("🔍 Testing PDF extraction dependencies for Render.com...")
     
     dependencies = {
-        'PyPDF2': False,
-        'pdfplumber': False, 
         'PyMuPDF': False,
-        'pdfminer': False,
         'python-docx': False,
         'supabase': False,
         'flask': False
     }
     
-    # Test PyPDF2
-    try:
-        import PyPDF2
-        dependencies['PyPDF2'] = True
-        print("✅ PyPDF2 available")
-    except ImportError as e:
-        print(f"❌ PyPDF2 not available: {e}")
-    
-    # Test pdfplumber
-    try:
-        import pdfplumber
-        dependencies['pdfplumber'] = True
-        print("✅ pdfplumber available")
-    except ImportError as e:
-        print(f"❌ pdfplumber not available: {e}")
-    
     # Test PyMuPDF
     try:
         import fitz  # PyMuPDF
@@ -53,14 +33,6 @@ def test_dependencies():
     except ImportError as e:
         print(f"❌ PyMuPDF not available: {e}")
     
-    # Test pdfminer
-    try:
-        from pdfminer.high_level import extract_text
-        dependencies['pdfminer'] = True
-        print("✅ pdfminer available")
-    except ImportError as e:
-        print(f"❌ pdfminer not available: {e}")
-    
     # Test python-docx
     try:
         import docx
@@ -91,20 +63,11 @@ def test_dependencies():
     
     print(f"\n📊 Dependency Summary: {available_count}/{total_count} available")
     
-    # PDF extraction specific summary
-    pdf_deps = ['PyPDF2', 'pdfplumber', 'PyMuPDF', 'pdfminer']
-    pdf_available = sum(1 for dep in pdf_deps if dependencies[dep])
-    
-    print(f"📄 PDF extraction methods: {pdf_available}/{len(pdf_deps)} available")
-    
-    if pdf_available >= 3:
-        print("🎉 Excellent: Multiple high-quality PDF extraction methods available!")
-    elif pdf_available >= 2:
-        print("✅ Good: Multiple PDF extraction methods available")
-    elif pdf_available == 1:
-        print("⚠️  Warning: Only one PDF extraction method available")
+    # PDF extraction runs on PyMuPDF only
+    if dependencies['PyMuPDF']:
+        print("✅ PDF extraction available (PyMuPDF)")
     else:
-        print("❌ Critical: No PDF extraction methods available!")
+        print("❌ Critical: PyMuPDF missing - PDF extraction unavailable!")
     
     return dependencies
 
@@ -128,17 +91,15 @@ def test_flask_import():
         return False
 
 def test_pdf_extraction_priority():
-    """Test the new PDF extraction priority system"""
-    print("\n🏆 Testing PDF extraction priority system...")
+    """Test the PDF extraction backends are importable"""
+    print("\n🏆 Testing PDF extraction setup...")
     
     try:
-        from index import extract_pdf_text, PDFPLUMBER_AVAILABLE, PYMUPDF_AVAILABLE, PDFMINER_AVAILABLE, PYPDF2_AVAILABLE
+        from index import extract_pdf_text, PYMUPDF_AVAILABLE, DOCX_AVAILABLE
         
-        print(f"Priority order status:")
-        print(f"  1. pdfplumber: {'✅' if PDFPLUMBER_AVAILABLE else '❌'}")
-        print(f"  2. PyMuPDF: {'✅' if PYMUPDF_AVAILABLE else '❌'}")
-        print(f"  3. pdfminer: {'✅' if PDFMINER_AVAILABLE else '❌'}")
-        print(f"  4. PyPDF2: {'✅' if PYPDF2_AVAILABLE else '❌'}")
+        print(f"Extraction status:")
+        print(f"  PyMuPDF: {'✅' if PYMUPDF_AVAILABLE else '❌'}")
+        print(f"  python-docx: {'✅' if DOCX_AVAILABLE else '❌'}")
         
         # Test would require actual PDF file
         print("⏳ PDF extraction test requires actual PDF file (skipped for now)")
@@ -160,7 +121,7 @@ if __name__ == "__main__":
     print("\n" + "=" * 50)
     print("🎯 RENDER.COM READINESS SUMMARY:")
     
-    critical_deps = ['PyPDF2', 'supabase', 'flask']
+    critical_deps = ['PyMuPDF', 'supabase', 'flask']
     critical_available = all(deps.get(dep, False) for dep in critical_deps)
     
     if critical_available and flask_ok:
@@ -168,10 +129,6 @@ if __name__ == "__main__":
         print("✅ All critical dependencies available")
         print("✅ Flask app imports successfully")
         
-        if deps.get('pdfplumber', False) and deps.get('PyMuPDF', False):
-            print("🏆 BONUS: Premium PDF extraction methods available!")
-            print("📧 This should resolve email parsing issues")
-        
     else:
         print("❌ NOT READY - Missing critical dependencies")
         
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Test script for the Supabase retry wrapper used by the cv-parser database writes
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), 'api', 'cv-parser'))
+
+from index import execute_with_retry
+
+class GatewayError(Exception):
+    """Stand-in for a PostgREST error carrying an HTTP status code"""
+    def __init__(self, code):
+        super().__init__(f"Error {code}")
+        self.code = code
+
+class FlakyQuery:
+    """Fake query builder that fails with the given errors before succeeding"""
+    def __init__(self, errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def execute(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return 'ok'
+
+def test_retries_503_until_success():
+    """Two 503s followed by a success return the successful response on the third attempt"""
+    query = FlakyQuery([GatewayError(503), GatewayError(503)])
+
+    result = execute_with_retry(query)
+
+    print(f"🔁 503 x2 then success: {result} after {query.calls} calls")
+    assert result == 'ok'
+    assert query.calls == 3
+    return True
+
+def test_does_not_retry_client_errors():
+    """A non-transient error (e.g. a constraint violation) is raised on the first attempt"""
+    query = FlakyQuery([GatewayError('23505')])
+
+    try:
+        execute_with_retry(query)
+    except GatewayError:
+        pass
+    else:
+        raise AssertionError("constraint violation should not be swallowed")
+
+    print(f"🛑 23505 raised after {query.calls} call")
+    assert query.calls == 1
+    return True
+
+if __name__ == "__main__":
+    success = test_retries_503_until_success()
+    success &= test_does_not_retry_client_errors()
+    print(f"\n{'✅ Test PASSED' if success else '❌ Test FAILED'}")